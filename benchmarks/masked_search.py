@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import random
+from time import perf_counter
+
+from src.core.binary_workbench.masked_search import (
+    MaskedBytePattern,
+    find_masked_bytes_in_data_heap,
+    find_masked_bytes_in_data_regex,
+)
+from src.core.binary_workbench.mips_r3000a.instruction_patterns import (
+    mips_instruction_byte_pattern,
+)
+
+DEFAULT_SIZE_MB = 8
+DEFAULT_REPEATS = 3
+BENCHMARK_QUERIES = ("ADDIU", "LW", "JAL", "BEQ")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare masked search engines.")
+    parser.add_argument("--size-mb", type=int, default=DEFAULT_SIZE_MB)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    args = parser.parse_args()
+    haystack = _haystack(args.size_mb * 1024 * 1024)
+    print(f"haystack: {args.size_mb} MB, repeats: {args.repeats}")
+    print(f"{'pattern':<12}{'matches':>10}{'heap s':>10}{'regex s':>10}{'speedup':>10}")
+    for name, pattern in _patterns():
+        heap_seconds, heap_results = _timed(find_masked_bytes_in_data_heap, haystack, pattern, args.repeats)
+        regex_seconds, regex_results = _timed(find_masked_bytes_in_data_regex, haystack, pattern, args.repeats)
+        if heap_results != regex_results:
+            raise SystemExit(f"engines disagree for {name}")
+        speedup = heap_seconds / regex_seconds if regex_seconds else float("inf")
+        print(f"{name:<12}{len(regex_results):>10}{heap_seconds:>10.3f}{regex_seconds:>10.3f}{speedup:>9.1f}x")
+    return 0
+
+
+def _patterns() -> list[tuple[str, MaskedBytePattern]]:
+    patterns = [(query, mips_instruction_byte_pattern(query)) for query in BENCHMARK_QUERIES]
+    patterns.append(("exact word", MaskedBytePattern(b"\xE8\xFF\xBD\x27", b"\xFF" * 4, 4)))
+    patterns.append(("nibble", MaskedBytePattern(b"\x20\x00", b"\xF0\xFF")))
+    return [(name, pattern) for name, pattern in patterns if pattern is not None]
+
+
+def _haystack(size: int) -> bytes:
+    generator = random.Random(0)
+    return generator.randbytes(size)
+
+
+def _timed(search, haystack: bytes, pattern: MaskedBytePattern, repeats: int) -> tuple[float, list[int]]:
+    best = float("inf")
+    results: list[int] = []
+    for _ in range(max(1, repeats)):
+        started = perf_counter()
+        results = search(haystack, 0, pattern)
+        best = min(best, perf_counter() - started)
+    return best, results
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
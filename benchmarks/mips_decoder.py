@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+import random
+from importlib.util import find_spec
+from time import perf_counter
+
+from src.core.binary_workbench.mips_r3000a import PsxMipsR3000ACodec
+from src.core.binary_workbench.mips_r3000a.disassembler import decode_word, decode_word_uncached
+from src.core.binary_workbench.mips_r3000a.operands import little_endian_words
+
+DEFAULT_SIZE_MB = 2
+DEFAULT_REPEATS = 3
+# nop, jr $ra, addiu $sp, lw/sw $ra and friends dominate real PSX executables.
+COMMON_WORDS = (0x00000000, 0x03E00008, 0x27BDFFE8, 0x27BD0018, 0x8FBF0010, 0xAFBF0010, 0x00000000, 0x24020001)
+COMMON_SHARE = 0.6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare MIPS decoder throughput.")
+    parser.add_argument("--size-mb", type=int, default=DEFAULT_SIZE_MB)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    args = parser.parse_args()
+    data = _code(args.size_mb * 1024 * 1024)
+    words = little_endian_words(data)
+    print(f"code: {args.size_mb} MB ({len(words)} words), repeats: {args.repeats}")
+    print(f"{'decoder':<18}{'seconds':>10}{'words/s':>14}")
+    baseline = _report("table", lambda: [decode_word_uncached(word) for word in words], len(words), args.repeats)
+    decode_word.cache_clear()
+    cached = _report("table + LRU", lambda: [decode_word(word) for word in words], len(words), args.repeats)
+    if baseline != cached:
+        raise SystemExit("cached decoder disagrees with the table decoder")
+    if find_spec("capstone") is not None:
+        codec = PsxMipsR3000ACodec()
+        _report("capstone", lambda: codec.disassemble_many(data, 0), len(words), args.repeats)
+    return 0
+
+
+def _report(name: str, decode, count: int, repeats: int) -> list[str]:
+    best = float("inf")
+    results: list[str] = []
+    for _ in range(max(1, repeats)):
+        started = perf_counter()
+        results = decode()
+        best = min(best, perf_counter() - started)
+    rate = count / best if best else float("inf")
+    print(f"{name:<18}{best:>10.3f}{rate:>14,.0f}")
+    return results
+
+
+def _code(size: int) -> bytes:
+    generator = random.Random(0)
+    words = [
+        generator.choice(COMMON_WORDS) if generator.random() < COMMON_SHARE else generator.getrandbits(32)
+        for _ in range(size // 4)
+    ]
+    return b"".join(word.to_bytes(4, "little") for word in words)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
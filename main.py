@@ -1,4 +1,5 @@
 import sys
+from multiprocessing import freeze_support
 
 from PySide6.QtWidgets import QApplication
 
@@ -15,4 +16,5 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    freeze_support()
     sys.exit(main())
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_CACHE_POLICY_OPTIONS as BLOCK_CACHE_POLICY_NAMES,
+    BINARY_WORKBENCH_LRU_CACHE_POLICY as LRU_BLOCK_CACHE_POLICY,
+    BINARY_WORKBENCH_TWO_QUEUE_CACHE_POLICY as TWO_QUEUE_BLOCK_CACHE_POLICY,
+)
+
+TWO_QUEUE_IN_RATIO = 0.25
+TWO_QUEUE_OUT_RATIO = 0.5
+
+
+@dataclass(frozen=True)
+class BlockCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class BlockEvictionPolicy(ABC):
+    """
+    Storage and eviction order for a bounded block cache.
+
+    ``capacity`` and the ``weight`` passed to ``put`` share one unit: block
+    counts for per-reader caches, bytes for the shared cache. Policies only
+    decide which entries stay resident; hit/miss/eviction counting is done by
+    the cache that owns them.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, capacity)
+        self.weight = 0
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Any | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: Hashable, value: Any, weight: int = 1) -> list[Hashable]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def discard(self, key: Hashable) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def resize(self, capacity: int) -> list[Hashable]:
+        """Changes ``capacity`` in place and returns the keys evicted to fit it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def entries(self) -> list[tuple[Hashable, Any, int]]:
+        """``(key, value, weight)`` of every resident entry, the next to be evicted first."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def keys(self) -> list[Hashable]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __contains__(self, key: Hashable) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class LruBlockPolicy(BlockEvictionPolicy):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, weight: int = 1) -> list[Hashable]:
+        self.discard(key)
+        self._entries[key] = (value, weight)
+        self.weight += weight
+        return self._evict()
+
+    def resize(self, capacity: int) -> list[Hashable]:
+        self.capacity = max(1, capacity)
+        return self._evict()
+
+    def entries(self) -> list[tuple[Hashable, Any, int]]:
+        return [(key, value, weight) for key, (value, weight) in self._entries.items()]
+
+    def discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.weight -= entry[1]
+
+    def keys(self) -> list[Hashable]:
+        return list(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> list[Hashable]:
+        evicted: list[Hashable] = []
+        while self.weight > self.capacity and len(self._entries) > 1:
+            evicted_key, (_, evicted_weight) = self._entries.popitem(last=False)
+            self.weight -= evicted_weight
+            evicted.append(evicted_key)
+        return evicted
+
+
+class TwoQueueBlockPolicy(BlockEvictionPolicy):
+    """
+    Full 2Q: first-time blocks enter a small FIFO (``A1in``) and only move to
+    the main LRU (``Am``) when they are requested again after falling out of
+    it, which is remembered by the key-only ghost queue ``A1out``. A single
+    sequential pass therefore cycles through ``A1in`` without touching the
+    blocks the editor keeps revisiting.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._set_queue_capacities()
+        self._recent: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._recent_weight = 0
+        self._ghosts: OrderedDict[Hashable, int] = OrderedDict()
+        self._ghost_weight = 0
+        self._frequent: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._frequent.get(key)
+        if entry is not None:
+            self._frequent.move_to_end(key)
+            return entry[0]
+        entry = self._recent.get(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, key: Hashable, value: Any, weight: int = 1) -> list[Hashable]:
+        promote = key in self._frequent or key in self._ghosts
+        self.discard(key)
+        evicted: list[Hashable] = []
+        while len(self) and self.weight + weight > self.capacity:
+            evicted.append(self._reclaim())
+        if promote:
+            self._frequent[key] = (value, weight)
+        else:
+            self._recent[key] = (value, weight)
+            self._recent_weight += weight
+        self.weight += weight
+        return evicted
+
+    def resize(self, capacity: int) -> list[Hashable]:
+        self.capacity = max(1, capacity)
+        self._set_queue_capacities()
+        evicted: list[Hashable] = []
+        while len(self) and self.weight > self.capacity:
+            evicted.append(self._reclaim())
+        while self._ghost_weight > self._out_capacity and len(self._ghosts) > 1:
+            self._ghost_weight -= self._ghosts.popitem(last=False)[1]
+        return evicted
+
+    def entries(self) -> list[tuple[Hashable, Any, int]]:
+        return [
+            (key, value, weight)
+            for queue in (self._recent, self._frequent)
+            for key, (value, weight) in queue.items()
+        ]
+
+    def discard(self, key: Hashable) -> None:
+        entry = self._frequent.pop(key, None)
+        if entry is None:
+            entry = self._recent.pop(key, None)
+            if entry is not None:
+                self._recent_weight -= entry[1]
+        if entry is not None:
+            self.weight -= entry[1]
+        self._ghost_weight -= self._ghosts.pop(key, 0)
+
+    def keys(self) -> list[Hashable]:
+        return [*self._recent, *self._frequent]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._frequent or key in self._recent
+
+    def __len__(self) -> int:
+        return len(self._recent) + len(self._frequent)
+
+    def _set_queue_capacities(self) -> None:
+        self._in_capacity = max(1, int(self.capacity * TWO_QUEUE_IN_RATIO))
+        self._out_capacity = max(1, int(self.capacity * TWO_QUEUE_OUT_RATIO))
+
+    def _reclaim(self) -> Hashable:
+        if self._recent and (self._recent_weight > self._in_capacity or not self._frequent):
+            key, (_, weight) = self._recent.popitem(last=False)
+            self._recent_weight -= weight
+            self.weight -= weight
+            self._ghosts[key] = weight
+            self._ghost_weight += weight
+            while self._ghost_weight > self._out_capacity and len(self._ghosts) > 1:
+                self._ghost_weight -= self._ghosts.popitem(last=False)[1]
+            return key
+        key, (_, weight) = self._frequent.popitem(last=False)
+        self.weight -= weight
+        return key
+
+
+def block_eviction_policy(name: str, capacity: int) -> BlockEvictionPolicy:
+    if name == TWO_QUEUE_BLOCK_CACHE_POLICY:
+        return TwoQueueBlockPolicy(capacity)
+    return LruBlockPolicy(capacity)
@@ -1,8 +1,29 @@
 from __future__ import annotations
 
-from collections import OrderedDict
+import mmap
+from collections.abc import Mapping
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from src.core.binary_workbench.block_cache_policies import (
+    BLOCK_CACHE_POLICY_NAMES,
+    LRU_BLOCK_CACHE_POLICY,
+    BlockCacheStats,
+    block_eviction_policy,
+)
+from src.core.binary_workbench.byte_overlay_index import byte_overlay_index
+from src.core.binary_workbench.read_ahead import (
+    InFlightBlockLoads,
+    ReadAheadTracker,
+    read_ahead_executor,
+)
+from src.core.binary_workbench.resource_identity import source_file_identity
+
+if TYPE_CHECKING:
+    from src.core.binary_workbench.shared_block_cache import SharedBlockCache
 
 
 @dataclass(frozen=True)
@@ -14,46 +35,92 @@ class BinaryBlock:
 
 
 class BinaryBlockCache:
-    def __init__(self, max_blocks: int) -> None:
+    def __init__(self, max_blocks: int, policy: str = LRU_BLOCK_CACHE_POLICY) -> None:
         self._max_blocks = max(1, max_blocks)
-        self._blocks: OrderedDict[int, BinaryBlock] = OrderedDict()
+        self.policy_name = policy if policy in BLOCK_CACHE_POLICY_NAMES else LRU_BLOCK_CACHE_POLICY
+        self._blocks = block_eviction_policy(self.policy_name, self._max_blocks)
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def has(self, block_index: int) -> bool:
-        return block_index in self._blocks
+        with self._lock:
+            return block_index in self._blocks
 
     def get(self, block_index: int) -> BinaryBlock | None:
-        block = self._blocks.get(block_index)
-        if block is None:
-            return None
-        self._blocks.move_to_end(block_index)
-        return block
+        with self._lock:
+            block = self._blocks.get(block_index)
+            if block is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return block
 
     def put(self, block: BinaryBlock) -> None:
-        self._blocks[block.block_index] = block
-        self._blocks.move_to_end(block.block_index)
-        while len(self._blocks) > self._max_blocks:
-            self._blocks.popitem(last=False)
+        with self._lock:
+            self._evictions += len(self._blocks.put(block.block_index, block))
+
+    def stats(self) -> BlockCacheStats:
+        return BlockCacheStats(self._hits, self._misses, self._evictions)
+
+    def reset_stats(self) -> None:
+        self._hits = self._misses = self._evictions = 0
 
     def __len__(self) -> int:
-        return len(self._blocks)
+        with self._lock:
+            return len(self._blocks)
 
 
 class CachedBinaryReader:
-    def __init__(self, path: Path, block_size: int, cache_max_blocks: int) -> None:
+    def __init__(
+        self,
+        path: Path,
+        block_size: int,
+        cache_max_blocks: int,
+        memory_mapped: bool = False,
+        cache_policy: str = LRU_BLOCK_CACHE_POLICY,
+        shared_cache: SharedBlockCache | None = None,
+    ) -> None:
         self._path = path
         self.block_size = max(1, block_size)
         self.file_size = path.stat().st_size if path.exists() else 0
-        self.cache = BinaryBlockCache(cache_max_blocks)
-        self._loading_blocks: set[int] = set()
+        self.cache = (
+            BinaryBlockCache(cache_max_blocks, cache_policy)
+            if shared_cache is None
+            else shared_cache.view(source_file_identity(path), self.block_size)
+        )
+        self._loads: InFlightBlockLoads[BinaryBlock] = InFlightBlockLoads()
+        self._read_ahead = ReadAheadTracker(self.block_size)
+        self._mapping = _map_file(path) if memory_mapped and self.file_size > 0 else None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def memory_mapped(self) -> bool:
+        return self._mapping is not None
+
+    def close(self) -> None:
+        mapping, self._mapping = self._mapping, None
+        if mapping is None:
+            return
+        try:
+            mapping.close()
+        except BufferError:
+            pass
 
     def block_index_for_offset(self, offset: int) -> int:
         return max(0, offset) // self.block_size
 
-    def read(self, offset: int, size: int, overlay: dict[int, bytes] | None = None) -> bytes:
+    def read(self, offset: int, size: int, overlay: Mapping[int, bytes] | None = None) -> bytes:
         if size <= 0 or offset >= self.file_size:
             return b""
         start = max(0, offset)
         remaining = min(size, self.file_size - start)
+        if self._mapping is not None:
+            return byte_overlay_index(overlay).apply(start, self._mapping[start : start + remaining])
         chunks: list[bytes] = []
         cursor = start
         while remaining > 0:
@@ -63,33 +130,59 @@ class CachedBinaryReader:
             chunks.append(block.data[within : within + take])
             cursor += take
             remaining -= take
-        return _apply_overlay(start, b"".join(chunks), overlay or {})
+        return byte_overlay_index(overlay).apply(start, b"".join(chunks))
+
+    def read_view(
+        self,
+        offset: int,
+        size: int,
+        overlay: Mapping[int, bytes] | None = None,
+    ) -> memoryview:
+        if self._mapping is None or size <= 0 or offset >= self.file_size:
+            return memoryview(self.read(offset, size, overlay))
+        start = max(0, offset)
+        end = start + min(size, self.file_size - start)
+        overlays = byte_overlay_index(overlay)
+        if overlays.touches(start, end):
+            return memoryview(overlays.apply(start, self._mapping[start:end]))
+        return memoryview(self._mapping)[start:end]
 
-    def read_uncached(self, offset: int, size: int, overlay: dict[int, bytes] | None = None) -> bytes:
+    def read_uncached(self, offset: int, size: int, overlay: Mapping[int, bytes] | None = None) -> bytes:
         if size <= 0 or offset >= self.file_size:
             return b""
         start = max(0, offset)
         read_size = min(size, self.file_size - start)
+        if self._mapping is not None:
+            return byte_overlay_index(overlay).apply(start, self._mapping[start : start + read_size])
         with self._path.open("rb") as source:
             source.seek(start)
             data = source.read(read_size)
-        return _apply_overlay(start, data, overlay or {})
+        return byte_overlay_index(overlay).apply(start, data)
 
-    def prefetch_for_offset(self, offset: int, direction: int) -> None:
-        block_index = self.block_index_for_offset(offset)
-        position = offset % self.block_size
-        half = self.block_size // 2
-        if direction >= 0 and position >= half:
-            self.preload_block(block_index + 1)
-        if direction < 0 and position <= half:
-            self.preload_block(block_index - 1)
+    def prefetch_for_offset(self, offset: int, direction: int) -> list[Future[BinaryBlock]]:
+        if self._mapping is not None:
+            return []
+        futures = (
+            self.preload_block_async(block_index)
+            for block_index in self._read_ahead.blocks_ahead(offset, direction)
+        )
+        return [future for future in futures if future is not None]
 
     def preload_block(self, block_index: int) -> None:
-        if block_index < 0 or self.cache.has(block_index):
-            return
+        if self._needs_block(block_index):
+            self._block(block_index)
+
+    def preload_block_async(self, block_index: int) -> Future[BinaryBlock] | None:
+        if not self._needs_block(block_index):
+            return None
+        return self._loads.submit(read_ahead_executor(), block_index, self._load_block)
+
+    def _needs_block(self, block_index: int) -> bool:
+        if self._mapping is not None or block_index < 0:
+            return False
         if block_index * self.block_size >= self.file_size:
-            return
-        self._block(block_index)
+            return False
+        return not self.cache.has(block_index)
 
     def _block_for_offset(self, offset: int) -> BinaryBlock:
         return self._block(self.block_index_for_offset(offset))
@@ -98,30 +191,21 @@ class CachedBinaryReader:
         cached = self.cache.get(block_index)
         if cached is not None:
             return cached
-        if block_index in self._loading_blocks:
-            return BinaryBlock(block_index, 0, 0, b"")
-        self._loading_blocks.add(block_index)
+        return self._loads.load(block_index, self._load_block)
+
+    def _load_block(self, block_index: int) -> BinaryBlock:
         start = block_index * self.block_size
         with self._path.open("rb") as source:
             source.seek(start)
             data = source.read(self.block_size)
         block = BinaryBlock(block_index, start, start + len(data), data)
         self.cache.put(block)
-        self._loading_blocks.remove(block_index)
         return block
 
 
-def _apply_overlay(start: int, data: bytes, overlay: dict[int, bytes]) -> bytes:
-    if not overlay:
-        return data
-    patched = bytearray(data)
-    end = start + len(data)
-    for patch_offset, patch_data in overlay.items():
-        patch_end = patch_offset + len(patch_data)
-        if patch_end <= start or patch_offset >= end:
-            continue
-        left = max(start, patch_offset)
-        right = min(end, patch_end)
-        source_left = left - patch_offset
-        patched[left - start : right - start] = patch_data[source_left : source_left + (right - left)]
-    return bytes(patched)
+def _map_file(path: Path) -> mmap.mmap | None:
+    try:
+        with path.open("rb") as source:
+            return mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping
+
+HEX_OVERLAY_INDEX_MEMO_SIZE = 16
+
+
+class ByteOverlayIndex(Mapping[int, bytes]):
+    """
+    Byte overlays sorted by start offset.
+
+    Lookups bisect into the start offsets, widened by the longest patch, so
+    a read only visits the patches near the requested range. When patches
+    overlap, the one inserted last wins, matching plain ``dict`` overlays.
+    """
+
+    def __init__(self, overlay: Mapping[int, bytes] | None = None) -> None:
+        self._patches = dict(overlay or {})
+        ordered = sorted(
+            (offset, order, data)
+            for order, (offset, data) in enumerate(self._patches.items())
+        )
+        self._starts = [offset for offset, _, _ in ordered]
+        self._entries = ordered
+        self._max_size = max((len(data) for data in self._patches.values()), default=0)
+        self._overlapping = any(
+            left[0] + len(left[2]) > right[0]
+            for left, right in zip(ordered, ordered[1:])
+        )
+
+    @classmethod
+    def from_hex(cls, values: Mapping[str, str]) -> ByteOverlayIndex:
+        return cls({
+            int(offset, 16): bytes.fromhex(bytes_text.replace(" ", ""))
+            for offset, bytes_text in values.items()
+        })
+
+    def intersecting(self, start: int, end: int) -> list[tuple[int, bytes]]:
+        if not self._entries or start >= end:
+            return []
+        low = bisect_left(self._starts, start - self._max_size + 1)
+        high = bisect_left(self._starts, end, low)
+        hits = [entry for entry in self._entries[low:high] if entry[0] + len(entry[2]) > start]
+        if self._overlapping:
+            hits.sort(key=lambda entry: entry[1])
+        return [(offset, data) for offset, _, data in hits]
+
+    def touches(self, start: int, end: int) -> bool:
+        return bool(self.intersecting(start, end))
+
+    def apply(self, start: int, data: bytes | memoryview) -> bytes:
+        hits = self.intersecting(start, start + len(data))
+        if not hits:
+            return bytes(data)
+        patched = bytearray(data)
+        end = start + len(data)
+        for patch_offset, patch_data in hits:
+            left = max(start, patch_offset)
+            right = min(end, patch_offset + len(patch_data))
+            source_left = left - patch_offset
+            patched[left - start : right - start] = patch_data[source_left : source_left + right - left]
+        return bytes(patched)
+
+    def __getitem__(self, offset: int) -> bytes:
+        return self._patches[offset]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._patches)
+
+    def __len__(self) -> int:
+        return len(self._patches)
+
+
+_EMPTY_INDEX = ByteOverlayIndex()
+_hex_index_memo: dict[tuple[tuple[str, str], ...], ByteOverlayIndex] = {}
+
+
+def byte_overlay_index(overlay: Mapping[int, bytes] | None) -> ByteOverlayIndex:
+    if isinstance(overlay, ByteOverlayIndex):
+        return overlay
+    return ByteOverlayIndex(overlay) if overlay else _EMPTY_INDEX
+
+
+def hex_byte_overlay_index(values: Mapping[str, str]) -> ByteOverlayIndex:
+    """Memoized on a snapshot of the items, so an edited map never returns a stale index."""
+    if not values:
+        return _EMPTY_INDEX
+    key = tuple(values.items())
+    cached = _hex_index_memo.get(key)
+    if cached is not None:
+        return cached
+    index = ByteOverlayIndex.from_hex(values)
+    if len(_hex_index_memo) >= HEX_OVERLAY_INDEX_MEMO_SIZE:
+        _hex_index_memo.pop(next(iter(_hex_index_memo)))
+    _hex_index_memo[key] = index
+    return index
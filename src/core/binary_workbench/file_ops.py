@@ -4,6 +4,7 @@ from pathlib import Path
 from shutil import copyfile
 
 from src.core.binary_workbench.block_reader import CachedBinaryReader
+from src.core.binary_workbench.byte_overlay_index import hex_byte_overlay_index
 from src.core.binary_workbench.mips_r3000a import PsxMipsR3000ACodec
 from src.core.binary_workbench.version_overlays import offset_values
 from src.modules.binary_workbench_dtos import BinaryWorkbenchRowDTO
@@ -73,24 +74,17 @@ def save_binary_as_assembly(
 ) -> None:
     codec = PsxMipsR3000ACodec()
     reader = CachedBinaryReader(source_path, block_size, cache_max_blocks)
-    overlays = _overlay_bytes(byte_overlays)
+    overlays = hex_byte_overlay_index(byte_overlays)
     with _assembly_path(output_path).open("w", encoding="utf-8") as target:
         offset = 0
         while offset < reader.file_size:
             data = reader.read(offset, block_size, overlays)
-            for relative in range(0, len(data), 4):
-                chunk = data[relative : relative + 4].ljust(4, b"\x00")
-                target.write(codec.disassemble(chunk, offset + relative))
+            padded = data.ljust(-(-len(data) // 4) * 4, b"\x00")
+            for instruction in codec.disassemble_many(padded, offset):
+                target.write(instruction)
                 target.write("\n")
             offset += max(1, block_size)
 
 
 def _assembly_path(path: Path) -> Path:
     return path if path.suffix.lower() == ".asm" else path.with_suffix(".asm")
-
-
-def _overlay_bytes(values: dict[str, str]) -> dict[int, bytes]:
-    return {
-        int(offset, 16): bytes.fromhex(bytes_text.replace(" ", ""))
-        for offset, bytes_text in values.items()
-    }
@@ -1,18 +1,58 @@
 from __future__ import annotations
 
-from src.core.binary_workbench.block_reader import BinaryBlock, BinaryBlockCache
+from collections.abc import Mapping
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+from src.core.binary_workbench.block_cache_policies import LRU_BLOCK_CACHE_POLICY
+from src.core.binary_workbench.block_reader import BinaryBlock, BinaryBlockCache, CachedBinaryReader
+from src.core.binary_workbench.byte_overlay_index import byte_overlay_index
 from src.core.binary_workbench.internal_file_region import InternalFileRegion
 from src.core.binary_workbench.internal_offset_mapper import InternalOffsetMapper
+from src.core.binary_workbench.read_ahead import (
+    InFlightBlockLoads,
+    ReadAheadTracker,
+    read_ahead_executor,
+)
+
+if TYPE_CHECKING:
+    from src.core.binary_workbench.sector_map import SectorMapStore
+    from src.core.binary_workbench.shared_block_cache import SharedBlockCache
 
 INTERNAL_FILE_EXPORT_CHUNK_SIZE = 1024 * 1024
 
 
 class InternalFileView:
-    def __init__(self, region: InternalFileRegion, block_size: int, cache_max_blocks: int) -> None:
+    def __init__(
+        self,
+        region: InternalFileRegion,
+        block_size: int,
+        cache_max_blocks: int,
+        cache_policy: str = LRU_BLOCK_CACHE_POLICY,
+        shared_cache: SharedBlockCache | None = None,
+        sector_maps: SectorMapStore | None = None,
+    ) -> None:
         self.region = region
         self.block_size = max(1, block_size)
-        self.mapper = InternalOffsetMapper(region)
-        self.cache = BinaryBlockCache(cache_max_blocks)
+        self.mapper = InternalOffsetMapper(region, sector_maps)
+        self.cache = BinaryBlockCache(cache_max_blocks, cache_policy)
+        self._source_reader: CachedBinaryReader | None = None
+        self._loads: InFlightBlockLoads[BinaryBlock] = InFlightBlockLoads()
+        self._read_ahead = ReadAheadTracker(self.block_size)
+        if shared_cache is not None:
+            # Only the raw source blocks go in the shared cache; internal blocks are reassembled from them.
+            self._source_reader = CachedBinaryReader(
+                region.source_path,
+                self.block_size,
+                cache_max_blocks,
+                shared_cache=shared_cache,
+            )
+            self.cache = self._source_reader.cache
+
+    def close(self) -> None:
+        self.mapper.close()
+        if self._source_reader is not None:
+            self._source_reader.close()
 
     @property
     def file_size(self) -> int:
@@ -28,7 +68,7 @@ class InternalFileView:
         self,
         offset: int,
         size: int,
-        overlay: dict[int, bytes] | None = None,
+        overlay: Mapping[int, bytes] | None = None,
     ) -> bytes:
         if size <= 0 or offset >= self.file_size:
             return b""
@@ -45,43 +85,79 @@ class InternalFileView:
             chunks.append(block.data[within : within + take])
             cursor += take
             remaining -= take
-        return _apply_overlay(start, b"".join(chunks), overlay or {})
+        return byte_overlay_index(overlay).apply(start, b"".join(chunks))
+
+    def read_view(
+        self,
+        offset: int,
+        size: int,
+        overlay: Mapping[int, bytes] | None = None,
+    ) -> memoryview:
+        return memoryview(self.read(offset, size, overlay))
 
     def read_uncached(
         self,
         offset: int,
         size: int,
-        overlay: dict[int, bytes] | None = None,
+        overlay: Mapping[int, bytes] | None = None,
     ) -> bytes:
         data = read_internal_range(self.region, self.mapper, offset, size)
-        return _apply_overlay(max(0, offset), data, overlay or {})
+        return byte_overlay_index(overlay).apply(max(0, offset), data)
 
-    def prefetch_for_offset(self, offset: int, direction: int) -> None:
-        block_index = self.block_index_for_offset(offset)
-        position = offset % self.block_size
-        half = self.block_size // 2
-        if direction >= 0 and position >= half:
-            self.preload_block(block_index + 1)
-        if direction < 0 and position <= half:
-            self.preload_block(block_index - 1)
+    def prefetch_for_offset(self, offset: int, direction: int) -> list[Future[BinaryBlock]]:
+        futures = (
+            self.preload_block_async(block_index)
+            for block_index in self._read_ahead.blocks_ahead(offset, direction)
+        )
+        return [future for future in futures if future is not None]
 
     def preload_block(self, block_index: int) -> None:
-        if block_index < 0 or self.cache.has(block_index):
-            return
-        if block_index * self.block_size >= self.file_size:
-            return
-        self._block(block_index)
+        if self._needs_block(block_index):
+            self._block(block_index)
+
+    def preload_block_async(self, block_index: int) -> Future[BinaryBlock] | None:
+        if not self._needs_block(block_index):
+            return None
+        return self._loads.submit(read_ahead_executor(), block_index, self._load_block)
+
+    def _needs_block(self, block_index: int) -> bool:
+        if block_index < 0 or block_index * self.block_size >= self.file_size:
+            return False
+        if self._source_reader is None:
+            return not self.cache.has(block_index)
+        return not all(self.cache.has(index) for index in self._source_block_indexes(block_index))
 
     def _block(self, block_index: int) -> BinaryBlock:
-        cached = self.cache.get(block_index)
-        if cached is not None:
-            return cached
+        if self._source_reader is None:
+            cached = self.cache.get(block_index)
+            if cached is not None:
+                return cached
+        return self._loads.load(block_index, self._load_block)
+
+    def _load_block(self, block_index: int) -> BinaryBlock:
         start = block_index * self.block_size
-        data = read_internal_range(self.region, self.mapper, start, self.block_size)
+        data = self._read_source_range(start, self.block_size)
         block = BinaryBlock(block_index, start, start + len(data), data)
-        self.cache.put(block)
+        if self._source_reader is None:
+            self.cache.put(block)
         return block
 
+    def _source_block_indexes(self, block_index: int) -> set[int]:
+        indexes: set[int] = set()
+        for chunk in self.mapper.chunks_for_internal_range(block_index * self.block_size, self.block_size):
+            first = chunk.binary_offset // self.block_size
+            last = (chunk.binary_offset + chunk.size - 1) // self.block_size
+            indexes.update(range(first, last + 1))
+        return indexes
+
+    def _read_source_range(self, offset: int, size: int) -> bytes:
+        if self._source_reader is None:
+            return read_internal_range(self.region, self.mapper, offset, size)
+        return b"".join(
+            self._source_reader.read(chunk.binary_offset, chunk.size)
+            for chunk in self.mapper.chunks_for_internal_range(max(0, offset), size)
+        )
+
 
 def read_internal_range(
     region: InternalFileRegion,
@@ -89,34 +165,16 @@ def read_internal_range(
     offset: int,
     size: int,
 ) -> bytes:
-    chunks = mapper.chunks_for_internal_range(max(0, offset), size)
-    data = bytearray()
-    with region.source_path.open("rb") as source:
-        for chunk in chunks:
-            source.seek(chunk.binary_offset)
-            data.extend(source.read(chunk.size))
-    return bytes(data)
+    return mapper.read(max(0, offset), size)
 
 
 def export_internal_file_bytes(region: InternalFileRegion) -> bytes:
-    mapper = InternalOffsetMapper(region)
     data = bytearray()
     offset = 0
-    while True:
-        chunk = read_internal_range(region, mapper, offset, INTERNAL_FILE_EXPORT_CHUNK_SIZE)
-        if not chunk:
-            return bytes(data)
-        data.extend(chunk)
-        offset += len(chunk)
-
-
-def _apply_overlay(start: int, data: bytes, overlay: dict[int, bytes]) -> bytes:
-    patched = bytearray(data)
-    end = start + len(data)
-    for patch_offset, patch_data in overlay.items():
-        left = max(start, patch_offset)
-        right = min(end, patch_offset + len(patch_data))
-        if left < right:
-            source_left = left - patch_offset
-            patched[left - start : right - start] = patch_data[source_left : source_left + right - left]
-    return bytes(patched)
+    with InternalOffsetMapper(region) as mapper:
+        while True:
+            chunk = read_internal_range(region, mapper, offset, INTERNAL_FILE_EXPORT_CHUNK_SIZE)
+            if not chunk:
+                return bytes(data)
+            data.extend(chunk)
+            offset += len(chunk)
@@ -5,6 +5,9 @@ from pathlib import Path
 
 from src.modules.binary_workbench_dtos import BinaryWorkbenchInternalFileDTO
 
+# Directory records count every sector of a file as one 2048-byte logical block.
+ISO9660_BLOCK_SIZE = 2048
+
 
 @dataclass(frozen=True)
 class InternalFileRegion:
@@ -12,6 +15,7 @@ class InternalFileRegion:
     start_lba: int
     end_lba: int
     sector_size: int
+    size: int = 0
 
     @property
     def sector_count(self) -> int:
@@ -19,6 +23,8 @@ class InternalFileRegion:
 
     @property
     def approximate_size(self) -> int:
+        if self.size:
+            return self.size
         useful_size = 2048 if self.sector_size == 2352 else self.sector_size
         return self.sector_count * max(0, useful_size)
 
@@ -41,5 +47,7 @@ def define_internal_file_region(
         available_sectors,
     )
     start_lba = min(max(0, target.start_lba), available_sectors)
+    if target.size > 0:
+        next_lba = start_lba + -(-target.size // ISO9660_BLOCK_SIZE)
     end_lba = min(max(start_lba, next_lba), available_sectors)
-    return InternalFileRegion(source_path, start_lba, end_lba, size)
+    return InternalFileRegion(source_path, start_lba, end_lba, size, max(0, target.size))
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
+from contextlib import suppress
 from dataclasses import dataclass
+from threading import RLock
+from typing import BinaryIO
 
 from src.core.binary_workbench.internal_file_region import InternalFileRegion
 from src.core.binary_workbench.psx_sector_layout import (
     SECTOR_LAYOUT_PREFIX_SIZE,
-    PsxSectorLayout,
     sector_layout,
 )
+from src.core.binary_workbench.sector_map import SectorMap, SectorMapStore
 
 
 @dataclass(frozen=True)
@@ -18,37 +23,53 @@ class InternalToBinaryChunk:
     sector_index: int
 
 
-@dataclass(frozen=True)
-class _SectorSpan:
-    internal_start: int
-    binary_start: int
-    data_size: int
-    sector_index: int
-    layout: PsxSectorLayout
-
-    @property
-    def internal_end(self) -> int:
-        return self.internal_start + self.data_size
+class InternalOffsetMapper:
+    """
+    Maps internal-file offsets to raw image offsets, one user-data span per sector.
 
+    Spans are discovered lazily and stored as parallel ``array('q')`` columns
+    so lookups bisect instead of scanning. The source image stays open until
+    ``close`` so random access does not reopen it per lookup. With a
+    ``SectorMapStore`` the columns of a fully scanned region are saved once
+    and restored on later opens, making sizes exact from the start.
+    """
 
-class InternalOffsetMapper:
-    def __init__(self, region: InternalFileRegion) -> None:
+    def __init__(self, region: InternalFileRegion, sector_maps: SectorMapStore | None = None) -> None:
         self.region = region
-        self._spans: list[_SectorSpan] = []
+        self._internal_starts = array("q")
+        self._binary_starts = array("q")
+        self._data_sizes = array("q")
+        self._logical_size = 0
+        self._lock = RLock()
+        self._source: BinaryIO | None = None
+        self._sector_maps = sector_maps
         self._complete = region.sector_count == 0
         self._source_size = region.source_path.stat().st_size if region.source_path.exists() else 0
+        if sector_maps is not None and not self._complete:
+            self._restore(sector_maps.load(region))
+
+    def __enter__(self) -> InternalOffsetMapper:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            source, self._source = self._source, None
+            if source is not None:
+                source.close()
 
     @property
     def estimated_size(self) -> int:
         if self._complete:
             return self.logical_size
-        first = self._ensure_sector(0)
-        size = first.data_size if first is not None else 0
+        size = self._data_sizes[0] if self._ensure_sector(0) is not None else 0
         return self.region.sector_count * size
 
     @property
     def logical_size(self) -> int:
-        return self._spans[-1].internal_end if self._spans else 0
+        return self._logical_size
 
     @property
     def complete(self) -> bool:
@@ -56,7 +77,7 @@ class InternalOffsetMapper:
 
     @property
     def cached_sector_count(self) -> int:
-        return len(self._spans)
+        return len(self._internal_starts)
 
     def binary_offset_for_internal(self, internal_offset: int) -> int | None:
         chunks = self.chunks_for_internal_range(internal_offset, 1)
@@ -72,21 +93,35 @@ class InternalOffsetMapper:
         chunks: list[InternalToBinaryChunk] = []
         cursor = internal_offset
         remaining = size
-        span = self._span_for_internal_offset(cursor)
-        while span is not None and remaining > 0:
-            relative = cursor - span.internal_start
-            take = min(remaining, span.data_size - relative)
-            chunks.append(InternalToBinaryChunk(
-                internal_offset=cursor,
-                binary_offset=span.binary_start + relative,
-                size=take,
-                sector_index=span.sector_index,
-            ))
-            cursor += take
-            remaining -= take
-            span = self._span_for_internal_offset(cursor) if remaining else None
+        with self._lock:
+            index = self._span_for_internal_offset(cursor)
+            while index is not None and remaining > 0:
+                relative = cursor - self._internal_starts[index]
+                take = min(remaining, self._data_sizes[index] - relative)
+                chunks.append(InternalToBinaryChunk(
+                    internal_offset=cursor,
+                    binary_offset=self._binary_starts[index] + relative,
+                    size=take,
+                    sector_index=self.region.start_lba + index,
+                ))
+                cursor += take
+                remaining -= take
+                index = self._span_for_internal_offset(cursor) if remaining else None
         return chunks
 
+    def read(self, internal_offset: int, size: int) -> bytes:
+        """Internal bytes at ``internal_offset`` read through the mapper's open source handle."""
+        with self._lock:
+            chunks = self.chunks_for_internal_range(internal_offset, size)
+            if not chunks:
+                return b""
+            source = self._source_handle()
+            data = bytearray()
+            for chunk in chunks:
+                source.seek(chunk.binary_offset)
+                data.extend(source.read(chunk.size))
+            return bytes(data)
+
     def chunks_for_binary_range(
         self,
         binary_offset: int,
@@ -105,61 +140,100 @@ class InternalOffsetMapper:
         )
         chunks: list[InternalToBinaryChunk] = []
         for relative_sector in range(first_sector, last_sector + 1):
-            span = self._ensure_sector(relative_sector)
-            if span is None:
+            if self._ensure_sector(relative_sector) is None:
                 break
-            left = max(binary_offset, span.binary_start)
-            right = min(binary_end, span.binary_start + span.data_size)
+            binary_start = self._binary_starts[relative_sector]
+            left = max(binary_offset, binary_start)
+            right = min(binary_end, binary_start + self._data_sizes[relative_sector])
             if left >= right:
                 continue
             chunks.append(InternalToBinaryChunk(
-                internal_offset=span.internal_start + (left - span.binary_start),
+                internal_offset=self._internal_starts[relative_sector] + (left - binary_start),
                 binary_offset=left,
                 size=right - left,
-                sector_index=span.sector_index,
+                sector_index=self.region.start_lba + relative_sector,
             ))
         return chunks
 
-    def _span_for_internal_offset(self, offset: int) -> _SectorSpan | None:
-        for span in self._spans:
-            if span.internal_start <= offset < span.internal_end:
-                return span
-        with self.region.source_path.open("rb") as source:
-            while not self._complete and (not self._spans or offset >= self._spans[-1].internal_end):
-                if self._append_next_sector(source) is None:
+    def sector_chunks(self, source=None) -> list[InternalToBinaryChunk]:
+        """User-data span of every sector in internal order; ``source`` may be an open image or mmap."""
+        with self._lock:
+            if not self._complete:
+                self._load_remaining_sectors(self._source_handle() if source is None else source)
+            first_lba = self.region.start_lba
+            return [
+                InternalToBinaryChunk(internal_start, binary_start, data_size, first_lba + index)
+                for index, (internal_start, binary_start, data_size) in enumerate(
+                    zip(self._internal_starts, self._binary_starts, self._data_sizes)
+                )
+            ]
+
+    def _load_remaining_sectors(self, source) -> None:
+        while not self._complete:
+            if self._append_next_sector(source) is None:
+                break
+
+    def _span_for_internal_offset(self, offset: int) -> int | None:
+        with self._lock:
+            if offset < self._logical_size:
+                index = bisect_right(self._internal_starts, offset) - 1
+                return index if offset < self._internal_starts[index] + self._data_sizes[index] else None
+            while not self._complete:
+                index = self._append_next_sector(self._source_handle())
+                if index is None:
                     break
-                if offset < self._spans[-1].internal_end:
-                    return self._spans[-1]
-        return None
-
-    def _ensure_sector(self, relative_sector: int) -> _SectorSpan | None:
-        with self.region.source_path.open("rb") as source:
-            while len(self._spans) <= relative_sector and not self._complete:
-                if self._append_next_sector(source) is None:
+                if offset < self._logical_size:
+                    return index
+            return None
+
+    def _ensure_sector(self, relative_sector: int) -> int | None:
+        with self._lock:
+            while len(self._internal_starts) <= relative_sector and not self._complete:
+                if self._append_next_sector(self._source_handle()) is None:
                     break
-        return self._spans[relative_sector] if relative_sector < len(self._spans) else None
+            return relative_sector if relative_sector < len(self._internal_starts) else None
 
-    def _append_next_sector(self, source) -> _SectorSpan | None:
-        relative_sector = len(self._spans)
+    def _source_handle(self) -> BinaryIO:
+        if self._source is None:
+            self._source = self.region.source_path.open("rb")
+        return self._source
+
+    def _append_next_sector(self, source) -> int | None:
+        relative_sector = len(self._internal_starts)
         if relative_sector >= self.region.sector_count:
             self._complete = True
             return None
-        sector_index = self.region.start_lba + relative_sector
-        sector_start = sector_index * self.region.sector_size
+        sector_start = (self.region.start_lba + relative_sector) * self.region.sector_size
         available = min(self.region.sector_size, max(0, self._source_size - sector_start))
         source.seek(sector_start)
         prefix = source.read(min(SECTOR_LAYOUT_PREFIX_SIZE, available))
         layout = sector_layout(prefix, self.region.sector_size, available)
         data_size = min(layout.data_size, max(0, available - layout.data_offset))
-        internal_start = self._spans[-1].internal_end if self._spans else 0
-        span = _SectorSpan(
-            internal_start,
-            sector_start + layout.data_offset,
-            data_size,
-            sector_index,
-            layout,
-        )
-        self._spans.append(span)
-        if len(self._spans) >= self.region.sector_count:
+        if self.region.size and layout.form != 2:
+            data_size = min(data_size, max(0, self.region.size - self._logical_size))
+        self._internal_starts.append(self._logical_size)
+        self._binary_starts.append(sector_start + layout.data_offset)
+        self._data_sizes.append(data_size)
+        self._logical_size += data_size
+        if len(self._internal_starts) >= self.region.sector_count:
             self._complete = True
-        return span
+            self._persist()
+        return relative_sector
+
+    def _restore(self, sector_map: SectorMap | None) -> None:
+        if sector_map is None:
+            return
+        self._internal_starts = sector_map.internal_starts
+        self._binary_starts = sector_map.binary_starts
+        self._data_sizes = sector_map.data_sizes
+        self._logical_size = sector_map.logical_size
+        self._complete = True
+
+    def _persist(self) -> None:
+        if self._sector_maps is None:
+            return
+        with suppress(OSError, ValueError):
+            self._sector_maps.save(
+                self.region,
+                SectorMap(self._internal_starts, self._binary_starts, self._data_sizes),
+            )
@@ -6,7 +6,7 @@ from shutil import copyfile
 from src.core.binary_workbench.internal_file_patch import InternalFilePatch
 from src.core.binary_workbench.internal_file_region import InternalFileRegion
 from src.core.binary_workbench.internal_offset_mapper import InternalOffsetMapper
-from src.core.binary_workbench.psx_sector_io import RAW_SECTOR_SIZE, rebuild_psx_sector
+from src.core.binary_workbench.psx_sector_io import RAW_SECTOR_SIZE, rebuild_psx_sectors
 
 
 def save_internal_versioned_binary(
@@ -16,9 +16,8 @@ def save_internal_versioned_binary(
 ) -> None:
     if not _same_file(region.source_path, output_path):
         copyfile(region.source_path, output_path)
-    mapper = InternalOffsetMapper(region)
     affected: set[int] = set()
-    with output_path.open("r+b") as target:
+    with InternalOffsetMapper(region) as mapper, output_path.open("r+b") as target:
         for patch in patches:
             for chunk in mapper.chunks_for_internal_range(
                 patch.internal_offset,
@@ -29,16 +28,26 @@ def save_internal_versioned_binary(
                 target.write(patch.modified_bytes[patch_start : patch_start + chunk.size])
                 affected.add(chunk.sector_index)
         if region.sector_size == RAW_SECTOR_SIZE:
-            for sector_index in sorted(affected):
-                _rebuild_sector_at(target, sector_index)
+            for first, count in _sector_runs(sorted(affected)):
+                _rebuild_sectors_at(target, first, count)
 
 
-def _rebuild_sector_at(target, sector_index: int) -> None:
-    offset = sector_index * RAW_SECTOR_SIZE
+def _sector_runs(sector_indexes: list[int]) -> list[tuple[int, int]]:
+    runs: list[tuple[int, int]] = []
+    for sector_index in sector_indexes:
+        if runs and runs[-1][0] + runs[-1][1] == sector_index:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((sector_index, 1))
+    return runs
+
+
+def _rebuild_sectors_at(target, first: int, count: int) -> None:
+    offset = first * RAW_SECTOR_SIZE
     target.seek(offset)
-    sector = target.read(RAW_SECTOR_SIZE)
-    rebuilt = rebuild_psx_sector(sector, sector_index)
-    if rebuilt != sector:
+    sectors = target.read(count * RAW_SECTOR_SIZE)
+    rebuilt = rebuild_psx_sectors(sectors, first)
+    if rebuilt != sectors:
         target.seek(offset)
         target.write(rebuilt)
 
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from pathlib import Path
+from typing import BinaryIO
+
+from src.core.binary_workbench.internal_file_region import ISO9660_BLOCK_SIZE
+from src.core.binary_workbench.psx_sector_layout import sector_layout
+from src.modules.binary_workbench_dtos import BinaryWorkbenchInternalFileDTO
+
+ISO9660_FIRST_DESCRIPTOR_LBA = 16
+ISO9660_DESCRIPTOR_LIMIT = 32
+ISO9660_STANDARD_ID = b"CD001"
+ISO9660_PRIMARY_DESCRIPTOR = 1
+ISO9660_TERMINATOR = 255
+ISO9660_DIRECTORY_FLAG = 0x02
+ISO9660_MULTI_EXTENT_FLAG = 0x80
+INTERNAL_FILE_NAME_INVALID = re.compile(r"[^A-Za-z0-9_.]")
+
+
+def read_iso9660_files(source_path: Path, sector_size: int) -> list[BinaryWorkbenchInternalFileDTO]:
+    """
+    Every file of an ISO9660 image with its exact start LBA and byte size, in LBA order.
+
+    Only the volume descriptors, the little-endian path table and the
+    directory extents are read. Raw 2352-byte Mode 1 and Mode 2 (XA) sectors
+    are unwrapped through ``sector_layout``. Returns ``[]`` for images that
+    have no primary volume descriptor.
+    """
+    try:
+        with open(source_path, "rb") as source:
+            reader = _SectorReader(source, sector_size)
+            descriptor = _primary_descriptor(reader)
+            if descriptor is None:
+                return []
+            files = _files(reader, _directories(reader, descriptor))
+    except OSError:
+        return []
+    return _named(sorted(files, key=lambda item: (item[1], item[0])))
+
+
+class _SectorReader:
+    def __init__(self, source: BinaryIO, sector_size: int) -> None:
+        self._source = source
+        self._sector_size = max(1, sector_size)
+
+    def block(self, lba: int) -> bytes:
+        self._source.seek(lba * self._sector_size)
+        sector = self._source.read(self._sector_size)
+        layout = sector_layout(sector, self._sector_size, len(sector))
+        return sector[layout.data_offset:layout.data_offset + ISO9660_BLOCK_SIZE]
+
+    def extent(self, lba: int, size: int) -> bytes:
+        count = max(1, -(-size // ISO9660_BLOCK_SIZE))
+        return b"".join(self.block(lba + index) for index in range(count))[:size]
+
+
+def _primary_descriptor(reader: _SectorReader) -> bytes | None:
+    for lba in range(ISO9660_FIRST_DESCRIPTOR_LBA, ISO9660_FIRST_DESCRIPTOR_LBA + ISO9660_DESCRIPTOR_LIMIT):
+        block = reader.block(lba)
+        if len(block) < ISO9660_BLOCK_SIZE or block[1:6] != ISO9660_STANDARD_ID:
+            return None
+        if block[0] == ISO9660_PRIMARY_DESCRIPTOR:
+            return block
+        if block[0] == ISO9660_TERMINATOR:
+            return None
+    return None
+
+
+def _directories(reader: _SectorReader, descriptor: bytes) -> list[tuple[str, int]]:
+    """Path and extent LBA of every directory, from the little-endian path table."""
+    table = reader.extent(_u32(descriptor, 140), _u32(descriptor, 132))
+    directories: list[tuple[str, int]] = []
+    position = 0
+    while position + 8 <= len(table):
+        name_size = table[position]
+        if name_size == 0:
+            break
+        lba = _u32(table, position + 2)
+        parent = int.from_bytes(table[position + 6:position + 8], "little")
+        name = table[position + 8:position + 8 + name_size].decode("ascii", "replace")
+        if not directories:
+            directories.append(("", lba))
+        else:
+            parent_path = directories[parent - 1][0] if 0 < parent <= len(directories) else ""
+            directories.append((f"{parent_path}/{name}" if parent_path else name, lba))
+        position += 8 + name_size + (name_size & 1)
+    return directories
+
+
+def _files(reader: _SectorReader, directories: list[tuple[str, int]]) -> list[tuple[str, int, int]]:
+    files: list[tuple[str, int, int]] = []
+    for directory, lba in directories:
+        first = reader.block(lba)
+        if len(first) < 34 or first[0] < 34:
+            continue
+        extent_size = _u32(first, 10)
+        if extent_size > ISO9660_BLOCK_SIZE:
+            first += reader.extent(lba + 1, extent_size - ISO9660_BLOCK_SIZE)
+        continuing = False
+        for name, file_lba, size, flags in _records(first):
+            if flags & ISO9660_DIRECTORY_FLAG:
+                continue
+            path = f"{directory}/{name}" if directory else name
+            if continuing and files and files[-1][0] == path:
+                files[-1] = (path, files[-1][1], files[-1][2] + size)
+            else:
+                files.append((path, file_lba, size))
+            continuing = bool(flags & ISO9660_MULTI_EXTENT_FLAG)
+    return files
+
+
+def _records(extent: bytes):
+    """Directory records of one extent; records never cross a 2048-byte block."""
+    position = 0
+    while position < len(extent):
+        length = extent[position]
+        if length == 0:
+            position = (position // ISO9660_BLOCK_SIZE + 1) * ISO9660_BLOCK_SIZE
+            continue
+        record = extent[position:position + length]
+        position += length
+        if len(record) < 34:
+            break
+        name = record[33:33 + record[32]]
+        if name in {b"\x00", b"\x01"}:
+            continue
+        text = name.decode("ascii", "replace").split(";", 1)[0].rstrip(".")
+        yield text, _u32(record, 2), _u32(record, 10), record[25]
+
+
+def _named(files: list[tuple[str, int, int]]) -> list[BinaryWorkbenchInternalFileDTO]:
+    """
+    Internal file names are plain identifiers; directories are joined with ``_`` only when base names collide.
+
+    A joined name can still meet an existing one (root ``A_B`` and ``A/B``), so
+    repeats of a final name get a ``_2``, ``_3``... suffix in LBA order.
+    """
+    base_names = [_internal_file_name(path.rsplit("/", 1)[-1]) for path, _, _ in files]
+    counts = Counter(base_names)
+    used: set[str] = set()
+    next_suffix: dict[str, int] = {}
+    named: list[BinaryWorkbenchInternalFileDTO] = []
+    for (path, lba, size), name in zip(files, base_names):
+        wanted = _internal_file_name(path.replace("/", "_")) if counts[name] > 1 else name
+        final = wanted
+        while final in used:
+            next_suffix[wanted] = next_suffix.get(wanted, 1) + 1
+            final = f"{wanted}_{next_suffix[wanted]}"
+        used.add(final)
+        named.append(BinaryWorkbenchInternalFileDTO(final, lba, size))
+    return named
+
+
+def _internal_file_name(text: str) -> str:
+    name = INTERNAL_FILE_NAME_INVALID.sub("_", text)
+    return name if name and not name[0].isdigit() and name[0] != "." else f"_{name}"
+
+
+def _u32(data: bytes, offset: int) -> int:
+    return int.from_bytes(data[offset:offset + 4], "little")
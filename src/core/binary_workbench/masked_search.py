@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from heapq import heappop, heappush
 
+MASKED_PATTERN_CACHE_SIZE = 256
+# Anchor bytes with at most this many candidate values are found with ``bytes.find`` instead of a regex scan.
+MASKED_SPARSE_ANCHOR_VALUES = 16
+
 
 @dataclass(frozen=True)
 class MaskedBytePattern:
@@ -19,17 +25,163 @@ def find_masked_bytes_in_data(
     end_offset: int | None = None,
     max_results: int | None = None,
 ) -> list[int]:
-    if not pattern.needle or len(pattern.needle) != len(pattern.mask):
+    bounds = _search_bounds(data, base_offset, pattern, start_offset, end_offset)
+    if bounds is None:
+        return []
+    left, right, anchor = bounds
+    if b"\xFF" not in pattern.mask and 256 >> _bit_count(pattern.mask[anchor]) <= MASKED_SPARSE_ANCHOR_VALUES:
+        return _anchored_masked_matches(data[left:right], base_offset + left, pattern, anchor, max_results)
+    return find_masked_bytes_in_data_regex(data, base_offset, pattern, start_offset, end_offset, max_results)
+
+
+def find_masked_bytes_in_data_heap(
+    data: bytes,
+    base_offset: int,
+    pattern: MaskedBytePattern,
+    start_offset: int | None = None,
+    end_offset: int | None = None,
+    max_results: int | None = None,
+) -> list[int]:
+    bounds = _search_bounds(data, base_offset, pattern, start_offset, end_offset)
+    if bounds is None:
+        return []
+    left, right, anchor = bounds
+    return _anchored_masked_matches(data[left:right], base_offset + left, pattern, anchor, max_results)
+
+
+def find_masked_bytes_in_data_regex(
+    data: bytes,
+    base_offset: int,
+    pattern: MaskedBytePattern,
+    start_offset: int | None = None,
+    end_offset: int | None = None,
+    max_results: int | None = None,
+) -> list[int]:
+    bounds = _search_bounds(data, base_offset, pattern, start_offset, end_offset)
+    if bounds is None:
         return []
+    left, right, _ = bounds
+    literal = pattern.mask.find(b"\xFF")
+    if literal >= 0:
+        return _literal_masked_matches(data, left, right, base_offset, pattern, literal, max_results)
+    return _regex_masked_matches(data, left, right, base_offset, pattern, max_results)
+
+
+@lru_cache(maxsize=MASKED_PATTERN_CACHE_SIZE)
+def compile_masked_pattern(pattern: MaskedBytePattern) -> re.Pattern[bytes]:
+    """Unanchored body only; alignment is enforced by the caller so the regex never backtracks over a prefix."""
+    return re.compile(_masked_classes(pattern.needle, pattern.mask), re.DOTALL)
+
+
+@lru_cache(maxsize=MASKED_PATTERN_CACHE_SIZE)
+def _compile_literal_anchor(pattern: MaskedBytePattern, literal: int) -> re.Pattern[bytes]:
+    tail = _masked_classes(pattern.needle[literal + 1 :], pattern.mask[literal + 1 :])
+    body = re.escape(pattern.needle[literal : literal + 1])
+    return re.compile(body + (b"(?=" + tail + b")" if tail else b""), re.DOTALL)
+
+
+def _literal_masked_matches(
+    data: bytes,
+    left: int,
+    right: int,
+    base_offset: int,
+    pattern: MaskedBytePattern,
+    literal: int,
+    max_results: int | None,
+) -> list[int]:
+    compiled = _compile_literal_anchor(pattern, literal)
+    results: list[int] = []
+    for match in compiled.finditer(data, left + literal, right):
+        start = match.start() - literal
+        absolute = base_offset + start
+        if _aligned(absolute, pattern.alignment) and _head_matches(data, start, pattern, literal):
+            results.append(absolute)
+            if max_results is not None and len(results) >= max_results:
+                break
+    return results
+
+
+def _regex_masked_matches(
+    data: bytes,
+    left: int,
+    right: int,
+    base_offset: int,
+    pattern: MaskedBytePattern,
+    max_results: int | None,
+) -> list[int]:
+    compiled = compile_masked_pattern(pattern)
+    step = max(1, pattern.alignment)
+    results: list[int] = []
+    position = left + (-(base_offset + left)) % step
+    while position <= right - len(pattern.needle):
+        match = compiled.search(data, position, right)
+        if match is None:
+            break
+        found = match.start()
+        misalignment = (base_offset + found) % step
+        if misalignment:
+            position = found + step - misalignment
+            continue
+        results.append(base_offset + found)
+        if max_results is not None and len(results) >= max_results:
+            break
+        position = found + step
+    return results
+
+
+def _masked_classes(needle: bytes, mask: bytes) -> bytes:
+    return b"".join(_masked_byte_class(value, byte_mask) for value, byte_mask in zip(needle, mask))
+
+
+def _head_matches(data: bytes, start: int, pattern: MaskedBytePattern, literal: int) -> bool:
+    return all(
+        data[start + index] & pattern.mask[index] == pattern.needle[index] & pattern.mask[index]
+        for index in range(literal)
+    )
+
+
+def _masked_byte_class(value: int, mask: int) -> bytes:
+    if mask == 0xFF:
+        return re.escape(bytes((value,)))
+    if mask == 0:
+        return b"."
+    wanted = value & mask
+    members = [candidate for candidate in range(256) if candidate & mask == wanted]
+    return b"[" + b"".join(_class_range(start, stop) for start, stop in _runs(members)) + b"]"
+
+
+def _runs(values: list[int]) -> list[tuple[int, int]]:
+    runs: list[tuple[int, int]] = []
+    for value in values:
+        if runs and runs[-1][1] == value - 1:
+            runs[-1] = (runs[-1][0], value)
+        else:
+            runs.append((value, value))
+    return runs
+
+
+def _class_range(start: int, stop: int) -> bytes:
+    first = re.escape(bytes((start,)))
+    if start == stop:
+        return first
+    return first + b"-" + re.escape(bytes((stop,)))
+
+
+def _search_bounds(
+    data: bytes,
+    base_offset: int,
+    pattern: MaskedBytePattern,
+    start_offset: int | None,
+    end_offset: int | None,
+) -> tuple[int, int, int] | None:
+    if not pattern.needle or len(pattern.needle) != len(pattern.mask):
+        return None
     left = max(0, (start_offset or 0) - base_offset)
     right = len(data) if end_offset is None else min(len(data), end_offset - base_offset + 1)
     if right < left or (end_offset is not None and start_offset is not None and start_offset > end_offset):
-        return []
-    haystack = data[left:right]
+        return None
     anchor = _anchor_index(pattern.mask)
-    if anchor is None:
-        return []
-    return _anchored_masked_matches(haystack, base_offset + left, pattern, anchor, max_results)
+    return None if anchor is None else (left, right, anchor)
 
 
 def _anchored_masked_matches(
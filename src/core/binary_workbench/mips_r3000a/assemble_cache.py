@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from threading import Lock
+
+from src.core.binary_workbench.block_cache_policies import BlockCacheStats, LruBlockPolicy
+from src.modules.binary_workbench_constants import BINARY_WORKBENCH_MIPS_ASSEMBLE_CACHE_ENTRIES
+
+AssembleCacheKey = tuple[str, int | None]
+
+# Every b*/j* mnemonic Keystone accepts (b, bal, beqz, bgezal, beql, ...) is resolved against the PC,
+# except these register and trap forms.
+ADDRESS_INDEPENDENT_BRANCH_MNEMONICS = frozenset({"break", "jr", "jalr"})
+
+
+def assemble_cache_key(normalized: str, address: int) -> AssembleCacheKey:
+    mnemonic = normalized.split(None, 1)[0].lower() if normalized else ""
+    address_dependent = mnemonic[:1] in {"b", "j"} and mnemonic not in ADDRESS_INDEPENDENT_BRANCH_MNEMONICS
+    return normalized, address if address_dependent else None
+
+
+class AssembleCache:
+    """
+    Bounded LRU of assembled words keyed by normalized instruction text.
+
+    Failed assemblies are cached too: symbolic replacement probes many
+    candidate texts per row and most of them do not assemble.
+    """
+
+    def __init__(self, capacity: int = BINARY_WORKBENCH_MIPS_ASSEMBLE_CACHE_ENTRIES) -> None:
+        self._policy = LruBlockPolicy(capacity)
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: AssembleCacheKey) -> tuple[bytes | None] | None:
+        with self._lock:
+            entry = self._policy.get(key)
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return entry
+
+    def put(self, key: AssembleCacheKey, data: bytes | None) -> bytes | None:
+        with self._lock:
+            self._evictions += len(self._policy.put(key, (data,)))
+        return data
+
+    def stats(self) -> BlockCacheStats:
+        with self._lock:
+            return BlockCacheStats(self._hits, self._misses, self._evictions)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in self._policy.keys():
+                self._policy.discard(key)
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._policy)
+
+
+_SHARED_ASSEMBLE_CACHE = AssembleCache()
+
+
+def shared_assemble_cache() -> AssembleCache:
+    """Process-wide cache; codecs are created per call in many places, and assembly does not depend on the instance."""
+    return _SHARED_ASSEMBLE_CACHE
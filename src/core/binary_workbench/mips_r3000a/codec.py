@@ -1,17 +1,28 @@
 from __future__ import annotations
 
 from importlib import import_module
-
+from threading import Lock
+
+from src.core.binary_workbench.block_cache_policies import BlockCacheStats
+from src.core.binary_workbench.mips_r3000a.assemble_cache import (
+    AssembleCache,
+    AssembleCacheKey,
+    assemble_cache_key,
+    shared_assemble_cache,
+)
 from src.core.binary_workbench.mips_r3000a.assembler import assemble_fallback
 from src.core.binary_workbench.mips_r3000a.constants import BRANCH_OPCODES, SPECIAL_BRANCH_RT
-from src.core.binary_workbench.mips_r3000a.disassembler import disassemble_fallback
+from src.core.binary_workbench.mips_r3000a.disassembler import decode_word, disassemble_fallback
 from src.core.binary_workbench.mips_r3000a.source_line_rows import (
     build_source_line_rows as build_mips_source_line_rows,
     instruction_code as mips_instruction_code,
 )
-from src.core.binary_workbench.mips_r3000a.operands import word_bytes
+from src.core.binary_workbench.mips_r3000a.operands import little_endian_words, word_bytes
 from src.core.binary_workbench.editor.commands.stack_pointer import stack_pointer_command
-from src.modules.binary_workbench_constants import BINARY_WORKBENCH_PSX_MIPS_R3000A_DISPLAY_NAME
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_MIPS_DISASSEMBLY_WINDOW_BYTES,
+    BINARY_WORKBENCH_PSX_MIPS_R3000A_DISPLAY_NAME,
+)
 from src.modules.binary_workbench_dtos import BinaryWorkbenchRowDTO
 from src.modules.contracts import CPUArchCodec
 
@@ -21,9 +32,13 @@ TWO_OPERAND_BRANCH_MNEMONICS = {"blez", "bgtz", *SPECIAL_BRANCH_RT}
 
 
 class PsxMipsR3000ACodec(CPUArchCodec):
-    def __init__(self) -> None:
+    def __init__(self, assemble_cache: AssembleCache | None = None) -> None:
         self._capstone = import_module("capstone") if _module_exists("capstone") else None
         self._keystone = import_module("keystone") if _module_exists("keystone") else None
+        self._disassembler = None
+        self._assembler = None
+        self._engine_lock = Lock()
+        self._assemble_cache = shared_assemble_cache() if assemble_cache is None else assemble_cache
 
     @property
     def display_name(self) -> str:
@@ -39,38 +54,39 @@ class PsxMipsR3000ACodec(CPUArchCodec):
 
     def assemble(self, instruction: str, address: int) -> bytes | None:
         normalized = _strip_comment(instruction).strip()
-        if not normalized:
-            return b"\x00\x00\x00\x00"
-        if normalized.lower() == "nop":
-            return b"\x00\x00\x00\x00"
-        lower = normalized.lower()
-        if lower.startswith(("word 0x", ".word 0x")):
-            try:
-                hex_start = lower.index("0x") + 2
-                return word_bytes(int(normalized[hex_start:], 16))
-            except (ValueError, IndexError):
-                return None
-        if _is_branch_instruction(lower):
-            try:
-                return assemble_fallback(normalized, address)
-            except Exception:
-                return None
-        if self._keystone is not None:
-            try:
-                engine = self._keystone.Ks(
-                    self._keystone.KS_ARCH_MIPS,
-                    self._keystone.KS_MODE_MIPS32 + self._keystone.KS_MODE_LITTLE_ENDIAN,
-                )
-                encoded, _ = engine.asm(normalized, address)
-                data = bytes(encoded[:4])
-                if len(data) == 4:
-                    return data
-            except Exception:
-                pass
-        try:
-            return assemble_fallback(normalized, address)
-        except Exception:
-            return None
+        key = assemble_cache_key(normalized, address)
+        cached = self._assemble_cache.get(key)
+        if cached is not None:
+            return cached[0]
+        if not _needs_engine(normalized):
+            return self._assemble_cache.put(key, _assemble_direct(normalized, address))
+        return self._assemble_cache.put(key, self._assemble_line(normalized, address))
+
+    def assemble_many(self, lines: list[str], address: int) -> list[bytes | None]:
+        normalized = [_strip_comment(line).strip() for line in lines]
+        results: list[bytes | None] = [None] * len(normalized)
+        misses: list[tuple[int, AssembleCacheKey]] = []
+        run: list[int] = []
+        for index, text in enumerate(normalized):
+            key = assemble_cache_key(text, address + index * 4)
+            cached = self._assemble_cache.get(key)
+            if cached is not None:
+                results[index] = cached[0]
+            else:
+                misses.append((index, key))
+                if _needs_engine(text):
+                    run.append(index)
+                    continue
+                results[index] = _assemble_direct(text, address + index * 4)
+            self._assemble_run(normalized, run, address, results)
+            run = []
+        self._assemble_run(normalized, run, address, results)
+        for index, key in misses:
+            self._assemble_cache.put(key, results[index])
+        return results
+
+    def assemble_cache_stats(self) -> BlockCacheStats:
+        return self._assemble_cache.stats()
 
     def disassemble(self, data: bytes, address: int) -> str:
         if len(data) != 4:
@@ -79,17 +95,26 @@ class PsxMipsR3000ACodec(CPUArchCodec):
         if _is_branch_word(word):
             return disassemble_fallback(word, address)
         if self._capstone is not None:
-            engine = self._capstone.Cs(
-                self._capstone.CS_ARCH_MIPS,
-                self._capstone.CS_MODE_MIPS32 + self._capstone.CS_MODE_LITTLE_ENDIAN,
-            )
-            engine.detail = False
-            result = next(engine.disasm(data, address), None)
+            with self._engine_lock:
+                result = next(self._disassembly_engine().disasm_lite(data, address), None)
             if result is not None:
-                operands = f" {result.op_str}" if result.op_str else ""
-                return f"{result.mnemonic}{operands}"
+                return _instruction_text(result[2], result[3])
         return disassemble_fallback(word, address)
 
+    def disassemble_many(self, data: bytes, address: int) -> list[str]:
+        count = len(data) // 4
+        buffer = bytes(data[:count * 4])
+        if self._capstone is None:
+            return [decode_word(word) for word in little_endian_words(buffer)]
+        texts = self._engine_disassembly(buffer, address)
+        results: list[str] = []
+        for index, text in enumerate(texts):
+            word = int.from_bytes(buffer[index * 4:index * 4 + 4], "little")
+            if text is None or _is_branch_word(word):
+                text = disassemble_fallback(word, address + index * 4)
+            results.append(text)
+        return results
+
     def bytes_text(self, data: bytes) -> str:
         return " ".join(f"{value:02X}" for value in data)
 
@@ -155,6 +180,105 @@ class PsxMipsR3000ACodec(CPUArchCodec):
             reject_invalid,
         )
 
+    def _engine_disassembly(self, buffer: bytes, address: int) -> list[str | None]:
+        """Capstone stops at the first word it cannot decode; restarts slice a bounded window, not the whole tail."""
+        texts: list[str | None] = [None] * (len(buffer) // 4)
+        window_words = max(1, BINARY_WORKBENCH_MIPS_DISASSEMBLY_WINDOW_BYTES // 4)
+        position = 0
+        try:
+            with self._engine_lock:
+                engine = self._disassembly_engine()
+                while position < len(texts):
+                    window_end = min(len(texts), position + window_words)
+                    stopped = position
+                    for decoded in engine.disasm_lite(buffer[position * 4:window_end * 4], address + position * 4):
+                        stopped = (decoded[0] - address) // 4
+                        texts[stopped] = _instruction_text(decoded[2], decoded[3])
+                        stopped += 1
+                    position = stopped if stopped == window_end else stopped + 1
+        except Exception:
+            pass
+        return texts
+
+    def _assemble_line(self, normalized: str, address: int) -> bytes | None:
+        if self._keystone is not None:
+            try:
+                with self._engine_lock:
+                    encoded, _ = self._assembly_engine().asm(normalized, address)
+                data = bytes(encoded[:4])
+                if len(data) == 4:
+                    return data
+            except Exception:
+                pass
+        try:
+            return assemble_fallback(normalized, address)
+        except Exception:
+            return None
+
+    def _assemble_run(self, normalized: list[str], run: list[int], address: int, results: list[bytes | None]) -> None:
+        if not run:
+            return
+        if self._keystone is not None and len(run) > 1:
+            try:
+                source = "\n".join(normalized[index] for index in run)
+                with self._engine_lock:
+                    encoded, _ = self._assembly_engine().asm(source, address + run[0] * 4)
+                data = bytes(encoded or b"")
+            except Exception:
+                data = b""
+            if len(data) == len(run) * 4:
+                for position, index in enumerate(run):
+                    results[index] = data[position * 4:position * 4 + 4]
+                return
+        for index in run:
+            results[index] = self._assemble_line(normalized[index], address + index * 4)
+
+    def _disassembly_engine(self):
+        if self._disassembler is None:
+            engine = self._capstone.Cs(
+                self._capstone.CS_ARCH_MIPS,
+                self._capstone.CS_MODE_MIPS32 + self._capstone.CS_MODE_LITTLE_ENDIAN,
+            )
+            engine.detail = False
+            self._disassembler = engine
+        return self._disassembler
+
+    def _assembly_engine(self):
+        if self._assembler is None:
+            self._assembler = self._keystone.Ks(
+                self._keystone.KS_ARCH_MIPS,
+                self._keystone.KS_MODE_MIPS32 + self._keystone.KS_MODE_LITTLE_ENDIAN,
+            )
+        return self._assembler
+
+
+def _needs_engine(normalized: str) -> bool:
+    lower = normalized.lower()
+    if not normalized or lower == "nop" or lower.startswith(("word 0x", ".word 0x")):
+        return False
+    return not _is_branch_instruction(lower)
+
+
+def _assemble_direct(normalized: str, address: int) -> bytes | None:
+    lower = normalized.lower()
+    if not normalized or lower == "nop":
+        return b"\x00\x00\x00\x00"
+    if lower.startswith(("word 0x", ".word 0x")):
+        try:
+            hex_start = lower.index("0x") + 2
+            return word_bytes(int(normalized[hex_start:], 16))
+        except (ValueError, IndexError):
+            return None
+    try:
+        return assemble_fallback(normalized, address)
+    except Exception:
+        return None
+
+
+def _instruction_text(mnemonic: str, op_str: str) -> str:
+    operands = f" {op_str}" if op_str else ""
+    return f"{mnemonic}{operands}"
+
 
 def _navigation_operand_index(mnemonic: str) -> int | None:
     if mnemonic in JUMP_NAVIGATION_MNEMONICS:
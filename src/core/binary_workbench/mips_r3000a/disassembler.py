@@ -1,77 +1,142 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import lru_cache
+
 from src.core.binary_workbench.mips_r3000a.constants import (
     BRANCH_OPCODES,
     I_OPCODES,
+    J_OPCODES,
     REGISTER_NAMES,
     R_FUNCTS,
+    R_JUMP_FUNCTS,
 )
-from src.core.binary_workbench.mips_r3000a.operands import hex_or_signed, signed16
+from src.core.binary_workbench.mips_r3000a.operands import hex_or_signed
+from src.modules.binary_workbench_constants import BINARY_WORKBENCH_MIPS_DECODE_CACHE_WORDS
+
+WordDecoder = Callable[[int], str]
+
+LOAD_STORE_OPCODES = frozenset({0x23, 0x2B, 0x21, 0x25, 0x29, 0x20, 0x24, 0x28})
+REGIMM_OPCODE = 0x01
+SPECIAL_OPCODE = 0x00
+
+_REGISTERS = tuple(f"${REGISTER_NAMES.get(index, 'zero')}" for index in range(32))
+_SIGNED_IMMEDIATES = tuple(hex_or_signed(value - 0x10000 if value & 0x8000 else value) for value in range(0x10000))
 
 
 def disassemble_fallback(word: int, address: int) -> str:
+    # No supported form depends on the address: branches print their raw offset
+    # and jumps their target field, so the cache is keyed by the word alone.
+    return decode_word(word & 0xFFFFFFFF)
+
+
+@lru_cache(maxsize=BINARY_WORKBENCH_MIPS_DECODE_CACHE_WORDS)
+def decode_word(word: int) -> str:
+    return decode_word_uncached(word)
+
+
+def decode_word_uncached(word: int) -> str:
     if word == 0:
         return "nop"
-    opcode = (word >> 26) & 0x3F
-    if opcode in {0x02, 0x03}:
-        mnemonic = "jal" if opcode == 0x03 else "j"
-        return f"{mnemonic} 0x{((word & 0x03FFFFFF) << 2):X}"
-    if opcode == 0x00:
-        rs = (word >> 21) & 0x1F
-        rt = (word >> 16) & 0x1F
-        rd = (word >> 11) & 0x1F
-        funct = word & 0x3F
-        if funct == 0x08:
-            return f"jr ${REGISTER_NAMES.get(rs, 'zero')}"
-        if funct == 0x09:
-            return f"jalr ${REGISTER_NAMES.get(rs, 'zero')}, ${REGISTER_NAMES.get(rd, 'ra')}"
-        mnemonic = _mnemonic_from_funct(funct)
-        if mnemonic is not None:
-            return (
-                f"{mnemonic} ${REGISTER_NAMES.get(rd, 'zero')}, "
-                f"${REGISTER_NAMES.get(rs, 'zero')}, ${REGISTER_NAMES.get(rt, 'zero')}"
-            )
-    if opcode in I_OPCODES.values():
-        return _disassemble_i_type(opcode, word)
-    if opcode in BRANCH_OPCODES.values() or opcode == 0x01:
-        return _disassemble_branch(opcode, word)
+    return _OPCODE_DECODERS[word >> 26](word)
+
+
+def _word(word: int) -> str:
     return f"word 0x{word:08X}"
 
 
-def _disassemble_i_type(opcode: int, word: int) -> str:
-    rs, rt, imm = (word >> 21) & 0x1F, (word >> 16) & 0x1F, signed16(word & 0xFFFF)
-    registers = (REGISTER_NAMES.get(rt, "zero"), REGISTER_NAMES.get(rs, "zero"))
-    if opcode == 0x0F:
-        return f"lui ${registers[0]}, 0x{word & 0xFFFF:04X}"
-    if opcode in {0x23, 0x2B, 0x21, 0x25, 0x29, 0x20, 0x24, 0x28}:
-        return f"{_mnemonic_from_opcode(opcode)} ${registers[0]}, {hex_or_signed(imm)}(${registers[1]})"
-    return f"{_mnemonic_from_opcode(opcode)} ${registers[0]}, ${registers[1]}, {hex_or_signed(imm)}"
+def _jump(mnemonic: str) -> WordDecoder:
+    return lambda word: f"{mnemonic} 0x{((word & 0x03FFFFFF) << 2):X}"
+
+
+def _special(word: int) -> str:
+    return _FUNCT_DECODERS[word & 0x3F](word)
+
+
+def _jr(word: int) -> str:
+    return f"jr {_REGISTERS[(word >> 21) & 0x1F]}"
+
+
+def _jalr(word: int) -> str:
+    return f"jalr {_REGISTERS[(word >> 21) & 0x1F]}, {_REGISTERS[(word >> 11) & 0x1F]}"
+
+
+def _r_type(mnemonic: str) -> WordDecoder:
+    def decode(word: int) -> str:
+        rd, rs, rt = _REGISTERS[(word >> 11) & 0x1F], _REGISTERS[(word >> 21) & 0x1F], _REGISTERS[(word >> 16) & 0x1F]
+        return f"{mnemonic} {rd}, {rs}, {rt}"
+
+    return decode
+
+
+def _lui(word: int) -> str:
+    return f"lui {_REGISTERS[(word >> 16) & 0x1F]}, 0x{word & 0xFFFF:04X}"
+
+
+def _load_store(mnemonic: str) -> WordDecoder:
+    def decode(word: int) -> str:
+        rt, rs = _REGISTERS[(word >> 16) & 0x1F], _REGISTERS[(word >> 21) & 0x1F]
+        return f"{mnemonic} {rt}, {_SIGNED_IMMEDIATES[word & 0xFFFF]}({rs})"
+
+    return decode
+
+
+def _immediate(mnemonic: str) -> WordDecoder:
+    def decode(word: int) -> str:
+        rt, rs = _REGISTERS[(word >> 16) & 0x1F], _REGISTERS[(word >> 21) & 0x1F]
+        return f"{mnemonic} {rt}, {rs}, {_SIGNED_IMMEDIATES[word & 0xFFFF]}"
+
+    return decode
+
+
+def _regimm(word: int) -> str:
+    mnemonic = "bgez" if (word >> 16) & 0x1F == 0x01 else "bltz"
+    return f"{mnemonic} {_REGISTERS[(word >> 21) & 0x1F]}, {_branch_immediate(word)}"
+
+
+def _branch_one(mnemonic: str) -> WordDecoder:
+    return lambda word: f"{mnemonic} {_REGISTERS[(word >> 21) & 0x1F]}, {_branch_immediate(word)}"
+
+
+def _branch_two(mnemonic: str) -> WordDecoder:
+    def decode(word: int) -> str:
+        rs, rt = _REGISTERS[(word >> 21) & 0x1F], _REGISTERS[(word >> 16) & 0x1F]
+        return f"{mnemonic} {rs}, {rt}, {_branch_immediate(word)}"
+
+    return decode
 
 
-def _disassemble_branch(opcode: int, word: int) -> str:
-    rs, rt, imm = (word >> 21) & 0x1F, (word >> 16) & 0x1F, signed16(word & 0xFFFF)
-    immediate = _branch_immediate(imm)
-    if opcode == 0x01:
-        mnemonic = "bgez" if rt == 0x01 else "bltz"
-        return f"{mnemonic} ${REGISTER_NAMES.get(rs, 'zero')}, {immediate}"
-    if opcode in {0x06, 0x07}:
-        return f"{_mnemonic_from_opcode(opcode)} ${REGISTER_NAMES.get(rs, 'zero')}, {immediate}"
-    return (
-        f"{_mnemonic_from_opcode(opcode)} ${REGISTER_NAMES.get(rs, 'zero')}, "
-        f"${REGISTER_NAMES.get(rt, 'zero')}, {immediate}"
-    )
+def _branch_immediate(word: int) -> str:
+    value = word & 0xFFFF
+    return f"-0x{0x10000 - value:X}" if value & 0x8000 else f"0x{value:04X}"
 
 
-def _branch_immediate(value: int) -> str:
-    return f"-0x{abs(value):X}" if value < 0 else f"0x{value:04X}"
+def _opcode_decoders() -> tuple[WordDecoder, ...]:
+    decoders: list[WordDecoder] = [_word] * 64
+    decoders[SPECIAL_OPCODE] = _special
+    decoders[REGIMM_OPCODE] = _regimm
+    for mnemonic, opcode in J_OPCODES.items():
+        decoders[opcode] = _jump(mnemonic)
+    for mnemonic, opcode in I_OPCODES.items():
+        if opcode == 0x0F:
+            decoders[opcode] = _lui
+        elif opcode in LOAD_STORE_OPCODES:
+            decoders[opcode] = _load_store(mnemonic)
+        else:
+            decoders[opcode] = _immediate(mnemonic)
+    for mnemonic, opcode in BRANCH_OPCODES.items():
+        decoders[opcode] = _branch_one(mnemonic) if opcode in {0x06, 0x07} else _branch_two(mnemonic)
+    return tuple(decoders)
 
 
-def _mnemonic_from_opcode(opcode: int) -> str:
-    mapping = {value: key for key, value in I_OPCODES.items()}
-    mapping.update({value: key for key, value in BRANCH_OPCODES.items()})
-    return mapping.get(opcode, "word")
+def _funct_decoders() -> tuple[WordDecoder, ...]:
+    decoders: list[WordDecoder] = [_word] * 64
+    for mnemonic, funct in R_FUNCTS.items():
+        decoders[funct] = _r_type(mnemonic)
+    decoders[R_JUMP_FUNCTS["jr"]] = _jr
+    decoders[R_JUMP_FUNCTS["jalr"]] = _jalr
+    return tuple(decoders)
 
 
-def _mnemonic_from_funct(funct: int) -> str | None:
-    mapping = {value: key for key, value in R_FUNCTS.items()}
-    return mapping.get(funct)
+_OPCODE_DECODERS = _opcode_decoders()
+_FUNCT_DECODERS = _funct_decoders()
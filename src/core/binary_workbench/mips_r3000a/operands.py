@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import sys
+from array import array
+
 from src.core.binary_workbench.mips_r3000a.constants import REGISTERS
 
 
@@ -7,6 +10,13 @@ def word_bytes(word: int) -> bytes:
     return (word & 0xFFFFFFFF).to_bytes(4, "little")
 
 
+def little_endian_words(data: bytes) -> array:
+    words = array("I", data[:len(data) - len(data) % 4])
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words
+
+
 def register(token: str) -> int:
     return REGISTERS[token.lstrip("$").lower()]
 
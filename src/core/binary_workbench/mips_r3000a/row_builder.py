@@ -11,22 +11,27 @@ from src.core.binary_workbench.mips_r3000a.source_line_rows import (
     offset_values,
 )
 
+# One long-lived codec keeps its Capstone/Keystone engines across row windows; it serializes engine use itself.
+_CODEC = PsxMipsR3000ACodec()
+
+
 def build_rows_from_bytes(
-    data: bytes,
+    data: bytes | memoryview,
     offset_names: list[str],
     start_offset: int = 0,
     offset_bases: dict[str, str] | None = None,
 ) -> list[BinaryWorkbenchRowDTO]:
-    codec = PsxMipsR3000ACodec()
+    codec = _CODEC
+    padded = bytes(data).ljust(-(-len(data) // _ROW_BYTES) * _ROW_BYTES, b"\x00")
+    instructions = codec.disassemble_many(padded, start_offset)
     rows: list[BinaryWorkbenchRowDTO] = []
-    for relative in range(0, len(data), _ROW_BYTES):
+    for index, relative in enumerate(range(0, len(padded), _ROW_BYTES)):
         offset = start_offset + relative
-        chunk = data[relative : relative + _ROW_BYTES].ljust(_ROW_BYTES, b"\x00")
         rows.append(
             BinaryWorkbenchRowDTO(
                 offsets=offset_values(offset, offset_names, offset_bases or {}),
-                instruction=editor_mips_instruction(codec.disassemble(chunk, offset), offset),
-                bytes_text=codec.bytes_text(chunk),
+                instruction=editor_mips_instruction(instructions[index], offset),
+                bytes_text=codec.bytes_text(padded[relative : relative + _ROW_BYTES]),
             )
         )
     return rows
@@ -39,7 +44,7 @@ def build_rows_from_instructions(
     variables: dict[str, str] | None = None,
     equates: dict[str, str] | None = None,
 ) -> list[BinaryWorkbenchRowDTO]:
-    codec = PsxMipsR3000ACodec()
+    codec = _CODEC
     rows = build_source_line_rows(
         lines,
         offset_names,
@@ -52,7 +57,7 @@ def build_rows_from_instructions(
 
 
 def extract_labels_from_instructions(lines: list[str]) -> dict[str, str]:
-    codec = PsxMipsR3000ACodec()
+    codec = _CODEC
     rows = build_source_line_rows(lines, ["File"], {}, codec)
     return labels_from_source_rows(rows or [], word_size=codec.word_size)
 
@@ -62,7 +67,7 @@ def build_scratch_rows(
     offset_bases: dict[str, str] | None = None,
     count: int = 8,
 ) -> list[BinaryWorkbenchRowDTO]:
-    codec = PsxMipsR3000ACodec()
+    codec = _CODEC
     zero = b"\x00\x00\x00\x00"
     return [
         BinaryWorkbenchRowDTO(
@@ -3,6 +3,7 @@ from __future__ import annotations
 from src.modules.binary_workbench_constants import (
     BINARY_WORKBENCH_EMPTY_OFFSET as EMPTY_OFFSET,
     BINARY_WORKBENCH_ROW_BYTES as ROW_BYTES,
+    BINARY_WORKBENCH_SOURCE_ASSEMBLY_BATCH_LINES as SOURCE_ASSEMBLY_BATCH_LINES,
 )
 from src.modules.contracts import CPUArchCodec
 from src.modules.binary_workbench_dtos import BinaryWorkbenchRowDTO
@@ -73,29 +74,57 @@ def _build_rows(
 ) -> list[BinaryWorkbenchRowDTO] | None:
     rows: list[BinaryWorkbenchRowDTO] = []
     offset = start_offset
-    for line in lines:
-        code = instruction_code(line)
-        if not code:
-            rows.append(empty_source_row(line, offset_names))
-            continue
-        raw_instruction = raw_mips_instruction(line, offset, labels, variables, equates)
-        data = codec.assemble(raw_instruction, offset) if raw_instruction else None
-        if data is None:
-            if reject_invalid:
-                return None
-            rows.append(empty_source_row(line, offset_names))
-            continue
-        rows.append(
-            BinaryWorkbenchRowDTO(
-                offsets=offset_values(offset, offset_names, offset_bases),
-                instruction=line.rstrip(),
-                bytes_text=codec.bytes_text(data),
+    index = 0
+    while index < len(lines):
+        batch = _speculative_batch(lines, index, offset, codec.word_size, labels, variables, equates)
+        results = iter(codec.assemble_many([raw for _, raw in batch if raw], offset))
+        index = batch[-1][0] + 1
+        for line_index, raw_instruction in batch:
+            line = lines[line_index]
+            if raw_instruction is None:
+                rows.append(empty_source_row(line, offset_names))
+                continue
+            data = next(results) if raw_instruction else None
+            if data is None:
+                if reject_invalid:
+                    return None
+                rows.append(empty_source_row(line, offset_names))
+                # Later lines were resolved as if this one took a word; redo them.
+                index = line_index + 1
+                break
+            rows.append(
+                BinaryWorkbenchRowDTO(
+                    offsets=offset_values(offset, offset_names, offset_bases),
+                    instruction=line.rstrip(),
+                    bytes_text=codec.bytes_text(data),
+                )
             )
-        )
-        offset += codec.word_size
+            offset += codec.word_size
     return rows
 
 
+def _speculative_batch(
+    lines: list[str],
+    index: int,
+    offset: int,
+    word_size: int,
+    labels: dict[str, str],
+    variables: dict[str, str],
+    equates: dict[str, str],
+) -> list[tuple[int, str | None]]:
+    """Resolve lines from ``index`` on as if every code line assembles; ``None`` marks lines without code."""
+    batch: list[tuple[int, str | None]] = []
+    while index < len(lines) and len(batch) < SOURCE_ASSEMBLY_BATCH_LINES:
+        line = lines[index]
+        if instruction_code(line):
+            batch.append((index, raw_mips_instruction(line, offset, labels, variables, equates) or ""))
+            offset += word_size
+        else:
+            batch.append((index, None))
+        index += 1
+    return batch
+
+
 def _provisional_labels(lines: list[str], start_offset: int) -> dict[str, str]:
     labels: dict[str, str] = {}
     offset = start_offset
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, order=True)
+class PatternMatch:
+    offset: int
+    pattern_id: int
+
+
+class BytePatternAutomaton:
+    """
+    Aho-Corasick automaton over byte patterns.
+
+    Built once per pattern list as a dense transition table, then every byte
+    of the haystack costs one table lookup no matter how many patterns are
+    searched. Matches are reported as ``PatternMatch(offset, pattern_id)``
+    where ``pattern_id`` is the index in ``patterns``.
+    """
+
+    def __init__(self, patterns: Sequence[bytes]) -> None:
+        self.patterns = tuple(patterns)
+        self.max_length = max((len(pattern) for pattern in self.patterns), default=0)
+        self._delta, self._outputs = _build_automaton(self.patterns)
+
+    def find(
+        self,
+        data: bytes,
+        base_offset: int,
+        start_offset: int | None = None,
+        end_offset: int | None = None,
+        max_results: int | None = None,
+    ) -> list[PatternMatch]:
+        if not self.max_length:
+            return []
+        left = max(0, (start_offset or 0) - base_offset)
+        right = len(data) if end_offset is None else min(len(data), end_offset - base_offset + 1)
+        if right <= left:
+            return []
+        delta = self._delta
+        outputs = self._outputs
+        patterns = self.patterns
+        results: list[PatternMatch] = []
+        stop = right
+        state = 0
+        for index in range(left, right):
+            if index >= stop:
+                break
+            state = delta[state][data[index]]
+            if not outputs[state]:
+                continue
+            for pattern_id in outputs[state]:
+                results.append(PatternMatch(base_offset + index - len(patterns[pattern_id]) + 1, pattern_id))
+            if max_results is not None and len(results) >= max_results and stop == right:
+                stop = min(right, index + self.max_length)
+        results.sort()
+        return results if max_results is None else results[:max_results]
+
+
+def _build_automaton(patterns: Sequence[bytes]) -> tuple[list[list[int]], list[tuple[int, ...]]]:
+    goto: list[dict[int, int]] = [{}]
+    outputs: list[tuple[int, ...]] = [()]
+    for pattern_id, pattern in enumerate(patterns):
+        if not pattern:
+            continue
+        state = 0
+        for value in pattern:
+            following = goto[state].get(value)
+            if following is None:
+                following = len(goto)
+                goto[state][value] = following
+                goto.append({})
+                outputs.append(())
+            state = following
+        outputs[state] = (*outputs[state], pattern_id)
+    fail = [0] * len(goto)
+    delta = [[0] * 256 for _ in goto]
+    for value, child in goto[0].items():
+        delta[0][value] = child
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        row = delta[state]
+        row[:] = delta[fail[state]]
+        for value, child in goto[state].items():
+            fail[child] = delta[fail[state]][value] if state else 0
+            outputs[child] = (*outputs[child], *outputs[fail[child]])
+            row[value] = child
+            queue.append(child)
+    return delta, outputs
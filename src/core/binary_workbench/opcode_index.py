@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from contextlib import suppress
+from heapq import merge
+from pathlib import Path
+from threading import Lock, Thread
+from uuid import uuid4
+
+from src.core.binary_workbench.codec_registry import binary_workbench_codec_for
+from src.core.binary_workbench.resource_identity import SourceFileIdentity, source_file_identity
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_OPCODE_INDEX_LOADED_FILES,
+    BINARY_WORKBENCH_OPCODE_INDEX_MAX_BYTES,
+    BINARY_WORKBENCH_SEARCH_CHUNK_SIZE,
+)
+from src.modules.contracts import CPUArchCodec
+
+OPCODE_INDEX_SCHEMA = 1
+OPCODE_INDEX_MAGIC = b"NCOPIDX\n"
+OPCODE_INDEX_SUFFIX = ".opidx"
+INSTRUCTION_TOKEN_DELIMITERS = re.compile(r"[\s,()]+")
+
+
+class OpcodeIndex:
+    """
+    Token postings for every aligned word of a source file.
+
+    Each disassembled word is split on whitespace, commas and parentheses, and
+    every token (mnemonic, register, immediate) maps to the sorted word
+    indices it appears in. ``candidate_offsets`` narrows a free-text query to
+    the words holding all of its tokens; callers still compare the real
+    disassembly, so the index only has to over-approximate.
+    """
+
+    def __init__(
+        self,
+        identity: SourceFileIdentity,
+        codec_name: str,
+        word_size: int,
+        postings: dict[str, array],
+    ) -> None:
+        self.identity = identity
+        self.codec_name = codec_name
+        self.word_size = word_size
+        self._postings = postings
+
+    @property
+    def token_count(self) -> int:
+        return len(self._postings)
+
+    def candidate_offsets(self, needle: str, start: int, end: int) -> list[int] | None:
+        pieces = INSTRUCTION_TOKEN_DELIMITERS.split(needle.lower())
+        groups = [
+            self._matching_postings(piece, position == 0, position == len(pieces) - 1)
+            for position, piece in enumerate(pieces)
+            if piece
+        ]
+        if not groups:
+            return None
+        first = -(-max(0, start) // self.word_size)
+        last = (end - self.word_size + 1) // self.word_size
+        ranged = sorted(
+            ([_between(postings, first, last) for postings in group] for group in groups),
+            key=lambda group: sum(len(postings) for postings in group),
+        )
+        candidates = list(dict.fromkeys(merge(*ranged[0])))
+        for group in ranged[1:]:
+            candidates = [index for index in candidates if any(_contains(postings, index) for postings in group)]
+        return [index * self.word_size for index in candidates]
+
+    def save(self, path: Path) -> None:
+        tokens = list(self._postings)
+        header = json.dumps(
+            {
+                "schema_version": OPCODE_INDEX_SCHEMA,
+                "byteorder": sys.byteorder,
+                "identity": [self.identity.path, self.identity.size, self.identity.modified_ns],
+                "codec": self.codec_name,
+                "word_size": self.word_size,
+                "tokens": [[token, len(self._postings[token])] for token in tokens],
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        try:
+            with open(temporary, "wb") as target:
+                target.write(OPCODE_INDEX_MAGIC)
+                target.write(len(header).to_bytes(4, "little"))
+                target.write(header)
+                for token in tokens:
+                    self._postings[token].tofile(target)
+            temporary.replace(path)
+        finally:
+            with suppress(OSError):
+                if temporary.exists():
+                    temporary.unlink()
+
+    def _matching_postings(self, piece: str, open_left: bool, open_right: bool) -> list[array]:
+        if not open_left and not open_right:
+            postings = self._postings.get(piece)
+            return [] if postings is None else [postings]
+        if open_left and open_right:
+            return [postings for token, postings in self._postings.items() if piece in token]
+        if open_left:
+            return [postings for token, postings in self._postings.items() if token.endswith(piece)]
+        return [postings for token, postings in self._postings.items() if token.startswith(piece)]
+
+
+class OpcodeIndexStore:
+    """
+    On-disk opcode indexes keyed by source path, size and modification time.
+
+    ``index_for`` answers from memory or disk and otherwise starts a
+    background build, returning ``None`` until it is ready.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._indexes: OrderedDict[tuple[SourceFileIdentity, str], OpcodeIndex] = OrderedDict()
+        self._builds: dict[tuple[SourceFileIdentity, str], Future[OpcodeIndex | None]] = {}
+        self._lock = Lock()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def index_for(self, path: Path, codec: CPUArchCodec) -> OpcodeIndex | None:
+        key = self._key(path, codec)
+        if key is None:
+            return None
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+            if key in self._builds:
+                return None
+        index = load_opcode_index(self._file_for(key), *key)
+        if index is not None:
+            self._remember(key, index)
+            return index
+        self.build(path, codec)
+        return None
+
+    def build(self, path: Path, codec: CPUArchCodec) -> Future[OpcodeIndex | None]:
+        key = self._key(path, codec)
+        future: Future[OpcodeIndex | None] = Future()
+        if key is None:
+            future.set_result(None)
+            return future
+        with self._lock:
+            running = self._builds.get(key)
+            if running is not None:
+                return running
+            self._builds[key] = future
+        Thread(target=self._run_build, args=(key, path, codec.display_name, future), daemon=True).start()
+        return future
+
+    def _run_build(
+        self,
+        key: tuple[SourceFileIdentity, str],
+        path: Path,
+        codec_name: str,
+        future: Future[OpcodeIndex | None],
+    ) -> None:
+        try:
+            index = build_opcode_index(path, binary_workbench_codec_for(codec_name))
+            if index is not None and index.identity == key[0]:
+                index.save(self._file_for(key))
+                self._remember(key, index)
+            future.set_result(index)
+        except Exception as error:
+            future.set_exception(error)
+        finally:
+            with self._lock:
+                self._builds.pop(key, None)
+
+    def _remember(self, key: tuple[SourceFileIdentity, str], index: OpcodeIndex) -> None:
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > BINARY_WORKBENCH_OPCODE_INDEX_LOADED_FILES:
+                self._indexes.popitem(last=False)
+
+    def _key(self, path: Path, codec: CPUArchCodec) -> tuple[SourceFileIdentity, str] | None:
+        identity = source_file_identity(path)
+        if identity.size <= 0 or identity.size > BINARY_WORKBENCH_OPCODE_INDEX_MAX_BYTES:
+            return None
+        return identity, codec.display_name
+
+    def _file_for(self, key: tuple[SourceFileIdentity, str]) -> Path:
+        identity, codec_name = key
+        name = f"{identity.path}|{identity.size}|{identity.modified_ns}|{codec_name}"
+        return self._directory / f"{hashlib.sha1(name.encode('utf-8')).hexdigest()}{OPCODE_INDEX_SUFFIX}"
+
+
+def build_opcode_index(
+    path: Path,
+    codec: CPUArchCodec,
+    cancelled: Callable[[], bool] | None = None,
+) -> OpcodeIndex | None:
+    identity = source_file_identity(path)
+    word_size = codec.word_size
+    postings: dict[str, array] = {}
+    chunk_size = BINARY_WORKBENCH_SEARCH_CHUNK_SIZE - BINARY_WORKBENCH_SEARCH_CHUNK_SIZE % word_size
+    try:
+        with open(path, "rb") as source:
+            base = 0
+            while data := source.read(chunk_size):
+                if cancelled is not None and cancelled():
+                    return None
+                for index, text in enumerate(_disassembly(codec, data, base)):
+                    word_index = base // word_size + index
+                    for token in instruction_tokens(text):
+                        entries = postings.get(token)
+                        if entries is None:
+                            entries = postings[token] = array("I")
+                        entries.append(word_index)
+                base += len(data)
+    except OSError:
+        return None
+    return OpcodeIndex(identity, codec.display_name, word_size, postings)
+
+
+def load_opcode_index(path: Path, identity: SourceFileIdentity, codec_name: str) -> OpcodeIndex | None:
+    try:
+        with open(path, "rb") as source:
+            if source.read(len(OPCODE_INDEX_MAGIC)) != OPCODE_INDEX_MAGIC:
+                return None
+            header = json.loads(source.read(int.from_bytes(source.read(4), "little")).decode("utf-8"))
+            if (
+                header.get("schema_version") != OPCODE_INDEX_SCHEMA
+                or header.get("byteorder") != sys.byteorder
+                or header.get("identity") != [identity.path, identity.size, identity.modified_ns]
+                or header.get("codec") != codec_name
+            ):
+                return None
+            postings: dict[str, array] = {}
+            for token, count in header["tokens"]:
+                entries = array("I")
+                entries.fromfile(source, int(count))
+                postings[str(token)] = entries
+            return OpcodeIndex(identity, codec_name, int(header["word_size"]), postings)
+    except (OSError, EOFError, ValueError, KeyError, TypeError):
+        return None
+
+
+def instruction_tokens(text: str) -> list[str]:
+    return list(dict.fromkeys(piece for piece in INSTRUCTION_TOKEN_DELIMITERS.split(text.lower()) if piece))
+
+
+def _disassembly(codec: CPUArchCodec, data: bytes, base: int) -> list[str]:
+    try:
+        return codec.disassemble_many(data, base)
+    except Exception:
+        size = codec.word_size
+        return [
+            _word_disassembly(codec, data[index:index + size], base + index)
+            for index in range(0, len(data) - size + 1, size)
+        ]
+
+
+def _word_disassembly(codec: CPUArchCodec, data: bytes, offset: int) -> str:
+    try:
+        return codec.disassemble(data, offset)
+    except Exception:
+        return ""
+
+
+def _between(postings: array, first: int, last: int) -> array:
+    return postings[bisect_left(postings, first):bisect_right(postings, last)]
+
+
+def _contains(postings: array, value: int) -> bool:
+    index = bisect_left(postings, value)
+    return index < len(postings) and postings[index] == value
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+
+from src.core.binary_workbench.psx_sector_layout import RAW_SECTOR_SIZE
+
+EDC_POLYNOMIAL = 0xD8018001
+ECC_FIELD_POLYNOMIAL = 0x11D
+# (start, size) of the bytes covered by the EDC of each sector kind.
+MODE1_EDC_SPAN = (0, 2064)
+FORM1_EDC_SPAN = (16, 2056)
+FORM2_EDC_SPAN = (16, 2332)
+ECC_P_OFFSET = 2076
+ECC_Q_OFFSET = 2248
+# P parity: 86 columns of 24 bytes over sector[12:2076]; Q parity: 52 diagonals of 43 bytes over sector[12:2248].
+ECC_P_MAJORS = 86
+ECC_P_MINORS = 24
+ECC_Q_MAJORS = 52
+ECC_Q_MINORS = 43
+ECC_Q_SOURCE_SIZE = 2236
+# A Q row steps 43 byte pairs through the 16-bit view of its source.
+ECC_Q_STRIDE = 43
+
+
+def edc(data: bytes | bytearray | memoryview) -> int:
+    """EDC (reflected CRC-32, polynomial 0xD8018001, zero init) folding eight bytes per step through 16-bit tables."""
+    a, b, c, d = _edc_slice_tables()
+    table = _edc_table()
+    view = memoryview(data).cast("B")
+    whole = len(view) - len(view) % 8
+    words = array("Q", view[:whole].tobytes())
+    if sys.byteorder == "big":
+        words.byteswap()
+    value = 0
+    for word in words:
+        low = value ^ (word & 0xFFFFFFFF)
+        value = a[low & 0xFFFF] ^ b[low >> 16] ^ c[(word >> 32) & 0xFFFF] ^ d[word >> 48]
+    for byte in view[whole:]:
+        value = (value >> 8) ^ table[(value ^ byte) & 0xFF]
+    return value
+
+
+def ecc(source: bytes | bytearray) -> bytes:
+    """P and Q parity (276 bytes) of ``sector[12:2076]``, given the 2064 bytes it covers."""
+    p_parity = _parity(
+        (source[minor * ECC_P_MAJORS:(minor + 1) * ECC_P_MAJORS] for minor in range(ECC_P_MINORS)),
+        _p_tables(),
+        ECC_P_MAJORS,
+    )
+    q_source = source[:ECC_P_MAJORS * ECC_P_MINORS] + p_parity
+    words = memoryview(q_source + q_source).cast("H")
+    q_parity = _parity(
+        (words[start:start + ECC_Q_STRIDE * ECC_Q_MAJORS // 2:ECC_Q_STRIDE].tobytes() for start in _q_row_starts()),
+        _q_tables(),
+        ECC_Q_MAJORS,
+    )
+    return p_parity + q_parity
+
+
+def edc_columns(sectors: bytearray, start: int, size: int) -> list[int]:
+    """
+    EDC of ``sector[start:start+size]`` for every raw sector in ``sectors``.
+
+    The CRC is linear, so every byte position contributes a fixed 32-bit
+    value per byte value. Each position is gathered across all sectors with
+    one strided slice and mapped through four ``bytes.translate`` tables, so
+    the Python-level work does not grow with the number of sectors.
+    """
+    count = len(sectors) // RAW_SECTOR_SIZE
+    if count == 0:
+        return []
+    tables = _edc_position_tables()
+    lanes = [0, 0, 0, 0]
+    for position in range(start, start + size):
+        column = sectors[position::RAW_SECTOR_SIZE]
+        lane_tables = tables[start + size - 1 - position]
+        for lane in range(4):
+            lanes[lane] ^= int.from_bytes(column.translate(lane_tables[lane]), "big")
+    lane_bytes = [lane.to_bytes(count, "big") for lane in lanes]
+    return [int.from_bytes(bytes(lane[index] for lane in lane_bytes), "little") for index in range(count)]
+
+
+def write_edc_columns(sectors: bytearray, start: int, size: int) -> None:
+    """Stores each sector's EDC right after the bytes it covers."""
+    count = len(sectors) // RAW_SECTOR_SIZE
+    if count == 0:
+        return
+    values = edc_columns(sectors, start, size)
+    for lane in range(4):
+        sectors[start + size + lane::RAW_SECTOR_SIZE] = bytes((value >> (8 * lane)) & 0xFF for value in values)
+
+
+def write_ecc_columns(sectors: bytearray) -> None:
+    """Stores P and Q parity of every raw sector, reading each byte position across all sectors at once."""
+    if len(sectors) < RAW_SECTOR_SIZE:
+        return
+    p_positions = [
+        [12 + minor * ECC_P_MAJORS + major for minor in range(ECC_P_MINORS)]
+        for major in range(ECC_P_MAJORS)
+    ]
+    _write_parity_columns(sectors, p_positions, _p_tables(), ECC_P_OFFSET)
+    _write_parity_columns(sectors, _q_positions(), _q_tables(), ECC_Q_OFFSET)
+
+
+def _parity(rows: Iterable[bytes], tables: Sequence[bytes], size: int) -> bytes:
+    """``rows`` are the minor-ordered byte rows of one parity block, one byte per major."""
+    parity_a = parity_b = 0
+    for table, row in zip(tables, rows):
+        parity_a ^= int.from_bytes(row.translate(table), "big")
+        parity_b ^= int.from_bytes(row, "big")
+    return parity_a.to_bytes(size, "big") + (parity_a ^ parity_b).to_bytes(size, "big")
+
+
+def _write_parity_columns(
+    sectors: bytearray,
+    positions: Sequence[Sequence[int]],
+    tables: Sequence[bytes],
+    offset: int,
+) -> None:
+    majors = len(positions)
+    for major, minor_positions in enumerate(positions):
+        parity_a = parity_b = 0
+        for minor, position in enumerate(minor_positions):
+            column = sectors[position::RAW_SECTOR_SIZE]
+            parity_a ^= int.from_bytes(column.translate(tables[minor]), "big")
+            parity_b ^= int.from_bytes(column, "big")
+        count = len(sectors[offset + major::RAW_SECTOR_SIZE])
+        sectors[offset + major::RAW_SECTOR_SIZE] = parity_a.to_bytes(count, "big")
+        sectors[offset + majors + major::RAW_SECTOR_SIZE] = (parity_a ^ parity_b).to_bytes(count, "big")
+
+
+@lru_cache(maxsize=1)
+def _q_row_starts() -> tuple[int, ...]:
+    """Word index of the first byte pair of each Q minor row, in the doubled 16-bit view of the Q source."""
+    words = ECC_Q_SOURCE_SIZE // 2
+    return tuple((minor * (ECC_Q_STRIDE + 1)) % words for minor in range(ECC_Q_MINORS))
+
+
+@lru_cache(maxsize=1)
+def _q_positions() -> tuple[tuple[int, ...], ...]:
+    return tuple(
+        tuple(
+            12 + ((major >> 1) * ECC_P_MAJORS + (major & 1) + minor * (ECC_P_MAJORS + 2)) % ECC_Q_SOURCE_SIZE
+            for minor in range(ECC_Q_MINORS)
+        )
+        for major in range(ECC_Q_MAJORS)
+    )
+
+
+@lru_cache(maxsize=1)
+def _p_tables() -> tuple[bytes, ...]:
+    return _parity_tables(ECC_P_MINORS)
+
+
+@lru_cache(maxsize=1)
+def _q_tables() -> tuple[bytes, ...]:
+    return _parity_tables(ECC_Q_MINORS)
+
+
+def _parity_tables(minors: int) -> tuple[bytes, ...]:
+    """
+    Per-minor GF(2^8) coefficient tables for the first parity byte.
+
+    The reference loop folds ``a = alpha * (a ^ value)`` over the minors and
+    then divides ``alpha * a ^ b`` by ``1 + alpha``; expanding that gives one
+    fixed multiplier per minor position.
+    """
+    forward, backward = _ecc_luts()
+    tables: list[bytes] = []
+    for minor in range(minors):
+        power = minors - minor + 1
+        row = bytearray(256)
+        for value in range(256):
+            scaled = value
+            for _ in range(power):
+                scaled = forward[scaled]
+            row[value] = backward[scaled ^ value]
+        tables.append(bytes(row))
+    return tuple(tables)
+
+
+@lru_cache(maxsize=1)
+def _ecc_luts() -> tuple[tuple[int, ...], tuple[int, ...]]:
+    forward = [0] * 256
+    backward = [0] * 256
+    for index in range(256):
+        value = index << 1
+        if value & 0x100:
+            value ^= ECC_FIELD_POLYNOMIAL
+        forward[index] = value
+        backward[index ^ value] = index
+    return tuple(forward), tuple(backward)
+
+
+@lru_cache(maxsize=1)
+def _edc_table() -> tuple[int, ...]:
+    values: list[int] = []
+    for index in range(256):
+        value = index
+        for _ in range(8):
+            value = (value >> 1) ^ (EDC_POLYNOMIAL if value & 1 else 0)
+        values.append(value)
+    return tuple(values)
+
+
+@lru_cache(maxsize=1)
+def _edc_slice_tables() -> tuple[list[int], ...]:
+    """Slice-by-8 tables merged pairwise into four 16-bit tables, one per byte pair of an 8-byte step."""
+    base = _edc_table()
+    tables = [list(base)]
+    for _ in range(7):
+        tables.append([(value >> 8) ^ base[value & 0xFF] for value in tables[-1]])
+    return tuple(
+        [tables[high][pair & 0xFF] ^ tables[high - 1][pair >> 8] for pair in range(65536)]
+        for high in (7, 5, 3, 1)
+    )
+
+
+@lru_cache(maxsize=1)
+def _edc_position_tables() -> tuple[tuple[bytes, bytes, bytes, bytes], ...]:
+    """Per distance from the end of the covered span, the four byte lanes of one byte's EDC contribution."""
+    base = _edc_table()
+    states = list(base)
+    tables: list[tuple[bytes, bytes, bytes, bytes]] = []
+    for _ in range(FORM2_EDC_SPAN[1]):
+        tables.append(tuple(bytes((state >> shift) & 0xFF for state in states) for shift in (0, 8, 16, 24)))
+        states = [(state >> 8) ^ base[state & 0xFF] for state in states]
+    return tuple(tables)
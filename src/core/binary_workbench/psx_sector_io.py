@@ -1,94 +1,169 @@
 from __future__ import annotations
 
-from src.core.binary_workbench.psx_sector_layout import RAW_SECTOR_SIZE, SYNC_HEADER, sector_layout
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from threading import Lock
+
+from src.core.binary_workbench.psx_sector_codes import (
+    ECC_P_OFFSET,
+    FORM1_EDC_SPAN,
+    FORM2_EDC_SPAN,
+    MODE1_EDC_SPAN,
+    ecc,
+    edc,
+    write_ecc_columns,
+    write_edc_columns,
+)
+from src.core.binary_workbench.psx_sector_layout import (
+    RAW_SECTOR_SIZE,
+    SECTOR_LAYOUT_PREFIX_SIZE,
+    SYNC_HEADER,
+    sector_layout,
+)
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_PARALLEL_SECTOR_MIN_SECTORS,
+    BINARY_WORKBENCH_SECTOR_BATCH_SECTORS,
+    BINARY_WORKBENCH_SECTOR_COLUMN_MIN_SECTORS,
+)
+
+SECTOR_WORKERS = max(1, min(8, (os.cpu_count() or 1) - 1))
+MODE1 = (1, 1)
+MODE2_FORM1 = (2, 1)
+MODE2_FORM2 = (2, 2)
+EDC_SPANS = {MODE1: MODE1_EDC_SPAN, MODE2_FORM1: FORM1_EDC_SPAN, MODE2_FORM2: FORM2_EDC_SPAN}
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = Lock()
 
 
 def rebuild_psx_sector(sector: bytes, sector_index: int) -> bytes:
-    layout = sector_layout(sector, len(sector))
-    if len(sector) != RAW_SECTOR_SIZE or layout.mode not in {1, 2}:
+    if len(sector) != RAW_SECTOR_SIZE:
         return sector
-    rebuilt = bytearray(sector)
-    rebuilt[:12] = SYNC_HEADER
-    _write_header(rebuilt, sector_index)
-    if layout.mode == 1:
-        rebuilt[2064:2068] = _edc(rebuilt[:2064]).to_bytes(4, "little")
-        rebuilt[2068:2076] = b"\x00" * 8
-        _write_ecc(rebuilt, zero_header=False)
-    elif layout.form == 1:
-        rebuilt[2072:2076] = _edc(rebuilt[16:2072]).to_bytes(4, "little")
-        _write_ecc(rebuilt, zero_header=True)
-    else:
-        rebuilt[2348:2352] = _edc(rebuilt[16:2348]).to_bytes(4, "little")
+    return rebuild_psx_sectors(sector, sector_index)
+
+
+def rebuild_psx_sectors(data: bytes, first_index: int) -> bytes:
+    """
+    Rebuilds header, EDC and ECC of a run of raw sectors starting at ``first_index``.
+
+    Sectors without a sync header or with an unknown mode, and any trailing
+    partial sector, are returned unchanged. Large runs are split into batches
+    and rebuilt in a process pool.
+    """
+    count = len(data) // RAW_SECTOR_SIZE
+    pool = sector_pool() if count >= BINARY_WORKBENCH_PARALLEL_SECTOR_MIN_SECTORS else None
+    if pool is None:
+        return rebuild_sector_batch(data, first_index)
+    batch_bytes = BINARY_WORKBENCH_SECTOR_BATCH_SECTORS * RAW_SECTOR_SIZE
+    starts = range(0, count * RAW_SECTOR_SIZE, batch_bytes)
+    batches = [
+        (data[start:start + batch_bytes], first_index + start // RAW_SECTOR_SIZE)
+        for start in starts
+    ]
+    try:
+        rebuilt = list(pool.map(rebuild_sector_batch, *zip(*batches)))
+    except BrokenProcessPool:
+        reset_sector_pool()
+        rebuilt = [rebuild_sector_batch(batch, index) for batch, index in batches]
+    return b"".join(rebuilt) + data[count * RAW_SECTOR_SIZE:]
+
+
+def rebuild_sector_batch(data: bytes, first_index: int) -> bytes:
+    """In-process rebuild; sectors of one kind are done column-wise once there are enough of them."""
+    return _with_sector_codes(data, first_index)
+
+
+def expected_sector_codes(data: bytes) -> bytes:
+    """``data`` with the EDC and ECC each sector should carry for its current header and payload."""
+    return _with_sector_codes(data, None)
+
+
+def _with_sector_codes(data: bytes, first_index: int | None) -> bytes:
+    rebuilt = bytearray(data)
+    groups: dict[tuple[int, int], list[int]] = {}
+    for index in range(len(data) // RAW_SECTOR_SIZE):
+        offset = index * RAW_SECTOR_SIZE
+        layout = sector_layout(rebuilt[offset:offset + SECTOR_LAYOUT_PREFIX_SIZE], RAW_SECTOR_SIZE, RAW_SECTOR_SIZE)
+        if layout.mode not in {1, 2}:
+            continue
+        if first_index is not None:
+            _write_header(rebuilt, offset, first_index + index)
+        groups.setdefault((layout.mode, layout.form), []).append(offset)
+    for kind, offsets in groups.items():
+        if len(offsets) < BINARY_WORKBENCH_SECTOR_COLUMN_MIN_SECTORS:
+            for offset in offsets:
+                sector = rebuilt[offset:offset + RAW_SECTOR_SIZE]
+                _rebuild_codes(sector, kind)
+                rebuilt[offset:offset + RAW_SECTOR_SIZE] = sector
+        elif len(offsets) * RAW_SECTOR_SIZE == len(rebuilt):
+            _rebuild_code_columns(rebuilt, kind)
+        else:
+            sectors = bytearray(b"".join(rebuilt[offset:offset + RAW_SECTOR_SIZE] for offset in offsets))
+            _rebuild_code_columns(sectors, kind)
+            for index, offset in enumerate(offsets):
+                start = index * RAW_SECTOR_SIZE
+                rebuilt[offset:offset + RAW_SECTOR_SIZE] = sectors[start:start + RAW_SECTOR_SIZE]
     return bytes(rebuilt)
 
 
-def _write_header(sector: bytearray, sector_index: int) -> None:
+def sector_pool() -> ProcessPoolExecutor | None:
+    global _pool
+    if SECTOR_WORKERS < 2:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            try:
+                _pool = ProcessPoolExecutor(max_workers=SECTOR_WORKERS, mp_context=get_context("spawn"))
+            except (OSError, NotImplementedError, ImportError):
+                return None
+        return _pool
+
+
+def reset_sector_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _rebuild_codes(sector: bytearray, kind: tuple[int, int]) -> None:
+    start, size = EDC_SPANS[kind]
+    sector[start + size:start + size + 4] = edc(sector[start:start + size]).to_bytes(4, "little")
+    if kind == MODE2_FORM2:
+        return
+    if kind == MODE1:
+        sector[2068:2076] = b"\x00" * 8
+    source = sector[12:ECC_P_OFFSET]
+    if kind == MODE2_FORM1:
+        source[:4] = b"\x00" * 4
+    sector[ECC_P_OFFSET:RAW_SECTOR_SIZE] = ecc(source)
+
+
+def _rebuild_code_columns(sectors: bytearray, kind: tuple[int, int]) -> None:
+    if kind == MODE1:
+        for position in range(2068, 2076):
+            sectors[position::RAW_SECTOR_SIZE] = bytes(len(sectors) // RAW_SECTOR_SIZE)
+    write_edc_columns(sectors, *EDC_SPANS[kind])
+    if kind == MODE2_FORM2:
+        return
+    headers = [sectors[position::RAW_SECTOR_SIZE] for position in range(12, 16)] if kind == MODE2_FORM1 else []
+    for position, header in zip(range(12, 16), headers):
+        sectors[position::RAW_SECTOR_SIZE] = bytes(len(header))
+    write_ecc_columns(sectors)
+    for position, header in zip(range(12, 16), headers):
+        sectors[position::RAW_SECTOR_SIZE] = header
+
+
+def _write_header(sector: bytearray, offset: int, sector_index: int) -> None:
     absolute = sector_index + 150
     minute, remainder = divmod(absolute, 75 * 60)
     second, frame = divmod(remainder, 75)
-    sector[12:15] = bytes((_bcd(minute), _bcd(second), _bcd(frame)))
+    sector[offset:offset + 12] = SYNC_HEADER
+    sector[offset + 12:offset + 15] = bytes((_bcd(minute), _bcd(second), _bcd(frame)))
 
 
 def _bcd(value: int) -> int:
     return ((value // 10) << 4) | (value % 10)
-
-
-def _edc(data: bytes | bytearray) -> int:
-    value = 0
-    for byte in data:
-        value = (value >> 8) ^ _EDC_LUT[(value ^ byte) & 0xFF]
-    return value
-
-
-def _write_ecc(sector: bytearray, zero_header: bool) -> None:
-    header = bytes(sector[12:16])
-    if zero_header:
-        sector[12:16] = b"\x00" * 4
-    sector[2076:2248] = _ecc(sector[12:2076], 86, 24, 2, 86)
-    sector[2248:2352] = _ecc(sector[12:2248], 52, 43, 86, 88)
-    if zero_header:
-        sector[12:16] = header
-
-
-def _ecc(source: bytes | bytearray, major_count: int, minor_count: int, major_mult: int, minor_inc: int) -> bytes:
-    size = major_count * minor_count
-    result = bytearray(major_count * 2)
-    for major in range(major_count):
-        index = (major >> 1) * major_mult + (major & 1)
-        ecc_a = ecc_b = 0
-        for _ in range(minor_count):
-            value = source[index]
-            index = (index + minor_inc) % size
-            ecc_a ^= value
-            ecc_b ^= value
-            ecc_a = _ECC_F_LUT[ecc_a]
-        ecc_a = _ECC_B_LUT[_ECC_F_LUT[ecc_a] ^ ecc_b]
-        result[major] = ecc_a
-        result[major + major_count] = ecc_a ^ ecc_b
-    return bytes(result)
-
-
-def _ecc_luts() -> tuple[tuple[int, ...], tuple[int, ...]]:
-    forward = [0] * 256
-    backward = [0] * 256
-    for index in range(256):
-        value = index << 1
-        if value & 0x100:
-            value ^= 0x11D
-        forward[index] = value
-        backward[index ^ value] = index
-    return tuple(forward), tuple(backward)
-
-
-def _edc_lut() -> tuple[int, ...]:
-    values: list[int] = []
-    for index in range(256):
-        value = index
-        for _ in range(8):
-            value = (value >> 1) ^ (0xD8018001 if value & 1 else 0)
-        values.append(value)
-    return tuple(values)
-
-
-_ECC_F_LUT, _ECC_B_LUT = _ecc_luts()
-_EDC_LUT = _edc_lut()
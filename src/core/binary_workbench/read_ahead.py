@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from math import ceil
+from threading import Lock
+from time import monotonic
+from typing import Generic, TypeVar
+
+READ_AHEAD_WORKERS = 2
+READ_AHEAD_MAX_BLOCKS = 8
+READ_AHEAD_HORIZON_SECONDS = 0.25
+
+BlockT = TypeVar("BlockT")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = Lock()
+
+
+def read_ahead_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=READ_AHEAD_WORKERS,
+                thread_name_prefix="binary-read-ahead",
+            )
+        return _executor
+
+
+class ReadAheadTracker:
+    def __init__(
+        self,
+        block_size: int,
+        max_blocks: int = READ_AHEAD_MAX_BLOCKS,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._block_size = max(1, block_size)
+        self._max_blocks = max(1, max_blocks)
+        self._clock = clock
+        self._last_offset: int | None = None
+        self._last_time = 0.0
+        self.direction = 1
+        self.velocity = 0.0
+
+    def blocks_ahead(self, offset: int, direction: int) -> list[int]:
+        now = self._clock()
+        if self._last_offset is not None and offset != self._last_offset:
+            moved = offset - self._last_offset
+            elapsed = max(now - self._last_time, 1e-3)
+            self.direction = 1 if moved > 0 else -1
+            self.velocity = abs(moved) / elapsed
+        elif direction:
+            self.direction = 1 if direction > 0 else -1
+        self._last_offset = offset
+        self._last_time = now
+        horizon = self.velocity * READ_AHEAD_HORIZON_SECONDS
+        count = min(self._max_blocks, max(1, ceil(horizon / self._block_size)))
+        block_index = max(0, offset) // self._block_size
+        return [block_index + self.direction * step for step in range(1, count + 1)]
+
+
+class InFlightBlockLoads(Generic[BlockT]):
+    """
+    Future map for block loads. Foreground reads wait on a load that is
+    already running, and take over one that is still queued.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._futures: dict[int, Future[BlockT]] = {}
+
+    def __contains__(self, block_index: int) -> bool:
+        with self._lock:
+            return block_index in self._futures
+
+    def load(self, block_index: int, loader: Callable[[int], BlockT]) -> BlockT:
+        with self._lock:
+            existing = self._futures.get(block_index)
+            if existing is not None and existing.cancel():
+                existing = None
+            if existing is None:
+                future: Future[BlockT] = Future()
+                future.set_running_or_notify_cancel()
+                self._futures[block_index] = future
+        if existing is not None:
+            return existing.result()
+        return self._run(future, block_index, loader)
+
+    def submit(
+        self,
+        executor: Executor,
+        block_index: int,
+        loader: Callable[[int], BlockT],
+    ) -> Future[BlockT]:
+        with self._lock:
+            existing = self._futures.get(block_index)
+            if existing is not None:
+                return existing
+            future: Future[BlockT] = Future()
+            self._futures[block_index] = future
+        executor.submit(self._run_queued, future, block_index, loader)
+        return future
+
+    def _run_queued(self, future: Future[BlockT], block_index: int, loader: Callable[[int], BlockT]) -> None:
+        if future.set_running_or_notify_cancel():
+            self._run(future, block_index, loader)
+
+    def _run(self, future: Future[BlockT], block_index: int, loader: Callable[[int], BlockT]) -> BlockT:
+        try:
+            block = loader(block_index)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(block)
+            return block
+        finally:
+            with self._lock:
+                if self._futures.get(block_index) is future:
+                    del self._futures[block_index]
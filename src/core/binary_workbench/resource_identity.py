@@ -1,8 +1,24 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@dataclass(frozen=True)
+class SourceFileIdentity:
+    path: str
+    size: int
+    modified_ns: int
+
+
+def source_file_identity(path: Path) -> SourceFileIdentity:
+    try:
+        stat = path.stat()
+    except OSError:
+        return SourceFileIdentity(str(path.resolve()), 0, 0)
+    return SourceFileIdentity(str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
 def file_resource_identifiers(path: Path | None, display_name: str = "") -> list[str]:
     names: list[str] = []
     if path is not None:
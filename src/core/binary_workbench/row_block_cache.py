@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping
+
+from src.core.binary_workbench.block_cache_policies import LruBlockPolicy
+from src.core.binary_workbench.mips_r3000a import build_rows_from_bytes
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_ROW_BYTES as ROW_BYTES,
+    BINARY_WORKBENCH_ROW_CACHE_BLOCK_BYTES,
+    BINARY_WORKBENCH_ROW_CACHE_BLOCKS,
+)
+from src.modules.binary_workbench_dtos import BinaryWorkbenchRowDTO
+
+BlockRead = Callable[[int, int], bytes | memoryview]
+
+
+class RowBlockCache:
+    """
+    Disassembled rows of a reader, cached per fixed-size block.
+
+    Entries are keyed by block start, block length and the reference-offset
+    configuration, so a changed file size or offset column never reuses stale
+    rows. Byte overlays are diffed against the previous call and only the
+    blocks under added, removed or changed patches are dropped.
+    """
+
+    def __init__(
+        self,
+        block_bytes: int = BINARY_WORKBENCH_ROW_CACHE_BLOCK_BYTES,
+        capacity: int = BINARY_WORKBENCH_ROW_CACHE_BLOCKS,
+    ) -> None:
+        self._block_bytes = max(ROW_BYTES, block_bytes - block_bytes % ROW_BYTES)
+        self._policy = LruBlockPolicy(capacity)
+        self._overlay_source: Mapping[int, bytes] | None = None
+        self._overlays: dict[int, bytes] = {}
+
+    def rows(
+        self,
+        read: BlockRead,
+        offset: int,
+        size: int,
+        file_size: int,
+        overlays: Mapping[int, bytes],
+        offset_names: list[str],
+        offset_bases: dict[str, str],
+    ) -> list[BinaryWorkbenchRowDTO]:
+        """Whole rows covering ``offset..offset+size``; ``read`` returns block bytes with ``overlays`` applied."""
+        self._sync_overlays(overlays)
+        end = min(offset + max(0, size), file_size)
+        if end <= offset:
+            return []
+        phase = offset % ROW_BYTES
+        config = (tuple(offset_names), tuple(sorted(offset_bases.items())))
+        rows: list[BinaryWorkbenchRowDTO] = []
+        block_start = offset - (offset - phase) % self._block_bytes
+        while block_start < end:
+            length = min(self._block_bytes, file_size - block_start)
+            block_rows = self._block_rows(read, block_start, length, config)
+            first = max(0, offset - block_start) // ROW_BYTES
+            last = -(-(end - block_start) // ROW_BYTES)
+            rows.extend(block_rows[first:last])
+            block_start += self._block_bytes
+        return rows
+
+    def invalidate(self, start: int, end: int) -> None:
+        for key in self._policy.keys():
+            block_start, length, _ = key
+            if block_start < end and block_start + length > start:
+                self._policy.discard(key)
+
+    def clear(self) -> None:
+        for key in self._policy.keys():
+            self._policy.discard(key)
+        self._overlay_source = None
+        self._overlays = {}
+
+    def _block_rows(
+        self,
+        read: BlockRead,
+        block_start: int,
+        length: int,
+        config: tuple[Hashable, ...],
+    ) -> list[BinaryWorkbenchRowDTO]:
+        key = (block_start, length, config)
+        rows = self._policy.get(key)
+        if rows is None:
+            names, bases = config
+            rows = build_rows_from_bytes(read(block_start, length), list(names), block_start, dict(bases))
+            self._policy.put(key, rows)
+        return rows
+
+    def _sync_overlays(self, overlays: Mapping[int, bytes]) -> None:
+        if overlays is self._overlay_source:
+            return
+        current = dict(overlays)
+        for offset in self._overlays.keys() | current.keys():
+            before, after = self._overlays.get(offset), current.get(offset)
+            if before != after:
+                self.invalidate(offset, offset + max(len(before or b""), len(after or b"")))
+        self._overlay_source = overlays
+        self._overlays = current
@@ -1,21 +1,52 @@
+from src.core.binary_workbench.searching.pointer_scan import iter_reader_pointers
+from src.core.binary_workbench.searching.progress import (
+    CancellationToken,
+    SearchBatch,
+    drain_search,
+)
+from src.core.binary_workbench.searching.reader_search import reader_search_batches
 from src.core.binary_workbench.searching.scanner import (
     effective_search_end,
     find_reader_bytes,
     find_reader_hex,
     find_reader_instruction,
+    find_reader_masked,
+    find_reader_patterns,
+    iter_reader_bytes,
+    iter_reader_hex,
+    iter_reader_instruction,
+    iter_reader_masked,
+    iter_reader_patterns,
 )
+from src.core.binary_workbench.searching.sector_search import SectorImageReader, search_internal_files
 from src.core.binary_workbench.searching.validator import (
     offset_matches_decoded_text,
     offset_matches_hex,
     offset_matches_instruction,
+    offset_matches_search_list,
 )
 
 __all__ = [
+    "CancellationToken",
+    "SearchBatch",
+    "SectorImageReader",
+    "drain_search",
     "effective_search_end",
     "find_reader_bytes",
     "find_reader_hex",
     "find_reader_instruction",
+    "find_reader_masked",
+    "find_reader_patterns",
+    "iter_reader_bytes",
+    "iter_reader_hex",
+    "iter_reader_instruction",
+    "iter_reader_masked",
+    "iter_reader_patterns",
+    "iter_reader_pointers",
     "offset_matches_decoded_text",
     "offset_matches_hex",
     "offset_matches_instruction",
+    "offset_matches_search_list",
+    "reader_search_batches",
+    "search_internal_files",
 ]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+
+from src.core.binary_workbench.masked_search import find_masked_bytes_in_data
+from src.core.binary_workbench.text_search import (
+    find_bytes_in_data,
+    find_hex_nibbles_in_data,
+    hex_nibbles,
+)
+from src.modules.binary_workbench_constants import BINARY_WORKBENCH_LIMITED_DISASSEMBLY_SEARCH_SLICE_BYTES
+
+BYTES_MATCH = "bytes"
+HEX_MATCH = "hex"
+MASKED_MATCH = "masked"
+DISASSEMBLY_MATCH = "disassembly"
+
+ChunkFinder = Callable[[bytes, int, int | None], list[int]]
+
+
+def chunk_finder(kind: str, query, codec=None) -> ChunkFinder:
+    if kind == BYTES_MATCH:
+        return lambda data, base, remaining: find_bytes_in_data(data, base, query, base, None, remaining)
+    if kind == HEX_MATCH:
+        return lambda data, base, remaining: find_hex_nibbles_in_data(data, base, query, base, None, remaining)
+    if kind == MASKED_MATCH:
+        return lambda data, base, remaining: find_masked_bytes_in_data(data, base, query, base, None, remaining)
+    return _disassembly_finder(query.lower(), codec)
+
+
+def match_span(kind: str, query, codec=None) -> int:
+    if kind == HEX_MATCH:
+        return len(hex_nibbles(query)) // 2 + 1
+    if kind == MASKED_MATCH:
+        return len(query.needle)
+    if kind == DISASSEMBLY_MATCH:
+        return codec.word_size
+    return len(query)
+
+
+def chunk_windows(offset: int, search_end: int, overlap: int, chunk_size: int) -> Iterator[tuple[int, int, int]]:
+    base = offset
+    while base <= search_end:
+        size = min(chunk_size + overlap, search_end - base + 1)
+        yield base, size, base + chunk_size
+        base += chunk_size
+
+
+def _disassembly_finder(needle: str, codec) -> ChunkFinder:
+    word_size = codec.word_size
+
+    def find(data: bytes, base: int, remaining: int | None) -> list[int]:
+        """With a result limit the chunk is disassembled in bounded slices so an early hit skips the rest."""
+        results: list[int] = []
+        step = len(data) if remaining is None else _limited_slice_bytes(word_size)
+        for start in range(0, len(data), max(1, step)):
+            lines = _disassembly_lines(codec, data[start:start + step], base + start)
+            for index, text in enumerate(lines):
+                if needle in text:
+                    results.append(base + start + index * word_size)
+                    if remaining is not None and len(results) >= remaining:
+                        return results
+        return results
+
+    return find
+
+
+def _limited_slice_bytes(word_size: int) -> int:
+    return max(word_size, BINARY_WORKBENCH_LIMITED_DISASSEMBLY_SEARCH_SLICE_BYTES // word_size * word_size)
+
+
+def _disassembly_lines(codec, data: bytes, base: int) -> list[str]:
+    try:
+        return [text.lower() for text in codec.disassemble_many(data, base)]
+    except Exception:
+        size = codec.word_size
+        return [
+            word_disassembly(codec, data[index:index + size], base + index)
+            for index in range(0, len(data) - size + 1, size)
+        ]
+
+
+def word_disassembly(codec, data: bytes, offset: int) -> str:
+    try:
+        return codec.disassemble(data, offset).lower()
+    except Exception:
+        return ""
+
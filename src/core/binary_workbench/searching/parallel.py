@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import mmap
+import os
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from threading import Lock
+
+from src.core.binary_workbench.byte_overlay_index import ByteOverlayIndex, byte_overlay_index
+from src.core.binary_workbench.codec_registry import binary_workbench_codec_for
+from src.core.binary_workbench.searching.matchers import (
+    DISASSEMBLY_MATCH,
+    chunk_finder,
+    chunk_windows,
+    match_span,
+)
+from src.core.binary_workbench.searching.progress import SearchBatch
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_PARALLEL_DISASSEMBLY_MIN_BYTES,
+    BINARY_WORKBENCH_PARALLEL_SEARCH_MIN_BYTES,
+    BINARY_WORKBENCH_SEARCH_CHUNK_SIZE,
+)
+from src.modules.contracts import CPUArchCodec
+
+SEARCH_WORKERS = max(1, min(8, (os.cpu_count() or 1) - 1))
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = Lock()
+_worker_codecs: dict[str, CPUArchCodec] = {}
+
+
+@dataclass(frozen=True)
+class ChunkSearchTask:
+    path: str
+    base: int
+    size: int
+    own_end: int
+    overlays: tuple[tuple[int, bytes], ...]
+    kind: str
+    query: object
+    codec_name: str
+    limit: int | None
+
+
+def parallel_search_path(reader, size: int, kind: str) -> Path | None:
+    path = getattr(reader, "path", None)
+    if path is None or SEARCH_WORKERS < 2:
+        return None
+    minimum = (
+        BINARY_WORKBENCH_PARALLEL_DISASSEMBLY_MIN_BYTES
+        if kind == DISASSEMBLY_MATCH
+        else BINARY_WORKBENCH_PARALLEL_SEARCH_MIN_BYTES
+    )
+    return path if size >= minimum else None
+
+
+def parallel_search_batches(
+    path: Path,
+    overlays: Mapping[int, bytes],
+    offset: int,
+    search_end: int,
+    kind: str,
+    query,
+    codec,
+    limit: int | None,
+    cancelled: Callable[[], bool] | None = None,
+) -> Iterator[SearchBatch]:
+    index = byte_overlay_index(overlays)
+    overlap = match_span(kind, query, codec) - 1
+    codec_name = codec.display_name if codec is not None else ""
+    windows = list(chunk_windows(offset, search_end, overlap, BINARY_WORKBENCH_SEARCH_CHUNK_SIZE))
+    tasks = (
+        _task(path, index, base, size, own_end, kind, query, codec_name, limit)
+        for base, size, own_end in windows
+    )
+    total = max(0, search_end - offset + 1)
+    count = 0
+    chunks = _chunk_results(tasks, search_pool())
+    try:
+        for (_, _, own_end), found in zip(windows, chunks):
+            if cancelled is not None and cancelled():
+                return
+            if limit is not None:
+                found = found[:limit - count]
+            count += len(found)
+            yield SearchBatch(tuple(found), min(own_end, search_end + 1) - offset, total)
+            if limit is not None and count >= limit:
+                return
+    finally:
+        chunks.close()
+
+
+def search_chunk(task: ChunkSearchTask) -> list[int]:
+    with open(task.path, "rb") as source:
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            data = mapping[task.base : task.base + task.size]
+    data = ByteOverlayIndex(dict(task.overlays)).apply(task.base, data)
+    codec = _worker_codec(task.codec_name) if task.kind == DISASSEMBLY_MATCH else None
+    found = chunk_finder(task.kind, task.query, codec)(data, task.base, task.limit)
+    return [match for match in found if match < task.own_end]
+
+
+def search_pool() -> ProcessPoolExecutor | None:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            try:
+                _pool = ProcessPoolExecutor(max_workers=SEARCH_WORKERS, mp_context=get_context("spawn"))
+            except (OSError, NotImplementedError, ImportError):
+                return None
+        return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _task(path, index: ByteOverlayIndex, base, size, own_end, kind, query, codec_name, limit) -> ChunkSearchTask:
+    return ChunkSearchTask(
+        str(path),
+        base,
+        size,
+        own_end,
+        tuple(index.intersecting(base, base + size)),
+        kind,
+        query,
+        codec_name,
+        limit,
+    )
+
+
+def _chunk_results(tasks: Iterator[ChunkSearchTask], pool: ProcessPoolExecutor | None) -> Iterator[list[int]]:
+    pending: deque[tuple[ChunkSearchTask, Future[list[int]] | None]] = deque()
+    try:
+        for task in tasks:
+            pending.append((task, _submit(pool, task)))
+            if len(pending) >= SEARCH_WORKERS * 2:
+                yield _chunk_result(*pending.popleft())
+        while pending:
+            yield _chunk_result(*pending.popleft())
+    finally:
+        for _, future in pending:
+            if future is not None:
+                future.cancel()
+
+
+def _submit(pool: ProcessPoolExecutor | None, task: ChunkSearchTask) -> Future[list[int]] | None:
+    if pool is None:
+        return None
+    try:
+        return pool.submit(search_chunk, task)
+    except (BrokenProcessPool, RuntimeError):
+        return None
+
+
+def _chunk_result(task: ChunkSearchTask, future: Future[list[int]] | None) -> list[int]:
+    if future is None:
+        return search_chunk(task)
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        _reset_pool()
+        return search_chunk(task)
+
+
+def _worker_codec(name: str) -> CPUArchCodec:
+    codec = _worker_codecs.get(name)
+    if codec is None:
+        codec = _worker_codecs[name] = binary_workbench_codec_for(name)
+    return codec
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import re
+import sys
+from array import array
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+
+from src.core.binary_workbench.searching.matchers import chunk_windows
+from src.core.binary_workbench.searching.progress import SearchBatch
+from src.core.binary_workbench.searching.sector_search import sector_image_reader, sector_search_mapper
+from src.core.binary_workbench.text_search import row_runs
+from src.modules.binary_workbench_constants import BINARY_WORKBENCH_SEARCH_CHUNK_SIZE
+from src.modules.binary_workbench_dtos import BinaryWorkbenchRowDTO
+
+POINTER_SIZE = 4
+POINTER_RANGE_SEPARATORS = re.compile(r"[\s\-]+")
+
+
+@dataclass(frozen=True)
+class PointerHit:
+    offset: int
+    value: int
+
+
+def pointer_range(query: str) -> tuple[int, int] | None:
+    pieces = [piece for piece in POINTER_RANGE_SEPARATORS.split(query.strip()) if piece]
+    if not 1 <= len(pieces) <= 2:
+        return None
+    try:
+        low, high = int(pieces[0], 16), int(pieces[-1], 16)
+    except ValueError:
+        return None
+    if not 0 <= low <= high <= 0xFFFFFFFF:
+        return None
+    return low, high
+
+
+def pointer_target(value: int, address_bases: Mapping[str, str]) -> int:
+    """File offset a pointer refers to, using the highest reference base at or below it."""
+    bases = [_base_value(base) for base in address_bases.values()]
+    return value - max((base for base in bases if base <= value), default=0)
+
+
+def find_pointers_in_data(data: bytes, base: int, low: int, high: int, limit: int | None = None) -> list[PointerHit]:
+    """
+    Aligned little-endian 32-bit words of ``data`` whose value is in ``low..high``.
+
+    The most significant byte of every word is pulled out as one strided
+    slice and classified with ``bytes.translate``, so only words whose top
+    byte can be in range are compared as ``array('I')`` values.
+    """
+    first = -base % POINTER_SIZE
+    count = max(0, (len(data) - first) // POINTER_SIZE)
+    if not count or low > high:
+        return []
+    words = array("I", data[first:first + count * POINTER_SIZE])
+    if sys.byteorder == "big":
+        words.byteswap()
+    top_bytes = data[first + POINTER_SIZE - 1::POINTER_SIZE][:count]
+    candidates = top_bytes.translate(_top_byte_table(low >> 24, high >> 24))
+    hits: list[PointerHit] = []
+    index = candidates.find(1)
+    while index >= 0:
+        value = words[index]
+        if low <= value <= high:
+            hits.append(PointerHit(base + first + index * POINTER_SIZE, value))
+            if limit is not None and len(hits) >= limit:
+                break
+        index = candidates.find(1, index + 1)
+    return hits
+
+
+def find_pointers_in_rows(
+    rows: list[BinaryWorkbenchRowDTO],
+    low: int,
+    high: int,
+    start_offset: int | None = None,
+    end_offset: int | None = None,
+    max_results: int | None = None,
+) -> list[PointerHit]:
+    hits: list[PointerHit] = []
+    for offset, data in row_runs(rows):
+        hits.extend(
+            hit
+            for hit in find_pointers_in_data(data, offset, low, high)
+            if (start_offset is None or hit.offset >= start_offset)
+            and (end_offset is None or hit.offset + POINTER_SIZE - 1 <= end_offset)
+        )
+        if max_results is not None and len(hits) >= max_results:
+            break
+    return hits[:max_results] if max_results is not None else hits
+
+
+def iter_reader_pointers(
+    reader,
+    overlays: Mapping[int, bytes],
+    low: int,
+    high: int,
+    address_bases: Mapping[str, str],
+    start,
+    end,
+    limit,
+    cancelled=None,
+) -> Iterator[SearchBatch]:
+    mapper = sector_search_mapper(reader)
+    if mapper is not None:
+        with sector_image_reader(mapper) as image_reader:
+            yield from iter_reader_pointers(image_reader, overlays, low, high, address_bases, start, end, limit, cancelled)
+        return
+    offset = max(0, start or 0)
+    search_end = reader.file_size - 1 if end is None else min(end, reader.file_size - 1)
+    total = max(0, search_end - offset + 1)
+    count = 0
+    for base, size, own_end in chunk_windows(offset, search_end, POINTER_SIZE - 1, BINARY_WORKBENCH_SEARCH_CHUNK_SIZE):
+        if cancelled is not None and cancelled():
+            return
+        data = reader.read_uncached(base, size, overlays)
+        remaining = None if limit is None else limit - count
+        hits = [hit for hit in find_pointers_in_data(data, base, low, high, remaining) if hit.offset < own_end]
+        count += len(hits)
+        yield SearchBatch(
+            tuple(hit.offset for hit in hits),
+            min(own_end, search_end + 1) - offset,
+            total,
+            targets=tuple(pointer_target(hit.value, address_bases) for hit in hits),
+        )
+        if limit is not None and count >= limit:
+            return
+
+
+def _top_byte_table(low: int, high: int) -> bytes:
+    return bytes(1 if low <= value <= high else 0 for value in range(256))
+
+
+def _base_value(text: str) -> int:
+    try:
+        return int(text, 0)
+    except ValueError:
+        return 0
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Generator, Iterable
+from dataclasses import dataclass
+from threading import Event
+
+from src.core.binary_workbench.multi_pattern_search import PatternMatch
+
+
+@dataclass(frozen=True)
+class SearchBatch:
+    offsets: tuple[int, ...]
+    scanned: int
+    total: int
+    matches: tuple[PatternMatch, ...] = ()
+    targets: tuple[int, ...] = ()
+
+
+class CancellationToken:
+    """Thread-safe cancel flag; calling the token returns whether it was cancelled."""
+
+    def __init__(self) -> None:
+        self._event = Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def __call__(self) -> bool:
+        return self._event.is_set()
+
+
+def drain_search(
+    batches: Generator[SearchBatch, None, list[int] | None] | Iterable[SearchBatch],
+    on_batch: Callable[[SearchBatch], None] | None = None,
+) -> list[int]:
+    found: list[int] = []
+    iterator = iter(batches)
+    while True:
+        try:
+            batch = next(iterator)
+        except StopIteration as stop:
+            return found if stop.value is None else stop.value
+        found.extend(batch.offsets)
+        if on_batch is not None:
+            on_batch(batch)
+
+
+def chunk_callback(on_chunk: Callable[[list[int]], None] | None) -> Callable[[SearchBatch], None] | None:
+    if on_chunk is None:
+        return None
+    return lambda batch: on_chunk(list(batch.offsets))
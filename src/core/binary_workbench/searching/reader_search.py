@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+
+from src.core.binary_workbench.multi_pattern_search import BytePatternAutomaton
+from src.core.binary_workbench.opcode_index import OpcodeIndex
+from src.core.binary_workbench.searching.pointer_scan import iter_reader_pointers, pointer_range
+from src.core.binary_workbench.searching.progress import SearchBatch
+from src.core.binary_workbench.searching.scanner import (
+    iter_reader_bytes,
+    iter_reader_hex,
+    iter_reader_instruction,
+    iter_reader_patterns,
+)
+from src.core.binary_workbench.searching.suffix_index import SuffixIndex
+from src.core.binary_workbench.text_search import ansi_text_bytes, hex_nibbles, search_list_needles
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_SEARCH_MODE_ASSEMBLY,
+    BINARY_WORKBENCH_SEARCH_MODE_DECODED_TEXT,
+    BINARY_WORKBENCH_SEARCH_MODE_HEX_BYTES,
+    BINARY_WORKBENCH_SEARCH_MODE_POINTERS,
+    BINARY_WORKBENCH_SEARCH_MODE_SEARCH_LIST,
+)
+
+
+def reader_search_batches(
+    reader,
+    codec,
+    overlays,
+    mode: str,
+    query: str,
+    start_offset=None,
+    end_offset=None,
+    max_results=None,
+    cancelled: Callable[[], bool] | None = None,
+    suffix_index_for: Callable[[], SuffixIndex | None] | None = None,
+    opcode_index_for: Callable[[], OpcodeIndex | None] | None = None,
+    address_bases: Mapping[str, str] | None = None,
+) -> Iterator[SearchBatch]:
+    """
+    Streams the matches of one Find-dialog ``mode`` over a file-backed reader.
+
+    Search lists report each offset once even when several needles match it;
+    pointer targets are resolved against ``address_bases``.
+    """
+    if mode == BINARY_WORKBENCH_SEARCH_MODE_HEX_BYTES:
+        needle = hex_nibbles(query)
+        if needle:
+            yield from iter_reader_hex(
+                reader,
+                overlays,
+                needle,
+                start_offset,
+                end_offset,
+                max_results,
+                cancelled,
+                suffix_index_for,
+            )
+    elif mode == BINARY_WORKBENCH_SEARCH_MODE_ASSEMBLY:
+        instruction = query.strip()
+        if instruction:
+            yield from iter_reader_instruction(
+                reader,
+                codec,
+                overlays,
+                instruction,
+                start_offset,
+                end_offset,
+                max_results,
+                cancelled,
+                opcode_index_for,
+            )
+    elif mode == BINARY_WORKBENCH_SEARCH_MODE_DECODED_TEXT:
+        needle = ansi_text_bytes(query.strip())
+        if needle:
+            yield from iter_reader_bytes(
+                reader,
+                overlays,
+                needle,
+                start_offset,
+                end_offset,
+                max_results,
+                cancelled,
+                suffix_index_for,
+            )
+    elif mode == BINARY_WORKBENCH_SEARCH_MODE_SEARCH_LIST:
+        automaton = BytePatternAutomaton(search_list_needles(query))
+        batches = iter_reader_patterns(reader, overlays, automaton, start_offset, end_offset, max_results, cancelled)
+        for batch in batches:
+            yield SearchBatch(tuple(dict.fromkeys(batch.offsets)), batch.scanned, batch.total, batch.matches)
+    elif mode == BINARY_WORKBENCH_SEARCH_MODE_POINTERS:
+        bounds = pointer_range(query)
+        if bounds is not None:
+            yield from iter_reader_pointers(
+                reader,
+                overlays,
+                *bounds,
+                address_bases or {},
+                start_offset,
+                end_offset,
+                max_results,
+                cancelled,
+            )
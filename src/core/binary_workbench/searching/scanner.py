@@ -1,62 +1,218 @@
 from __future__ import annotations
 
-from src.core.binary_workbench.masked_search import (
-    MaskedBytePattern,
-    find_masked_bytes_in_data,
-)
+from collections.abc import Callable, Iterator, Mapping
+
+from src.core.binary_workbench.byte_overlay_index import byte_overlay_index
+from src.core.binary_workbench.masked_search import MaskedBytePattern
 from src.core.binary_workbench.mips_r3000a.instruction_patterns import (
     mips_instruction_byte_pattern,
 )
-from src.core.binary_workbench.text_search import (
-    find_bytes_in_data,
-    find_hex_nibbles_in_data,
+from src.core.binary_workbench.multi_pattern_search import BytePatternAutomaton, PatternMatch
+from src.core.binary_workbench.opcode_index import OpcodeIndex
+from src.core.binary_workbench.searching.matchers import (
+    BYTES_MATCH,
+    DISASSEMBLY_MATCH,
+    HEX_MATCH,
+    MASKED_MATCH,
+    chunk_finder,
+    chunk_windows,
+    match_span,
+    word_disassembly,
 )
+from src.core.binary_workbench.searching.parallel import parallel_search_batches, parallel_search_path
+from src.core.binary_workbench.searching.progress import SearchBatch, chunk_callback, drain_search
+from src.core.binary_workbench.searching.sector_search import sector_image_reader, sector_search_mapper
+from src.core.binary_workbench.searching.suffix_index import SuffixIndex
+from src.core.binary_workbench.text_search import hex_nibble_patterns, hex_nibbles
 from src.modules.binary_workbench_constants import (
-    BINARY_WORKBENCH_FIND_MAX_LENGTH_BYTES,
+    BINARY_WORKBENCH_SEARCH_CHUNK_SIZE,
 )
 from src.modules.binary_workbench_dtos import BinaryWorkbenchRowDTO
 
 
-def find_reader_bytes(reader, overlays: dict[int, bytes], needle: bytes, start, end, limit, on_chunk=None) -> list[int]:
+def find_reader_bytes(
+    reader,
+    overlays: Mapping[int, bytes],
+    needle: bytes,
+    start,
+    end,
+    limit,
+    on_chunk=None,
+    cancelled=None,
+    suffix_index_for: Callable[[], SuffixIndex | None] | None = None,
+) -> list[int]:
+    batches = iter_reader_bytes(reader, overlays, needle, start, end, limit, cancelled, suffix_index_for)
+    return drain_search(batches, chunk_callback(on_chunk))
+
+
+def find_reader_hex(
+    reader,
+    overlays: Mapping[int, bytes],
+    needle: str,
+    start,
+    end,
+    limit,
+    on_chunk=None,
+    cancelled=None,
+    suffix_index_for: Callable[[], SuffixIndex | None] | None = None,
+) -> list[int]:
+    batches = iter_reader_hex(reader, overlays, needle, start, end, limit, cancelled, suffix_index_for)
+    return drain_search(batches, chunk_callback(on_chunk))
+
+
+def find_reader_instruction(
+    reader,
+    codec,
+    overlays,
+    query: str,
+    start,
+    end,
+    limit,
+    on_chunk=None,
+    cancelled=None,
+    opcode_index_for: Callable[[], OpcodeIndex | None] | None = None,
+) -> list[int]:
+    batches = iter_reader_instruction(reader, codec, overlays, query, start, end, limit, cancelled, opcode_index_for)
+    return drain_search(batches, chunk_callback(on_chunk))
+
+
+def find_reader_masked(reader, overlays: Mapping[int, bytes], pattern: MaskedBytePattern, start, end, limit, on_chunk=None, cancelled=None) -> list[int]:
+    return drain_search(iter_reader_masked(reader, overlays, pattern, start, end, limit, cancelled), chunk_callback(on_chunk))
+
+
+def find_reader_patterns(
+    reader,
+    overlays: Mapping[int, bytes],
+    automaton: BytePatternAutomaton,
+    start,
+    end,
+    limit,
+    on_chunk=None,
+    cancelled=None,
+) -> list[PatternMatch]:
+    results: list[PatternMatch] = []
+    for batch in iter_reader_patterns(reader, overlays, automaton, start, end, limit, cancelled):
+        results.extend(batch.matches)
+        if on_chunk is not None:
+            on_chunk(list(batch.offsets))
+    return results
+
+
+def iter_reader_bytes(
+    reader,
+    overlays: Mapping[int, bytes],
+    needle: bytes,
+    start,
+    end,
+    limit,
+    cancelled=None,
+    suffix_index_for: Callable[[], SuffixIndex | None] | None = None,
+) -> Iterator[SearchBatch]:
     if not needle:
-        return []
-    offset, search_end = _reader_range(reader, start, end)
-    if search_end < offset:
-        return []
-    one_shot = _single_read(reader, overlays, offset, search_end)
-    if one_shot is not None:
-        return find_bytes_in_data(one_shot, offset, needle, start, search_end, limit)
-    return []
+        return
+    patterns = (MaskedBytePattern(needle, b"\xFF" * len(needle)),)
+    results = _indexed_byte_search(reader, overlays, suffix_index_for, patterns, BYTES_MATCH, needle, start, end, limit)
+    if results is not None:
+        yield _whole_range_batch(reader, start, end, results)
+        return
+    yield from _stream_batches(reader, overlays, start, end, BYTES_MATCH, needle, None, limit, cancelled)
 
 
-def find_reader_hex(reader, overlays: dict[int, bytes], needle: str, start, end, limit, on_chunk=None) -> list[int]:
-    offset, search_end = _reader_range(reader, start, end)
-    if search_end < offset:
-        return []
-    one_shot = _single_read(reader, overlays, offset, search_end)
-    if one_shot is not None:
-        return find_hex_nibbles_in_data(one_shot, offset, needle, start, search_end, limit)
-    return []
+def iter_reader_hex(
+    reader,
+    overlays: Mapping[int, bytes],
+    needle: str,
+    start,
+    end,
+    limit,
+    cancelled=None,
+    suffix_index_for: Callable[[], SuffixIndex | None] | None = None,
+) -> Iterator[SearchBatch]:
+    if not hex_nibbles(needle):
+        return
+    patterns = hex_nibble_patterns(needle)
+    results = _indexed_byte_search(reader, overlays, suffix_index_for, patterns, HEX_MATCH, needle, start, end, limit)
+    if results is not None:
+        yield _whole_range_batch(reader, start, end, results)
+        return
+    yield from _stream_batches(reader, overlays, start, end, HEX_MATCH, needle, None, limit, cancelled)
 
 
-def find_reader_instruction(reader, codec, overlays, query: str, start, end, limit, on_chunk=None) -> list[int]:
+def iter_reader_instruction(
+    reader,
+    codec,
+    overlays,
+    query: str,
+    start,
+    end,
+    limit,
+    cancelled=None,
+    opcode_index_for: Callable[[], OpcodeIndex | None] | None = None,
+) -> Iterator[SearchBatch]:
     exact = codec.assemble(query, 0)
     if exact is not None and len(exact) == codec.word_size:
-        return find_reader_masked(reader, overlays, MaskedBytePattern(exact, b"\xFF" * len(exact), codec.word_size), start, end, limit, on_chunk)
+        pattern = MaskedBytePattern(exact, b"\xFF" * len(exact), codec.word_size)
+        yield from iter_reader_masked(reader, overlays, pattern, start, end, limit, cancelled)
+        return
     pattern = mips_instruction_byte_pattern(query)
     if pattern is not None:
-        return find_reader_masked(reader, overlays, pattern, start, end, limit, on_chunk)
-    return _find_reader_disassembly(reader, codec, overlays, query, start, end, limit, on_chunk)
+        yield from iter_reader_masked(reader, overlays, pattern, start, end, limit, cancelled)
+        return
+    aligned = _align(max(0, start or 0), codec.word_size)
+    opcode_index = None if opcode_index_for is None else opcode_index_for()
+    if opcode_index is not None and opcode_index.word_size == codec.word_size:
+        results = _indexed_disassembly_search(reader, codec, overlays, opcode_index, query, aligned, end, limit)
+        if results is not None:
+            yield _whole_range_batch(reader, aligned, end, results)
+            return
+    yield from _stream_batches(reader, overlays, aligned, end, DISASSEMBLY_MATCH, query, codec, limit, cancelled)
+
+
+def iter_reader_masked(
+    reader,
+    overlays: Mapping[int, bytes],
+    pattern: MaskedBytePattern,
+    start,
+    end,
+    limit,
+    cancelled=None,
+) -> Iterator[SearchBatch]:
+    return _stream_batches(reader, overlays, start, end, MASKED_MATCH, pattern, None, limit, cancelled)
 
 
-def find_reader_masked(reader, overlays: dict[int, bytes], pattern: MaskedBytePattern, start, end, limit, on_chunk=None) -> list[int]:
+def iter_reader_patterns(
+    reader,
+    overlays: Mapping[int, bytes],
+    automaton: BytePatternAutomaton,
+    start,
+    end,
+    limit,
+    cancelled=None,
+) -> Iterator[SearchBatch]:
+    if not automaton.max_length:
+        return
+    mapper = sector_search_mapper(reader)
+    if mapper is not None:
+        with sector_image_reader(mapper) as image_reader:
+            yield from iter_reader_patterns(image_reader, overlays, automaton, start, end, limit, cancelled)
+        return
     offset, search_end = _reader_range(reader, start, end)
-    if search_end < offset:
-        return []
-    one_shot = _single_read(reader, overlays, offset, search_end)
-    if one_shot is not None:
-        return find_masked_bytes_in_data(one_shot, offset, pattern, start, search_end, limit)
-    return []
+    total = max(0, search_end - offset + 1)
+    count = 0
+    overlap = automaton.max_length - 1
+    for base, size, own_end in chunk_windows(offset, search_end, overlap, BINARY_WORKBENCH_SEARCH_CHUNK_SIZE):
+        if cancelled is not None and cancelled():
+            return
+        data = reader.read_uncached(base, size, overlays)
+        remaining = None if limit is None else limit - count
+        found = [match for match in automaton.find(data, base, None, None, remaining) if match.offset < own_end]
+        if remaining is not None:
+            found = found[:remaining]
+        count += len(found)
+        scanned = min(own_end, search_end + 1) - offset
+        yield SearchBatch(tuple(match.offset for match in found), scanned, total, tuple(found))
+        if limit is not None and count >= limit:
+            return
 
 
 def effective_search_end(reader, rows: list[BinaryWorkbenchRowDTO], end_offset: int | None) -> int | None:
@@ -69,36 +225,101 @@ def effective_search_end(reader, rows: list[BinaryWorkbenchRowDTO], end_offset:
     return None if not row_ends else min(end_offset if end_offset is not None else max(row_ends), max(row_ends))
 
 
-def _find_reader_disassembly(reader, codec, overlays, query, start, end, limit, on_chunk) -> list[int]:
-    word_size = codec.word_size
-    offset = _align(max(0, start or 0), word_size)
-    search_end = _reader_range(reader, start, end)[1]
-    if search_end - offset + 1 < word_size:
+def _stream_batches(reader, overlays, start, end, kind: str, query, codec, limit, cancelled) -> Iterator[SearchBatch]:
+    mapper = sector_search_mapper(reader)
+    if mapper is not None:
+        with sector_image_reader(mapper) as image_reader:
+            yield from _stream_batches(image_reader, overlays, start, end, kind, query, codec, limit, cancelled)
+        return
+    offset, search_end = _reader_range(reader, start, end)
+    path = parallel_search_path(reader, search_end - offset + 1, kind)
+    if path is not None:
+        yield from parallel_search_batches(path, overlays, offset, search_end, kind, query, codec, limit, cancelled)
+        return
+    find = chunk_finder(kind, query, codec)
+    overlap = match_span(kind, query, codec) - 1
+    total = max(0, search_end - offset + 1)
+    count = 0
+    for base, size, own_end in chunk_windows(offset, search_end, overlap, BINARY_WORKBENCH_SEARCH_CHUNK_SIZE):
+        if cancelled is not None and cancelled():
+            return
+        data = reader.read_uncached(base, size, overlays)
+        remaining = None if limit is None else limit - count
+        found = [match for match in find(data, base, remaining) if match < own_end]
+        if remaining is not None:
+            found = found[:remaining]
+        count += len(found)
+        yield SearchBatch(tuple(found), min(own_end, search_end + 1) - offset, total)
+        if limit is not None and count >= limit:
+            return
+
+
+def _whole_range_batch(reader, start, end, results: list[int]) -> SearchBatch:
+    offset, search_end = _reader_range(reader, start, end)
+    total = max(0, search_end - offset + 1)
+    return SearchBatch(tuple(results), total, total)
+
+
+def _indexed_byte_search(
+    reader,
+    overlays,
+    suffix_index_for,
+    patterns: tuple[MaskedBytePattern, ...],
+    kind: str,
+    query,
+    start,
+    end,
+    limit,
+) -> list[int] | None:
+    index = None if suffix_index_for is None else suffix_index_for()
+    if index is None:
+        return None
+    offset, search_end = _reader_range(reader, start, end)
+    if search_end < offset:
         return []
-    one_shot = _single_read(reader, overlays, offset, search_end)
-    data_chunks = [(offset, one_shot)] if one_shot is not None else []
-    results: list[int] = []
-    for base, data in data_chunks:
-        for index in range(0, max(0, len(data) - word_size + 1), word_size):
-            candidate = base + index
-            if query.lower() in _safe_disassemble(codec, data[index:index + word_size], candidate):
-                results.append(candidate)
-                if limit is not None and len(results) >= limit:
-                    return results
-    return results
+    patches = byte_overlay_index(overlays)
+    found: set[int] = set()
+    for pattern in patterns:
+        hits = index.find(pattern, offset, search_end)
+        if hits is None:
+            return None
+        found.update(hit for hit in hits if not patches.touches(hit, hit + len(pattern.needle)))
+    span = match_span(kind, query)
+    find = chunk_finder(kind, query)
+    for patch_offset, data in patches.intersecting(offset, search_end + 1):
+        window_start = max(offset, patch_offset - span + 1)
+        window_end = min(search_end, patch_offset + len(data) + span - 2)
+        window = reader.read_uncached(window_start, window_end - window_start + 1, overlays)
+        found.update(find(window, window_start, None))
+    results = sorted(found)
+    return results if limit is None else results[:limit]
 
 
-def _single_read(reader, overlays, offset: int, search_end: int) -> bytes | None:
-    size = search_end - offset + 1
-    if size <= 0 or size > BINARY_WORKBENCH_FIND_MAX_LENGTH_BYTES:
+def _indexed_disassembly_search(reader, codec, overlays, opcode_index: OpcodeIndex, query: str, start, end, limit) -> list[int] | None:
+    offset, search_end = _reader_range(reader, start, end)
+    candidates = opcode_index.candidate_offsets(query, offset, search_end)
+    if candidates is None:
         return None
-    return reader.read_uncached(offset, size, overlays)
+    word_size = codec.word_size
+    patched = {
+        word
+        for patch_offset, data in byte_overlay_index(overlays).intersecting(offset, search_end + 1)
+        for word in range(patch_offset - patch_offset % word_size, patch_offset + len(data), word_size)
+        if offset <= word and word + word_size - 1 <= search_end
+    }
+    needle = query.lower()
+    results: list[int] = []
+    for candidate in sorted(patched.union(candidates)) if patched else candidates:
+        if needle in word_disassembly(codec, reader.read(candidate, word_size, overlays), candidate):
+            results.append(candidate)
+            if limit is not None and len(results) >= limit:
+                break
+    return results
 
 
 def _reader_range(reader, start, end) -> tuple[int, int]:
     offset = max(0, start or 0)
-    requested_end = reader.file_size - 1 if end is None else min(end, reader.file_size - 1)
-    search_end = min(requested_end, offset + BINARY_WORKBENCH_FIND_MAX_LENGTH_BYTES - 1)
+    search_end = reader.file_size - 1 if end is None else min(end, reader.file_size - 1)
     return offset, search_end
 
 
@@ -114,9 +335,3 @@ def _align(offset: int, word_size: int) -> int:
     remainder = offset % word_size
     return offset if remainder == 0 else offset + word_size - remainder
 
-
-def _safe_disassemble(codec, data: bytes, offset: int) -> str:
-    try:
-        return codec.disassemble(data, offset).lower()
-    except Exception:
-        return ""
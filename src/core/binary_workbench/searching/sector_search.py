@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import mmap
+from bisect import bisect_right
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TypeVar
+
+from src.core.binary_workbench.byte_overlay_index import byte_overlay_index
+from src.core.binary_workbench.internal_file_region import InternalFileRegion
+from src.core.binary_workbench.internal_offset_mapper import InternalOffsetMapper, InternalToBinaryChunk
+
+T = TypeVar("T")
+
+
+class SectorImageReader:
+    """
+    Reads an internal file straight from a memory-mapped raw image.
+
+    Windows are gathered from the user-data spans of their sectors, so sync,
+    header, EDC and ECC bytes never reach a matcher and offsets stay internal.
+    """
+
+    def __init__(self, image: mmap.mmap, chunks: list[InternalToBinaryChunk]) -> None:
+        self._image = image
+        self._chunks = chunks
+        self._starts = [chunk.internal_offset for chunk in chunks]
+        self.file_size = chunks[-1].internal_offset + chunks[-1].size if chunks else 0
+
+    def read_uncached(self, offset: int, size: int, overlay: Mapping[int, bytes] | None = None) -> bytes:
+        start = max(0, offset)
+        stop = min(self.file_size, start + max(0, size))
+        parts: list[bytes] = []
+        index = max(0, bisect_right(self._starts, start) - 1)
+        cursor = start
+        while cursor < stop and index < len(self._chunks):
+            chunk = self._chunks[index]
+            relative = cursor - chunk.internal_offset
+            take = min(stop - cursor, chunk.size - relative)
+            if take > 0:
+                binary = chunk.binary_offset + relative
+                parts.append(self._image[binary:binary + take])
+                cursor += take
+            index += 1
+        return byte_overlay_index(overlay).apply(start, b"".join(parts))
+
+    read = read_uncached
+
+
+def sector_search_mapper(reader) -> InternalOffsetMapper | None:
+    mapper = getattr(reader, "mapper", None)
+    return mapper if isinstance(mapper, InternalOffsetMapper) else None
+
+
+@contextmanager
+def sector_image_reader(mapper: InternalOffsetMapper) -> Iterator[SectorImageReader]:
+    with open(mapper.region.source_path, "rb") as source:
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as image:
+            yield SectorImageReader(image, mapper.sector_chunks(image))
+
+
+def search_internal_files(
+    source_path: Path,
+    regions: list[InternalFileRegion],
+    search: Callable[[SectorImageReader], T],
+    cancelled: Callable[[], bool] | None = None,
+) -> dict[InternalFileRegion, T]:
+    """Run ``search`` over several internal files of one image in a single pass, in LBA order."""
+    results: dict[InternalFileRegion, T] = {}
+    with open(source_path, "rb") as source:
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as image:
+            for region in sorted(regions, key=lambda item: item.start_lba):
+                if cancelled is not None and cancelled():
+                    break
+                chunks = InternalOffsetMapper(region).sector_chunks(image)
+                results[region] = search(SectorImageReader(image, chunks))
+    return results
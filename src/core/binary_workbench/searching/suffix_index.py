@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from pathlib import Path
+from threading import Lock, Thread
+from uuid import uuid4
+
+from src.core.binary_workbench.masked_search import MaskedBytePattern
+from src.core.binary_workbench.resource_identity import SourceFileIdentity, source_file_identity
+from src.core.binary_workbench.searching.parallel import SEARCH_WORKERS, search_pool
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_SUFFIX_INDEX_KEY_BYTES,
+    BINARY_WORKBENCH_SUFFIX_INDEX_MAX_HITS,
+    BINARY_WORKBENCH_SUFFIX_INDEX_RUN_SIZE,
+)
+
+SUFFIX_INDEX_SCHEMA = 1
+SUFFIX_INDEX_MAGIC = b"NCSUFIX\n"
+SUFFIX_INDEX_SUFFIX = ".sufidx"
+SUFFIX_INDEX_MAX_SOURCE_BYTES = 0xFFFFFFFF
+
+
+class SuffixIndex:
+    """
+    Partitioned suffix array of an unmodified source file.
+
+    The file is split into runs of ``run_size`` positions and each run is
+    sorted by the first ``key_bytes`` bytes of its suffixes, so a lookup is
+    two binary searches per run. Needles longer than the key are matched on
+    their first ``key_bytes`` bytes and confirmed against the source.
+    """
+
+    def __init__(
+        self,
+        identity: SourceFileIdentity,
+        index_path: Path,
+        run_size: int,
+        key_bytes: int,
+        data_offset: int,
+    ) -> None:
+        self.identity = identity
+        self.index_path = index_path
+        self.run_size = run_size
+        self.key_bytes = key_bytes
+        self._data_offset = data_offset
+
+    @property
+    def size_bytes(self) -> int:
+        try:
+            return self.index_path.stat().st_size
+        except OSError:
+            return 0
+
+    def find(
+        self,
+        pattern: MaskedBytePattern,
+        start: int,
+        end: int,
+        max_hits: int = BINARY_WORKBENCH_SUFFIX_INDEX_MAX_HITS,
+    ) -> list[int] | None:
+        core_start, core = _pattern_core(pattern)
+        if not core:
+            return None
+        try:
+            with open(self.identity.path, "rb") as source, open(self.index_path, "rb") as index_file:
+                with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    with mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ) as postings:
+                        positions = self._positions(data, postings, core[:self.key_bytes], max_hits)
+                        if positions is None:
+                            return None
+                        exact = len(core) == len(pattern.needle) <= self.key_bytes
+                        return sorted(
+                            offset
+                            for offset in (position - core_start for position in positions)
+                            if start <= offset
+                            and offset + len(pattern.needle) - 1 <= end
+                            and offset % max(1, pattern.alignment) == 0
+                            and (exact or _masked_at(data, offset, pattern))
+                        )
+        except (OSError, ValueError):
+            return None
+
+    def _positions(self, data: mmap.mmap, postings: mmap.mmap, probe: bytes, max_hits: int) -> list[int] | None:
+        with memoryview(postings) as view:
+            entries = view[self._data_offset:].cast("I")
+            try:
+                found: list[int] = []
+                width = len(probe)
+                for run_start in range(0, self.identity.size, self.run_size):
+                    run = entries[run_start:min(self.identity.size, run_start + self.run_size)]
+                    low = bisect_left(run, probe, key=lambda position: data[position:position + width])
+                    high = bisect_right(run, probe, low, key=lambda position: data[position:position + width])
+                    if len(found) + high - low > max_hits:
+                        run.release()
+                        return None
+                    found.extend(run[low:high].tolist())
+                    run.release()
+                return found
+            finally:
+                entries.release()
+
+
+class SuffixIndexStore:
+    """
+    Optional on-disk suffix indexes keyed by source path, size and
+    modification time. Builds only start through ``build``.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._indexes: dict[SourceFileIdentity, SuffixIndex] = {}
+        self._builds: dict[SourceFileIdentity, tuple[Future[SuffixIndex | None], list[float]]] = {}
+        self._lock = Lock()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def index_for(self, path: Path) -> SuffixIndex | None:
+        identity = source_file_identity(path)
+        with self._lock:
+            index = self._indexes.get(identity)
+        if index is not None:
+            return index
+        index = load_suffix_index(self._file_for(identity), identity)
+        if index is not None:
+            with self._lock:
+                self._indexes[identity] = index
+        return index
+
+    def progress(self, path: Path) -> float | None:
+        with self._lock:
+            build = self._builds.get(source_file_identity(path))
+        return None if build is None else build[1][0]
+
+    def build(self, path: Path) -> Future[SuffixIndex | None]:
+        identity = source_file_identity(path)
+        future: Future[SuffixIndex | None] = Future()
+        if not 0 < identity.size <= SUFFIX_INDEX_MAX_SOURCE_BYTES:
+            future.set_result(None)
+            return future
+        with self._lock:
+            running = self._builds.get(identity)
+            if running is not None:
+                return running[0]
+            progress = [0.0]
+            self._builds[identity] = (future, progress)
+        Thread(target=self._run_build, args=(identity, future, progress), daemon=True).start()
+        return future
+
+    def _run_build(self, identity: SourceFileIdentity, future: Future[SuffixIndex | None], progress: list[float]) -> None:
+        def report(value: float) -> None:
+            progress[0] = value
+
+        try:
+            index = build_suffix_index(Path(identity.path), self._file_for(identity), report)
+            if index is not None and index.identity == identity:
+                with self._lock:
+                    self._indexes[identity] = index
+            future.set_result(index)
+        except Exception as error:
+            future.set_exception(error)
+        finally:
+            with self._lock:
+                self._builds.pop(identity, None)
+
+    def _file_for(self, identity: SourceFileIdentity) -> Path:
+        name = f"{identity.path}|{identity.size}|{identity.modified_ns}"
+        return self._directory / f"{hashlib.sha1(name.encode('utf-8')).hexdigest()}{SUFFIX_INDEX_SUFFIX}"
+
+
+def build_suffix_index(
+    source: Path,
+    target: Path,
+    progress: Callable[[float], None] | None = None,
+    cancelled: Callable[[], bool] | None = None,
+    run_size: int = BINARY_WORKBENCH_SUFFIX_INDEX_RUN_SIZE,
+    key_bytes: int = BINARY_WORKBENCH_SUFFIX_INDEX_KEY_BYTES,
+) -> SuffixIndex | None:
+    identity = source_file_identity(source)
+    if not 0 < identity.size <= SUFFIX_INDEX_MAX_SOURCE_BYTES:
+        return None
+    header = json.dumps(
+        {
+            "schema_version": SUFFIX_INDEX_SCHEMA,
+            "byteorder": sys.byteorder,
+            "identity": [identity.path, identity.size, identity.modified_ns],
+            "run_size": run_size,
+            "key_bytes": key_bytes,
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+    header += b" " * (-(len(SUFFIX_INDEX_MAGIC) + 4 + len(header)) % 4)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temporary = target.with_name(f".{target.name}.{uuid4().hex}.tmp")
+    try:
+        with open(temporary, "wb") as output:
+            output.write(SUFFIX_INDEX_MAGIC)
+            output.write(len(header).to_bytes(4, "little"))
+            output.write(header)
+            runs = _sorted_runs(identity.path, identity.size, run_size, key_bytes)
+            try:
+                for done, run in enumerate(runs, start=1):
+                    if cancelled is not None and cancelled():
+                        return None
+                    output.write(run)
+                    if progress is not None:
+                        progress(min(1.0, done * run_size / identity.size))
+            finally:
+                runs.close()
+        temporary.replace(target)
+    finally:
+        with suppress(OSError):
+            if temporary.exists():
+                temporary.unlink()
+    return load_suffix_index(target, identity)
+
+
+def load_suffix_index(path: Path, identity: SourceFileIdentity) -> SuffixIndex | None:
+    try:
+        with open(path, "rb") as source:
+            if source.read(len(SUFFIX_INDEX_MAGIC)) != SUFFIX_INDEX_MAGIC:
+                return None
+            length = int.from_bytes(source.read(4), "little")
+            header = json.loads(source.read(length).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(header, dict)
+        or header.get("schema_version") != SUFFIX_INDEX_SCHEMA
+        or header.get("byteorder") != sys.byteorder
+        or header.get("identity") != [identity.path, identity.size, identity.modified_ns]
+    ):
+        return None
+    data_offset = len(SUFFIX_INDEX_MAGIC) + 4 + length
+    try:
+        if path.stat().st_size != data_offset + identity.size * 4:
+            return None
+        return SuffixIndex(identity, path, int(header["run_size"]), int(header["key_bytes"]), data_offset)
+    except (OSError, KeyError, TypeError, ValueError):
+        return None
+
+
+def sort_suffix_run(path: str, start: int, stop: int, key_bytes: int) -> bytes:
+    with open(path, "rb") as source:
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            ordered = sorted(range(start, stop), key=lambda position: data[position:position + key_bytes])
+    return array("I", ordered).tobytes()
+
+
+def _sorted_runs(path: str, size: int, run_size: int, key_bytes: int) -> Iterator[bytes]:
+    pool = search_pool()
+    pending: deque[tuple[tuple[str, int, int, int], Future[bytes] | None]] = deque()
+    try:
+        for start in range(0, size, run_size):
+            task = (path, start, min(size, start + run_size), key_bytes)
+            pending.append((task, _submit_run(pool, task)))
+            if len(pending) >= SEARCH_WORKERS:
+                yield _run_result(*pending.popleft())
+        while pending:
+            yield _run_result(*pending.popleft())
+    finally:
+        for _, future in pending:
+            if future is not None:
+                future.cancel()
+
+
+def _submit_run(pool, task: tuple[str, int, int, int]) -> Future[bytes] | None:
+    if pool is None or SEARCH_WORKERS < 2:
+        return None
+    try:
+        return pool.submit(sort_suffix_run, *task)
+    except (BrokenProcessPool, RuntimeError):
+        return None
+
+
+def _run_result(task: tuple[str, int, int, int], future: Future[bytes] | None) -> bytes:
+    if future is not None:
+        with suppress(BrokenProcessPool):
+            return future.result()
+    return sort_suffix_run(*task)
+
+
+def _pattern_core(pattern: MaskedBytePattern) -> tuple[int, bytes]:
+    best_start = best_end = run_start = 0
+    for index, value in enumerate(pattern.mask):
+        if value != 0xFF:
+            run_start = index + 1
+        elif index + 1 - run_start > best_end - best_start:
+            best_start, best_end = run_start, index + 1
+    return best_start, pattern.needle[best_start:best_end]
+
+
+def _masked_at(data: mmap.mmap, offset: int, pattern: MaskedBytePattern) -> bool:
+    window = data[offset:offset + len(pattern.needle)]
+    return len(window) == len(pattern.needle) and all(
+        value & mask == expected & mask for value, mask, expected in zip(window, pattern.mask, pattern.needle)
+    )
@@ -11,6 +11,7 @@ from src.core.binary_workbench.text_search import (
     ansi_text_bytes,
     find_hex_nibbles_in_data,
     hex_nibbles,
+    search_list_needles,
 )
 
 
@@ -31,6 +32,10 @@ def offset_matches_decoded_text(read_bytes, query: str, offset: int) -> bool:
     return offset_matches_bytes(read_bytes, ansi_text_bytes(query.strip()), offset)
 
 
+def offset_matches_search_list(read_bytes, query: str, offset: int) -> bool:
+    return any(offset_matches_bytes(read_bytes, needle, offset) for needle in search_list_needles(query))
+
+
 def offset_matches_instruction(read_bytes, codec, query: str, offset: int) -> bool:
     exact = codec.assemble(query, 0)
     if exact is not None and len(exact) == codec.word_size:
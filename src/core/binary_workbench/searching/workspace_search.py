@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_WORKSPACE_SEARCH_POLL_SECONDS,
+    BINARY_WORKBENCH_WORKSPACE_SEARCH_WORKERS,
+)
+
+SearchJob = Callable[[Callable[[], bool] | None], list[int]]
+
+
+@dataclass(frozen=True)
+class WorkspaceSearchTarget:
+    key: str
+    label: str
+    run: SearchJob
+
+
+@dataclass(frozen=True)
+class WorkspaceSearchResult:
+    key: str
+    label: str
+    offsets: tuple[int, ...]
+    error: str = ""
+
+
+def search_workspace(
+    targets: list[WorkspaceSearchTarget],
+    cancelled: Callable[[], bool] | None = None,
+    max_workers: int = BINARY_WORKBENCH_WORKSPACE_SEARCH_WORKERS,
+    idle: Callable[[], None] | None = None,
+) -> Iterator[WorkspaceSearchResult]:
+    """
+    Run one search per target on a thread pool and yield results in target order.
+
+    Each job streams its own reader; large file-backed scans still fan out to
+    the search process pool, so the threads mostly wait on I/O and workers.
+    While a job is still running, ``idle`` is called every poll interval and
+    cancellation is checked, so the caller's event loop keeps turning. A job
+    that raises yields an empty result carrying the error instead of ending
+    the whole search.
+    """
+    if not targets:
+        return
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets))))
+    futures: list[Future[list[int]]] = [executor.submit(target.run, cancelled) for target in targets]
+    try:
+        for target, future in zip(targets, futures):
+            while not future.done():
+                if cancelled is not None and cancelled():
+                    return
+                if idle is not None:
+                    idle()
+                wait((future,), timeout=BINARY_WORKBENCH_WORKSPACE_SEARCH_POLL_SECONDS)
+            if cancelled is not None and cancelled():
+                return
+            try:
+                offsets, error = future.result(), ""
+            except Exception as exc:
+                offsets, error = [], str(exc) or type(exc).__name__
+            yield WorkspaceSearchResult(target.key, target.label, tuple(offsets), error)
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import sys
+from array import array
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import uuid4
+
+from src.core.binary_workbench.internal_file_region import InternalFileRegion
+from src.core.binary_workbench.resource_identity import source_file_identity
+
+SECTOR_MAP_SCHEMA = 1
+SECTOR_MAP_MAGIC = b"NCSECMAP"
+SECTOR_MAP_SUFFIX = ".secmap"
+SECTOR_MAP_FINGERPRINT_BYTES = 64 * 1024
+# One byte per sector: the offset of user data inside the raw sector.
+SECTOR_DATA_OFFSETS = (0, 16, 24)
+
+
+@dataclass(frozen=True)
+class SectorMap:
+    """Complete span columns of a region, as ``InternalOffsetMapper`` stores them."""
+
+    internal_starts: array
+    binary_starts: array
+    data_sizes: array
+
+    @property
+    def logical_size(self) -> int:
+        return self.internal_starts[-1] + self.data_sizes[-1] if self.internal_starts else 0
+
+
+class SectorMapStore:
+    """
+    Sector layouts of internal file regions, persisted beside the workspace.
+
+    A sidecar holds the internal start of every sector plus one byte naming
+    its data offset, and is keyed by the source size, modification time, a
+    hash of the image head and tail, and the region's LBA range.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def load(self, region: InternalFileRegion) -> SectorMap | None:
+        path = self._file_for(region)
+        try:
+            with open(path, "rb") as source, mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                if view[:len(SECTOR_MAP_MAGIC)] != SECTOR_MAP_MAGIC:
+                    return None
+                header_start = len(SECTOR_MAP_MAGIC) + 4
+                header_end = header_start + int.from_bytes(view[len(SECTOR_MAP_MAGIC):header_start], "little")
+                header = json.loads(view[header_start:header_end].decode("utf-8"))
+                if header != self._header(region, int(header.get("sectors", -1))):
+                    return None
+                return _sector_map(region, view, header_end, int(header["sectors"]))
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            return None
+
+    def save(self, region: InternalFileRegion, sector_map: SectorMap) -> None:
+        count = len(sector_map.internal_starts)
+        offsets = bytes(
+            SECTOR_DATA_OFFSETS.index(binary_start - (region.start_lba + index) * region.sector_size)
+            for index, binary_start in enumerate(sector_map.binary_starts)
+        )
+        starts = array("q", sector_map.internal_starts)
+        starts.append(sector_map.logical_size)
+        header = json.dumps(self._header(region, count)).encode("utf-8")
+        path = self._file_for(region)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        try:
+            with open(temporary, "wb") as target:
+                target.write(SECTOR_MAP_MAGIC)
+                target.write(len(header).to_bytes(4, "little"))
+                target.write(header)
+                starts.tofile(target)
+                target.write(offsets)
+            temporary.replace(path)
+        finally:
+            with suppress(OSError):
+                if temporary.exists():
+                    temporary.unlink()
+
+    def _header(self, region: InternalFileRegion, sectors: int) -> dict:
+        identity = source_file_identity(region.source_path)
+        return {
+            "schema_version": SECTOR_MAP_SCHEMA,
+            "byteorder": sys.byteorder,
+            "identity": [identity.path, identity.size, identity.modified_ns, _fingerprint(region.source_path)],
+            "lba": [region.start_lba, region.end_lba, region.sector_size, region.size],
+            "sectors": sectors,
+        }
+
+    def _file_for(self, region: InternalFileRegion) -> Path:
+        source = source_file_identity(region.source_path).path
+        name = f"{source}|{region.start_lba}|{region.end_lba}|{region.sector_size}"
+        return self._directory / f"{hashlib.sha1(name.encode('utf-8')).hexdigest()}{SECTOR_MAP_SUFFIX}"
+
+
+def _sector_map(region: InternalFileRegion, view: mmap.mmap, start: int, count: int) -> SectorMap | None:
+    if count != region.sector_count:
+        return None
+    starts_end = start + (count + 1) * 8
+    starts = array("q")
+    starts.frombytes(view[start:starts_end])
+    offsets = view[starts_end:starts_end + count]
+    if len(offsets) != count:
+        return None
+    first_sector = region.start_lba * region.sector_size
+    binary_starts = array(
+        "q",
+        (first_sector + index * region.sector_size + SECTOR_DATA_OFFSETS[code] for index, code in enumerate(offsets)),
+    )
+    data_sizes = array("q", (starts[index + 1] - starts[index] for index in range(count)))
+    del starts[count]
+    return SectorMap(starts, binary_starts, data_sizes)
+
+
+def _fingerprint(path: Path) -> str:
+    digest = hashlib.sha1()
+    with suppress(OSError), open(path, "rb") as source:
+        digest.update(source.read(SECTOR_MAP_FINGERPRINT_BYTES))
+        source.seek(0, 2)
+        source.seek(max(0, source.tell() - SECTOR_MAP_FINGERPRINT_BYTES))
+        digest.update(source.read(SECTOR_MAP_FINGERPRINT_BYTES))
+    return digest.hexdigest()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import mmap
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.core.binary_workbench.internal_file_region import define_internal_file_region
+from src.core.binary_workbench.psx_sector_io import (
+    SECTOR_WORKERS,
+    expected_sector_codes,
+    reset_sector_pool,
+    sector_pool,
+)
+from src.core.binary_workbench.psx_sector_layout import (
+    RAW_SECTOR_SIZE,
+    SECTOR_LAYOUT_PREFIX_SIZE,
+    sector_layout,
+)
+from src.modules.binary_workbench_constants import BINARY_WORKBENCH_SECTOR_BATCH_SECTORS
+from src.modules.binary_workbench_dtos import BinaryWorkbenchInternalFileDTO
+
+# (EDC field, ECC field) per (mode, form); Mode 1 ECC includes its eight zero bytes.
+SECTOR_CODE_FIELDS = {
+    (1, 1): ((2064, 2068), (2068, RAW_SECTOR_SIZE)),
+    (2, 1): ((2072, 2076), (2076, RAW_SECTOR_SIZE)),
+    (2, 2): ((2348, RAW_SECTOR_SIZE), None),
+}
+FORM2_EDC_UNUSED = b"\x00" * 4
+
+
+@dataclass(frozen=True)
+class SectorFault:
+    sector_index: int
+    mode: int
+    form: int
+    edc_valid: bool
+    ecc_valid: bool
+    internal_file: str = ""
+
+
+@dataclass(frozen=True)
+class SectorVerifyBatch:
+    faults: tuple[SectorFault, ...]
+    scanned: int
+    total: int
+
+
+@dataclass(frozen=True)
+class SectorVerifyTask:
+    path: str
+    first_sector: int
+    count: int
+
+
+def verify_sector_image(
+    path: Path,
+    internal_files: Sequence[BinaryWorkbenchInternalFileDTO] = (),
+    cancelled: Callable[[], bool] | None = None,
+) -> Iterator[SectorVerifyBatch]:
+    """
+    Checks the EDC and ECC of every Mode 1, Mode 2 Form 1 and Form 2 sector of a raw image.
+
+    Batches of ``BINARY_WORKBENCH_SECTOR_BATCH_SECTORS`` sectors are
+    memory-mapped and checked by the sector pool, falling back to this
+    process. Faults name the internal file whose region holds the sector.
+    Form 2 sectors with an all-zero EDC are valid, as the field is optional.
+    """
+    total = path.stat().st_size // RAW_SECTOR_SIZE
+    owners = _sector_owners(path, internal_files)
+    tasks = (
+        SectorVerifyTask(str(path), first, min(BINARY_WORKBENCH_SECTOR_BATCH_SECTORS, total - first))
+        for first in range(0, total, BINARY_WORKBENCH_SECTOR_BATCH_SECTORS)
+    )
+    results = _task_results(tasks, sector_pool() if total > BINARY_WORKBENCH_SECTOR_BATCH_SECTORS else None)
+    try:
+        for task, faults in results:
+            if cancelled is not None and cancelled():
+                return
+            yield SectorVerifyBatch(
+                tuple(
+                    SectorFault(index, mode, form, edc_valid, ecc_valid, owners(index))
+                    for index, mode, form, edc_valid, ecc_valid in faults
+                ),
+                task.first_sector + task.count,
+                total,
+            )
+    finally:
+        results.close()
+
+
+def verify_sector_chunk(task: SectorVerifyTask) -> list[tuple[int, int, int, bool, bool]]:
+    with open(task.path, "rb") as source:
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            start = task.first_sector * RAW_SECTOR_SIZE
+            data = mapping[start:start + task.count * RAW_SECTOR_SIZE]
+    return sector_faults(data, task.first_sector)
+
+
+def sector_faults(data: bytes, first_index: int) -> list[tuple[int, int, int, bool, bool]]:
+    """``(sector_index, mode, form, edc_valid, ecc_valid)`` of every sector in ``data`` whose codes do not match."""
+    expected = expected_sector_codes(data)
+    if expected == data:
+        return []
+    faults: list[tuple[int, int, int, bool, bool]] = []
+    for offset in range(0, len(data) - RAW_SECTOR_SIZE + 1, RAW_SECTOR_SIZE):
+        if expected[offset:offset + RAW_SECTOR_SIZE] == data[offset:offset + RAW_SECTOR_SIZE]:
+            continue
+        layout = sector_layout(data[offset:offset + SECTOR_LAYOUT_PREFIX_SIZE], RAW_SECTOR_SIZE, RAW_SECTOR_SIZE)
+        (edc_start, edc_end), ecc_field = SECTOR_CODE_FIELDS[(layout.mode, layout.form)]
+        actual_edc = data[offset + edc_start:offset + edc_end]
+        edc_valid = actual_edc == expected[offset + edc_start:offset + edc_end] or (
+            layout.form == 2 and actual_edc == FORM2_EDC_UNUSED
+        )
+        ecc_valid = ecc_field is None or (
+            data[offset + ecc_field[0]:offset + ecc_field[1]] == expected[offset + ecc_field[0]:offset + ecc_field[1]]
+        )
+        if not (edc_valid and ecc_valid):
+            faults.append((first_index + offset // RAW_SECTOR_SIZE, layout.mode, layout.form, edc_valid, ecc_valid))
+    return faults
+
+
+def _sector_owners(path: Path, internal_files: Sequence[BinaryWorkbenchInternalFileDTO]) -> Callable[[int], str]:
+    files = list(internal_files)
+    regions: list[tuple[int, int, str]] = []
+    for item in files:
+        region = define_internal_file_region(path, item, files, RAW_SECTOR_SIZE)
+        regions.append((region.start_lba, region.end_lba, item.name))
+    regions.sort()
+    starts = [start for start, _, _ in regions]
+
+    def owner(sector_index: int) -> str:
+        position = bisect_right(starts, sector_index) - 1
+        if position < 0:
+            return ""
+        _, end, name = regions[position]
+        return name if sector_index < end else ""
+
+    return owner
+
+
+def _task_results(
+    tasks: Iterator[SectorVerifyTask],
+    pool: ProcessPoolExecutor | None,
+) -> Iterator[tuple[SectorVerifyTask, list[tuple[int, int, int, bool, bool]]]]:
+    pending: deque[tuple[SectorVerifyTask, Future | None]] = deque()
+    try:
+        for task in tasks:
+            pending.append((task, _submit(pool, task)))
+            if len(pending) >= SECTOR_WORKERS * 2:
+                yield _task_result(*pending.popleft())
+        while pending:
+            yield _task_result(*pending.popleft())
+    finally:
+        for _, future in pending:
+            if future is not None:
+                future.cancel()
+
+
+def _submit(pool: ProcessPoolExecutor | None, task: SectorVerifyTask) -> Future | None:
+    if pool is None:
+        return None
+    try:
+        return pool.submit(verify_sector_chunk, task)
+    except (BrokenProcessPool, RuntimeError):
+        return None
+
+
+def _task_result(task: SectorVerifyTask, future: Future | None) -> tuple[SectorVerifyTask, list]:
+    if future is None:
+        return task, verify_sector_chunk(task)
+    try:
+        return task, future.result()
+    except BrokenProcessPool:
+        reset_sector_pool()
+        return task, verify_sector_chunk(task)
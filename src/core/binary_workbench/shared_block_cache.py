@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+from threading import Lock
+
+from src.core.binary_workbench.block_cache_policies import (
+    BLOCK_CACHE_POLICY_NAMES,
+    BlockCacheStats,
+    block_eviction_policy,
+)
+from src.core.binary_workbench.block_reader import BinaryBlock
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_DEFAULT_BLOCK_SIZE,
+    BINARY_WORKBENCH_DEFAULT_CACHE_MAX_BLOCKS,
+    BINARY_WORKBENCH_DEFAULT_CACHE_POLICY,
+)
+
+
+class SharedBlockCache:
+    """
+    Process-wide block cache budgeted in bytes.
+
+    Entries are keyed by ``(identity, block_size, block_index)`` so every tab
+    reading the same source file, including internal files read from their
+    parent disc image, hits the same blocks.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int,
+        policy: str = BINARY_WORKBENCH_DEFAULT_CACHE_POLICY,
+    ) -> None:
+        self.budget_bytes = max(1, budget_bytes)
+        self.policy_name = policy if policy in BLOCK_CACHE_POLICY_NAMES else BINARY_WORKBENCH_DEFAULT_CACHE_POLICY
+        self._blocks = block_eviction_policy(self.policy_name, self.budget_bytes)
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def configure(self, budget_bytes: int | None = None, policy: str | None = None) -> None:
+        """
+        Applies a new budget or eviction policy in place, evicting down to the budget.
+
+        Readers keep their reference to this cache, so resident blocks survive a
+        preference change; a policy swap re-inserts them oldest first.
+        """
+        with self._lock:
+            budget = self.budget_bytes if budget_bytes is None else max(1, budget_bytes)
+            name = self.policy_name if policy is None else policy
+            name = name if name in BLOCK_CACHE_POLICY_NAMES else BINARY_WORKBENCH_DEFAULT_CACHE_POLICY
+            if name != self.policy_name:
+                blocks = block_eviction_policy(name, budget)
+                for key, block, weight in self._blocks.entries():
+                    self._evictions += len(blocks.put(key, block, weight))
+                self._blocks = blocks
+            elif budget != self.budget_bytes:
+                self._evictions += len(self._blocks.resize(budget))
+            self.budget_bytes = budget
+            self.policy_name = name
+
+    @property
+    def size_bytes(self) -> int:
+        return self._blocks.weight
+
+    def view(self, identity: Hashable, block_size: int) -> SharedBlockCacheView:
+        return SharedBlockCacheView(self, identity, block_size)
+
+    def has(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._blocks
+
+    def get(self, key: Hashable) -> BinaryBlock | None:
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return block
+
+    def put(self, key: Hashable, block: BinaryBlock) -> None:
+        with self._lock:
+            self._evictions += len(self._blocks.put(key, block, max(1, len(block.data))))
+
+    def count(self, identity: Hashable) -> int:
+        with self._lock:
+            return sum(1 for key in self._blocks.keys() if key[0] == identity)
+
+    def stats(self) -> BlockCacheStats:
+        return BlockCacheStats(self._hits, self._misses, self._evictions)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._blocks)
+
+
+class SharedBlockCacheView:
+    def __init__(self, cache: SharedBlockCache, identity: Hashable, block_size: int) -> None:
+        self.shared = cache
+        self.identity = identity
+        self._block_size = block_size
+
+    def has(self, block_index: int) -> bool:
+        return self.shared.has(self._key(block_index))
+
+    def get(self, block_index: int) -> BinaryBlock | None:
+        return self.shared.get(self._key(block_index))
+
+    def put(self, block: BinaryBlock) -> None:
+        self.shared.put(self._key(block.block_index), block)
+
+    def stats(self) -> BlockCacheStats:
+        return self.shared.stats()
+
+    def __len__(self) -> int:
+        return self.shared.count(self.identity)
+
+    def _key(self, block_index: int) -> tuple[Hashable, int, int]:
+        return (self.identity, self._block_size, block_index)
+
+
+_shared_block_cache = SharedBlockCache(
+    BINARY_WORKBENCH_DEFAULT_BLOCK_SIZE * BINARY_WORKBENCH_DEFAULT_CACHE_MAX_BLOCKS,
+)
+
+
+def shared_block_cache(
+    budget_bytes: int | None = None,
+    policy: str | None = None,
+) -> SharedBlockCache:
+    _shared_block_cache.configure(budget_bytes, policy)
+    return _shared_block_cache
@@ -1,7 +1,14 @@
+import re
+from heapq import merge
+
+from src.core.binary_workbench.masked_search import MaskedBytePattern, find_masked_bytes_in_data
+from src.core.binary_workbench.multi_pattern_search import BytePatternAutomaton, PatternMatch
 from src.modules.binary_workbench_constants import ANSI_WINDOWS_ENCODING as ANSI_TEXT_ENCODING
 from src.modules.constants import HEX_DIGITS_LOWER
 from src.modules.binary_workbench_dtos import BinaryWorkbenchRowDTO
 
+SEARCH_LIST_SEPARATORS = re.compile(r"[,;\n]")
+
 
 def ansi_text_bytes(text: str) -> bytes:
     try:
@@ -76,23 +83,17 @@ def find_hex_nibbles_in_data(
     needle = hex_nibbles(query)
     if not needle:
         return []
-    left = max(0, (start_offset or 0) - base_offset)
-    right = len(data) if end_offset is None else min(len(data), end_offset - base_offset + 1)
-    if right < left or (end_offset is not None and start_offset is not None and start_offset > end_offset):
-        return []
-    haystack = data[left:right].hex()
-    results: list[int] = []
-    seen: set[int] = set()
-    start = 0
-    while (found := haystack.find(needle, start)) >= 0:
-        offset = base_offset + left + (found // 2)
-        if offset not in seen:
-            results.append(offset)
-            seen.add(offset)
-            if max_results is not None and len(results) >= max_results:
-                break
-        start = found + 1
-    return results
+    if len(needle) % 2 == 0:
+        high_phase = find_bytes_in_data(data, base_offset, bytes.fromhex(needle), start_offset, end_offset, max_results)
+    else:
+        high_phase = find_masked_bytes_in_data(
+            data, base_offset, _nibble_pattern(needle, 0), start_offset, end_offset, max_results,
+        )
+    low_phase = find_masked_bytes_in_data(
+        data, base_offset, _nibble_pattern(needle, 1), start_offset, end_offset, max_results,
+    )
+    results = list(dict.fromkeys(merge(high_phase, low_phase)))
+    return results if max_results is None else results[:max_results]
 
 
 def find_hex_nibbles_in_rows(
@@ -125,11 +126,47 @@ def find_hex_nibbles_in_rows(
     return results[:max_results] if max_results is not None else results
 
 
+def find_patterns_in_rows(
+    rows: list[BinaryWorkbenchRowDTO],
+    automaton: BytePatternAutomaton,
+    start_offset: int | None = None,
+    end_offset: int | None = None,
+    max_results: int | None = None,
+) -> list[PatternMatch]:
+    results: list[PatternMatch] = []
+    for offset, data in row_runs(rows):
+        remaining = None if max_results is None else max_results - len(results)
+        results.extend(automaton.find(data, offset, start_offset, end_offset, remaining))
+        if max_results is not None and len(results) >= max_results:
+            break
+    return results[:max_results] if max_results is not None else results
+
+
+def search_list_needles(query: str) -> list[bytes]:
+    entries = (hex_nibbles(entry) for entry in SEARCH_LIST_SEPARATORS.split(query))
+    return list(dict.fromkeys(bytes.fromhex(entry) for entry in entries if entry and len(entry) % 2 == 0))
+
+
+def hex_nibble_patterns(query: str) -> tuple[MaskedBytePattern, ...]:
+    needle = hex_nibbles(query)
+    return (_nibble_pattern(needle, 0), _nibble_pattern(needle, 1)) if needle else ()
+
+
 def hex_nibbles(value: str) -> str:
     clean = "".join(character for character in value.lower() if not character.isspace())
     return clean if clean and all(character in HEX_DIGITS_LOWER for character in clean) else ""
 
 
+def row_runs(rows: list[BinaryWorkbenchRowDTO]) -> list[tuple[int, bytes]]:
+    runs: list[tuple[int, bytearray]] = []
+    for offset, data in sorted(_row_chunks(rows), key=lambda item: item[0]):
+        if runs and offset == runs[-1][0] + len(runs[-1][1]):
+            runs[-1][1].extend(data)
+        else:
+            runs.append((offset, bytearray(data)))
+    return [(offset, bytes(data)) for offset, data in runs]
+
+
 def _row_chunks(rows: list[BinaryWorkbenchRowDTO]) -> list[tuple[int, bytes]]:
     chunks: list[tuple[int, bytes]] = []
     for row in rows:
@@ -141,3 +178,11 @@ def _row_chunks(rows: list[BinaryWorkbenchRowDTO]) -> list[tuple[int, bytes]]:
         except ValueError:
             continue
     return chunks
+
+
+def _nibble_pattern(needle: str, phase: int) -> MaskedBytePattern:
+    padded = "0" * phase + needle
+    padded += "0" * (len(padded) % 2)
+    mask = "0" * phase + "f" * len(needle)
+    mask += "0" * (len(mask) % 2)
+    return MaskedBytePattern(bytes.fromhex(padded), bytes.fromhex(mask))
@@ -9,12 +9,39 @@ ASSEMBLY_LABEL_SEPARATOR = ":"
 
 BINARY_WORKBENCH_DEFAULT_BLOCK_SIZE: int = 2048
 BINARY_WORKBENCH_DEFAULT_CACHE_MAX_BLOCKS: int = 8000
+BINARY_WORKBENCH_LRU_CACHE_POLICY: str = "LRU"
+BINARY_WORKBENCH_TWO_QUEUE_CACHE_POLICY: str = "2Q"
+BINARY_WORKBENCH_DEFAULT_CACHE_POLICY: str = BINARY_WORKBENCH_TWO_QUEUE_CACHE_POLICY
 BINARY_WORKBENCH_DEFAULT_SEARCH_RESULT_LIMIT: int = 200
 BINARY_WORKBENCH_FIND_DEFAULT_LENGTH_KB: int = 2 * 1024
 BINARY_WORKBENCH_FIND_MAX_LENGTH_KB: int = 50 * 1024
 BINARY_WORKBENCH_FIND_MAX_LENGTH_BYTES: int = BINARY_WORKBENCH_FIND_MAX_LENGTH_KB * 1024
 BINARY_WORKBENCH_SEARCH_CHUNK_SIZE: int = 2 * 1024 * 1024
 BINARY_WORKBENCH_SEARCH_EVENT_CHUNKS: int = 4
+BINARY_WORKBENCH_PARALLEL_SEARCH_MIN_BYTES: int = 16 * 1024 * 1024
+BINARY_WORKBENCH_PARALLEL_DISASSEMBLY_MIN_BYTES: int = 256 * 1024
+BINARY_WORKBENCH_SEARCH_MODE_ASSEMBLY: str = "Assembly instruction"
+BINARY_WORKBENCH_SEARCH_MODE_HEX_BYTES: str = "Hex bytes"
+BINARY_WORKBENCH_SEARCH_MODE_DECODED_TEXT: str = "Decoded Text"
+BINARY_WORKBENCH_SEARCH_MODE_SEARCH_LIST: str = "Search list"
+BINARY_WORKBENCH_SEARCH_MODE_POINTERS: str = "Pointers (address range)"
+BINARY_WORKBENCH_WORKSPACE_SEARCH_WORKERS: int = 4
+BINARY_WORKBENCH_WORKSPACE_SEARCH_POLL_SECONDS: float = 0.05
+BINARY_WORKBENCH_SOURCE_ASSEMBLY_BATCH_LINES: int = 256
+BINARY_WORKBENCH_MIPS_DECODE_CACHE_WORDS: int = 16384
+BINARY_WORKBENCH_MIPS_DISASSEMBLY_WINDOW_BYTES: int = 4 * 1024
+BINARY_WORKBENCH_LIMITED_DISASSEMBLY_SEARCH_SLICE_BYTES: int = 64 * 1024
+BINARY_WORKBENCH_MIPS_ASSEMBLE_CACHE_ENTRIES: int = 8192
+BINARY_WORKBENCH_ROW_CACHE_BLOCK_BYTES: int = 4 * 1024
+BINARY_WORKBENCH_ROW_CACHE_BLOCKS: int = 64
+BINARY_WORKBENCH_OPCODE_INDEX_MAX_BYTES: int = 32 * 1024 * 1024
+BINARY_WORKBENCH_OPCODE_INDEX_LOADED_FILES: int = 4
+BINARY_WORKBENCH_SUFFIX_INDEX_RUN_SIZE: int = 1024 * 1024
+BINARY_WORKBENCH_SUFFIX_INDEX_KEY_BYTES: int = 32
+BINARY_WORKBENCH_SUFFIX_INDEX_MAX_HITS: int = 65536
+BINARY_WORKBENCH_SECTOR_COLUMN_MIN_SECTORS: int = 64
+BINARY_WORKBENCH_SECTOR_BATCH_SECTORS: int = 1024
+BINARY_WORKBENCH_PARALLEL_SECTOR_MIN_SECTORS: int = 4096
 BINARY_WORKBENCH_DEFAULT_LBA_SECTOR_SIZE: int = 2352
 BINARY_WORKBENCH_DEFAULT_VERSION_NAME: str = "default"
 BINARY_WORKBENCH_PSX_MIPS_R3000A_DISPLAY_NAME: str = "PSX - Mips R3000A"
@@ -33,6 +60,10 @@ BINARY_WORKBENCH_CACHE_MAX_BLOCKS_OPTIONS: tuple[int, ...] = (
     8000,
     16000,
 )
+BINARY_WORKBENCH_CACHE_POLICY_OPTIONS: tuple[str, ...] = (
+    BINARY_WORKBENCH_LRU_CACHE_POLICY,
+    BINARY_WORKBENCH_TWO_QUEUE_CACHE_POLICY,
+)
 BINARY_WORKBENCH_BYTE_GROUP_OPTIONS: tuple[int, ...] = (1, 2, 4)
 BINARY_WORKBENCH_LBA_SECTOR_SIZE_OPTIONS: tuple[int, ...] = (2048, 2334, 2352)
 
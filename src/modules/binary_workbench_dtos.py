@@ -5,6 +5,7 @@ from src.modules.binary_workbench_constants import (
     BINARY_WORKBENCH_BYTE_GROUP_OPTIONS,
     BINARY_WORKBENCH_DEFAULT_BLOCK_SIZE,
     BINARY_WORKBENCH_DEFAULT_CACHE_MAX_BLOCKS,
+    BINARY_WORKBENCH_DEFAULT_CACHE_POLICY,
     BINARY_WORKBENCH_DEFAULT_LBA_SECTOR_SIZE,
     BINARY_WORKBENCH_PSX_MIPS_R3000A_DISPLAY_NAME,
 )
@@ -76,6 +77,8 @@ class BinaryWorkbenchPreferencesDTO:
     uppercase_instructions: bool = True
     block_size: int = BINARY_WORKBENCH_DEFAULT_BLOCK_SIZE
     cache_max_blocks: int = BINARY_WORKBENCH_DEFAULT_CACHE_MAX_BLOCKS
+    memory_mapped_reads: bool = False
+    cache_policy: str = BINARY_WORKBENCH_DEFAULT_CACHE_POLICY
     selection_limit_bytes: int = 2 * 1024 * 1024
     binary_edit_rules: BinaryWorkbenchEditRulesDTO = field(default_factory=BinaryWorkbenchEditRulesDTO)
     assembly_edit_rules: BinaryWorkbenchEditRulesDTO = field(default_factory=_default_assembly_edit_rules)
@@ -7,6 +7,7 @@ from src.modules.binary_workbench_constants import BINARY_WORKBENCH_DEFAULT_LBA_
 class BinaryWorkbenchInternalFileDTO:
     name: str
     start_lba: int
+    size: int = 0
 
 
 @dataclass(frozen=True)
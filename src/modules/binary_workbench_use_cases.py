@@ -7,7 +7,11 @@ from src.core.binary_workbench.version_overlays import without_blank_instruction
 from src.core.binary_workbench.version_instruction_maps import version_instruction_maps
 from src.core.binary_workbench.resource_identity import file_resource_identifiers
 from src.modules.application_dtos import ProgramContextDTO
-from src.modules.binary_workbench_constants import BINARY_WORKBENCH_BYTE_GROUP_OPTIONS
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_BYTE_GROUP_OPTIONS,
+    BINARY_WORKBENCH_CACHE_POLICY_OPTIONS,
+    BINARY_WORKBENCH_DEFAULT_CACHE_POLICY,
+)
 from src.modules.binary_workbench_dtos import (
     BinaryWorkbenchPreferencesDTO,
     BinaryWorkbenchRowDTO,
@@ -76,6 +80,12 @@ class BinaryWorkbenchPreferencesUseCase:
             uppercase_instructions=preferences.uppercase_instructions,
             block_size=max(1, preferences.block_size),
             cache_max_blocks=max(1, preferences.cache_max_blocks),
+            memory_mapped_reads=preferences.memory_mapped_reads,
+            cache_policy=(
+                preferences.cache_policy
+                if preferences.cache_policy in BINARY_WORKBENCH_CACHE_POLICY_OPTIONS
+                else BINARY_WORKBENCH_DEFAULT_CACHE_POLICY
+            ),
             selection_limit_bytes=normalized_selection_limit(preferences.selection_limit_bytes),
             binary_edit_rules=preferences.binary_edit_rules,
             assembly_edit_rules=preferences.assembly_edit_rules,
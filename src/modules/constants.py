@@ -8,5 +8,7 @@ HEX_KEYS: tuple[str, ...] = tuple(HEX_DIGITS_UPPER)
 DECIMAL_INPUT_PATTERN = rf"[{DECIMAL_DIGITS}]*"
 HEX_INPUT_PATTERN = rf"[{HEX_DIGITS}]*"
 HEX_LOWER_INPUT_PATTERN = rf"[{HEX_DIGITS_LOWER}]*"
+HEX_LIST_INPUT_PATTERN = rf"[{HEX_DIGITS_LOWER} ,;]*"
+HEX_RANGE_INPUT_PATTERN = rf"[{HEX_DIGITS} \-]*"
 HEX_DIGIT_PATTERN = rf"[{HEX_DIGITS}]"
 HEX_UPPER_DIGIT_PATTERN = rf"[{HEX_DIGITS_UPPER}]"
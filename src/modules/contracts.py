@@ -43,6 +43,16 @@ class CPUArchCodec(ABC):
     def bytes_text(self, data: bytes) -> str:
         raise NotImplementedError
 
+    def disassemble_many(self, data: bytes, address: int) -> list[str]:
+        size = self.word_size
+        return [
+            self.disassemble(bytes(data[index:index + size]), address + index)
+            for index in range(0, len(data) - size + 1, size)
+        ]
+
+    def assemble_many(self, lines: list[str], address: int) -> list[bytes | None]:
+        return [self.assemble(line, address + index * self.word_size) for index, line in enumerate(lines)]
+
     def jump_navigation_target(
         self,
         instruction: str,
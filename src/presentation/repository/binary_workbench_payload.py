@@ -187,10 +187,18 @@ def _internal_files(raw: object) -> list[BinaryWorkbenchInternalFileDTO]:
             continue
         if not isinstance(start_lba, int):
             continue
-        files.append(BinaryWorkbenchInternalFileDTO(name=name, start_lba=start_lba))
+        size = item.get("size")
+        files.append(BinaryWorkbenchInternalFileDTO(name=name, start_lba=start_lba, size=size if isinstance(size, int) else 0))
     return files
 
 
+def internal_file_payload(item: BinaryWorkbenchInternalFileDTO) -> dict[str, object]:
+    payload: dict[str, object] = {"name": item.name, "start_lba": item.start_lba}
+    if item.size > 0:
+        payload["size"] = item.size
+    return payload
+
+
 def _versions(raw: object) -> list[BinaryWorkbenchVersionDTO]:
     if not isinstance(raw, list):
         return []
@@ -436,10 +444,7 @@ def binary_workbench_state_to_payload(
                 "symbol_offsets": {} if _has_symbol_offset_modules(tab) else {
                     key: list(value) for key, value in tab.symbol_offsets.items()
                 },
-                "internal_files": [
-                    {"name": item.name, "start_lba": item.start_lba}
-                    for item in tab.internal_files
-                ],
+                "internal_files": [internal_file_payload(item) for item in tab.internal_files],
                 "internal_file_start_lba": tab.internal_file_start_lba,
                 "internal_parent_tab_id": tab.internal_parent_tab_id,
                 "internal_parent_byte_overlays": dict(
@@ -28,6 +28,7 @@ from src.presentation.repository.binary_workbench_payload import (
     _internal_files,
     _row_payload,
     _rows,
+    internal_file_payload,
 )
 from src.core.binary_workbench.version_overlays import instruction_overlays_from_rows
 from src.core.binary_workbench.version_overlays import instructions_by_line_from_rows
@@ -72,7 +73,7 @@ def lba_payload(
     return {
         "name": name,
         "sector_size": sector_size,
-        "internal_files": [{"name": item.name, "start_lba": item.start_lba} for item in files],
+        "internal_files": [internal_file_payload(item) for item in files],
     }
 
 
@@ -9,7 +9,9 @@ from src.modules.application_dtos import NumericWorkbenchPreferencesDTO
 from src.modules.binary_workbench_constants import (
     BINARY_WORKBENCH_BYTE_GROUP_OPTIONS,
     BINARY_WORKBENCH_DEFAULT_BLOCK_SIZE,
+    BINARY_WORKBENCH_CACHE_POLICY_OPTIONS,
     BINARY_WORKBENCH_DEFAULT_CACHE_MAX_BLOCKS,
+    BINARY_WORKBENCH_DEFAULT_CACHE_POLICY,
 )
 from src.modules.binary_workbench_dtos import (
     BinaryWorkbenchEditRulesDTO,
@@ -147,6 +149,8 @@ class BinaryWorkbenchPreferencesRepository:
                 raw.get("cache_max_blocks") if raw else None,
                 BINARY_WORKBENCH_DEFAULT_CACHE_MAX_BLOCKS,
             ),
+            memory_mapped_reads=self._bool(raw.get("memory_mapped_reads") if raw else None, False),
+            cache_policy=self._cache_policy(raw.get("cache_policy") if raw else None),
             selection_limit_bytes=normalized_selection_limit(
                 self._positive_int(
                     raw.get("selection_limit_bytes") if raw else None,
@@ -170,6 +174,8 @@ class BinaryWorkbenchPreferencesRepository:
             "uppercase_instructions": preferences.uppercase_instructions,
             "block_size": preferences.block_size,
             "cache_max_blocks": preferences.cache_max_blocks,
+            "memory_mapped_reads": preferences.memory_mapped_reads,
+            "cache_policy": preferences.cache_policy,
             "selection_limit_bytes": preferences.selection_limit_bytes,
             "binary_edit_rules": self._edit_rules_payload(preferences.binary_edit_rules),
             "assembly_edit_rules": self._edit_rules_payload(preferences.assembly_edit_rules),
@@ -204,6 +210,9 @@ class BinaryWorkbenchPreferencesRepository:
             return None
         return raw if isinstance(raw, dict) else None
 
+    def _cache_policy(self, raw: object) -> str:
+        return raw if raw in BINARY_WORKBENCH_CACHE_POLICY_OPTIONS else BINARY_WORKBENCH_DEFAULT_CACHE_POLICY
+
     def _group_bytes(self, raw: object) -> int:
         default = BINARY_WORKBENCH_BYTE_GROUP_OPTIONS[0]
         value = raw if isinstance(raw, int) else default
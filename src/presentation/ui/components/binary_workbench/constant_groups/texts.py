@@ -1,3 +1,12 @@
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_SEARCH_MODE_ASSEMBLY,
+    BINARY_WORKBENCH_SEARCH_MODE_DECODED_TEXT,
+    BINARY_WORKBENCH_SEARCH_MODE_HEX_BYTES,
+    BINARY_WORKBENCH_SEARCH_MODE_POINTERS,
+    BINARY_WORKBENCH_SEARCH_MODE_SEARCH_LIST,
+)
+
+
 class BINARY_WORKBENCH_TEXT:
     TITLE: str = "Binary Workbench"
     STATUS_IDLE: str = "Ready."
@@ -133,7 +142,21 @@ class BINARY_WORKBENCH_TEXT:
     EQUATE_TARGET: str = "Equate"
     VARIABLE_TARGET: str = "Variable"
     INTERNAL_FILE_TARGET: str = "Named File / Internal File"
-    FIND_ASSEMBLY: str = "Assembly instruction"
-    FIND_HEX_BYTES: str = "Hex bytes"
-    FIND_DECODED_TEXT: str = "Decoded Text"
+    FIND_ASSEMBLY: str = BINARY_WORKBENCH_SEARCH_MODE_ASSEMBLY
+    FIND_HEX_BYTES: str = BINARY_WORKBENCH_SEARCH_MODE_HEX_BYTES
+    FIND_DECODED_TEXT: str = BINARY_WORKBENCH_SEARCH_MODE_DECODED_TEXT
+    FIND_SEARCH_LIST: str = BINARY_WORKBENCH_SEARCH_MODE_SEARCH_LIST
+    FIND_POINTERS: str = BINARY_WORKBENCH_SEARCH_MODE_POINTERS
+    FIND_BUILD_INDEX: str = "Build Index"
+    FIND_STOP: str = "Stop"
+    FIND_ALL_TABS: str = "All open tabs"
+    FIND_ADD_FILES: str = "Add Files"
+    FIND_EXTRA_FILES: str = "{count} file(s) on disk"
+    FIND_PROGRESS: str = "Searched {percent}%"
+    FIND_TARGET_FAILED: str = "{label}: search failed ({error})"
+    FIND_TAB_UNLOADED: str = "tab is unloaded; open it to search"
+    FIND_INDEX_MISSING: str = "Search index: not built"
+    FIND_INDEX_UNAVAILABLE: str = "Search index: unavailable for this tab"
+    FIND_INDEX_BUILDING: str = "Search index: building {percent}%"
+    FIND_INDEX_READY: str = "Search index: {size}"
     SAVE_BEFORE_CLOSE: str = "Save changes before closing this tab?"
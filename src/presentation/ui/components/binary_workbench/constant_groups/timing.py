@@ -1,2 +1,3 @@
 class BINARY_WORKBENCH_TIMING:
     STATUS_MESSAGE_VISIBLE_MS: int = 3000
+    SEARCH_INDEX_REFRESH_MS: int = 500
@@ -27,15 +27,19 @@ from src.presentation.ui.components.binary_workbench.editor.page_virtual_copy im
 from src.presentation.ui.components.binary_workbench.editor.page_context_updates import EditorPageContextMixin
 from src.presentation.ui.components.binary_workbench.editor.page_immediate_symbols import EditorPageImmediateSymbolsMixin
 from src.presentation.ui.components.binary_workbench.editor.page_search import EditorPageSearchMixin
-from src.presentation.ui.components.binary_workbench.editor.page_reader import reader_for_context
+from src.presentation.ui.components.binary_workbench.editor.page_reader import close_reader, reader_for_context
 from src.presentation.ui.components.binary_workbench.editor.selection_summary import selection_summary_footer
 from src.presentation.ui.components.binary_workbench.editor.table import BinaryWorkbenchGrid
 from src.core.binary_workbench.codec_registry import binary_workbench_codec_for
 from src.core.binary_workbench.symbolic_replacements import apply_symbol_offsets
+from src.core.binary_workbench.row_block_cache import RowBlockCache
 
 if TYPE_CHECKING:
     from src.core.binary_workbench.block_reader import CachedBinaryReader
     from src.core.binary_workbench.internal_file_reader import InternalFileView
+    from src.core.binary_workbench.opcode_index import OpcodeIndexStore
+    from src.core.binary_workbench.sector_map import SectorMapStore
+    from src.core.binary_workbench.searching.suffix_index import SuffixIndexStore
 
 
 class BinaryWorkbenchEditorPage(
@@ -55,10 +59,16 @@ class BinaryWorkbenchEditorPage(
         context: BinaryWorkbenchTabContextDTO,
         preferences: BinaryWorkbenchPreferencesDTO | None = None,
         command_directory: Path | None = None,
+        opcode_index_store: OpcodeIndexStore | None = None,
+        suffix_index_store: SuffixIndexStore | None = None,
+        sector_map_store: SectorMapStore | None = None,
     ) -> None:
         super().__init__()
         self._context = context
         self._preferences = preferences or BinaryWorkbenchPreferencesDTO()
+        self._opcode_index_store = opcode_index_store
+        self._suffix_index_store = suffix_index_store
+        self._sector_map_store = sector_map_store
         layout = QVBoxLayout(self)
         layout.setContentsMargins(
             0,
@@ -80,6 +90,7 @@ class BinaryWorkbenchEditorPage(
         self.grid.selectAllRequested.connect(self.select_all_content)
         self.grid.commandWarningRequested.connect(self.statusWarningRequested.emit)
         self._reader: CachedBinaryReader | InternalFileView | None = None
+        self._row_cache = RowBlockCache()
         self._loading_visible_rows = False
         self._pending_selection: tuple[int, int] | None = None
         footer, (
@@ -103,7 +114,9 @@ class BinaryWorkbenchEditorPage(
         self._set_internal_file_summary(context)
 
     def release_heavy_resources(self, context: BinaryWorkbenchTabContextDTO) -> None:
+        close_reader(self._reader)
         self._reader = None
+        self._row_cache.clear()
         self._pending_selection = None
         self._context = context
         self.grid.set_decoded_text_values({})
@@ -120,7 +133,9 @@ class BinaryWorkbenchEditorPage(
         self._set_internal_file_summary(context)
 
     def load_context(self, context: BinaryWorkbenchTabContextDTO) -> None:
-        self._reader = reader_for_context(context, self._preferences)
+        close_reader(self._reader)
+        self._reader = reader_for_context(context, self._preferences, self._sector_map_store)
+        self._row_cache.clear()
         context = self._context_with_original_file_size(context)
         self._context = context
         codec = binary_workbench_codec_for(context.cpu_arch)
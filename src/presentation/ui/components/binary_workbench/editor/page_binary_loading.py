@@ -1,5 +1,4 @@
 from src.core.binary_workbench.context_overlays import compact_binary_context_overlays
-from src.core.binary_workbench.mips_r3000a import build_rows_from_bytes
 from src.core.binary_workbench.symbolic_replacements import apply_symbol_offsets
 from src.modules.binary_workbench_dtos import BinaryWorkbenchTabContextDTO
 from src.presentation.ui.components.binary_workbench.constants import (
@@ -31,26 +30,17 @@ class EditorPageBinaryLoadingMixin:
         self._loading_visible_rows = True
         visible_offset = max(0, offset)
         self._reader.prefetch_for_offset(visible_offset, direction)
-        source_data = self._read_visible_data(visible_offset, size, {})
-        rows = build_rows_from_bytes(
-            source_data,
-            list(self._context.reference_offsets),
+        self._context = compact_binary_context_overlays(self._context)
+        overlays = overlay_bytes(self._context.byte_overlays)
+        rows = self._row_cache.rows(
+            lambda start, length: self._read_visible_data(start, length, overlays),
             visible_offset,
+            size,
+            effective_reader_size(self._reader, self._context.file_size),
+            overlays,
+            list(self._context.reference_offsets),
             dict(self._context.reference_offset_bases),
         )
-        self._context = compact_binary_context_overlays(self._context)
-        if self._context.byte_overlays:
-            data = self._read_visible_data(
-                visible_offset,
-                size,
-                overlay_bytes(self._context.byte_overlays),
-            )
-            rows = build_rows_from_bytes(
-                data,
-                list(self._context.reference_offsets),
-                visible_offset,
-                dict(self._context.reference_offset_bases),
-            )
         rows = apply_instruction_overlays(rows, self._context.instruction_overlays)
         rows = active_version_rows(self._context, rows)
         rows = apply_symbol_offsets(
@@ -136,7 +126,7 @@ class EditorPageBinaryLoadingMixin:
         offset: int,
         size: int,
         overlays: dict[int, bytes],
-    ) -> bytes:
+    ) -> bytes | memoryview:
         if self._reader is None:
             return b""
         effective_size = effective_reader_size(self._reader, self._context.file_size)
@@ -144,7 +134,7 @@ class EditorPageBinaryLoadingMixin:
             return b""
         target_size = min(size, effective_size - offset)
         source_size = min(target_size, max(0, self._reader.file_size - offset))
-        data = self._reader.read(offset, source_size, {})
+        data = self._reader.read_view(offset, source_size, {})
         if len(data) < target_size:
-            data += b"\x00" * (target_size - len(data))
+            data = bytes(data) + b"\x00" * (target_size - len(data))
         return apply_overlay_bytes(offset, data, overlays)
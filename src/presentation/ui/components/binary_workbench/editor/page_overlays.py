@@ -1,31 +1,25 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+
+from src.core.binary_workbench.byte_overlay_index import (
+    ByteOverlayIndex,
+    byte_overlay_index,
+    hex_byte_overlay_index,
+)
 from src.presentation.ui.components.binary_workbench.editor.instruction_overlays import (
     file_offset,
 )
 
 
-def overlay_bytes(values: dict[str, str]) -> dict[int, bytes]:
-    return {
-        int(offset, 16): bytes.fromhex(bytes_text.replace(" ", ""))
-        for offset, bytes_text in values.items()
-    }
+def overlay_bytes(values: dict[str, str]) -> ByteOverlayIndex:
+    return hex_byte_overlay_index(values)
 
 
-def apply_overlay_bytes(start: int, data: bytes, overlays: dict[int, bytes]) -> bytes:
+def apply_overlay_bytes(start: int, data: bytes, overlays: Mapping[int, bytes]) -> bytes:
     if not overlays:
         return data
-    patched = bytearray(data)
-    end = start + len(data)
-    for patch_offset, patch_data in overlays.items():
-        patch_end = patch_offset + len(patch_data)
-        if patch_end <= start or patch_offset >= end:
-            continue
-        left = max(start, patch_offset)
-        right = min(end, patch_end)
-        source_left = left - patch_offset
-        patched[left - start : right - start] = patch_data[source_left : source_left + (right - left)]
-    return bytes(patched)
+    return byte_overlay_index(overlays).apply(start, data)
 
 
 def instruction_overlays_with_changed_rows(
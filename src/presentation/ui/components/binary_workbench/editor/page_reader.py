@@ -5,6 +5,8 @@ from pathlib import Path
 from src.core.binary_workbench.block_reader import CachedBinaryReader
 from src.core.binary_workbench.internal_file_reader import InternalFileView
 from src.core.binary_workbench.internal_file_region import define_internal_file_region
+from src.core.binary_workbench.sector_map import SectorMapStore
+from src.core.binary_workbench.shared_block_cache import SharedBlockCache, shared_block_cache
 from src.modules.binary_workbench_constants import BINARY_WORKBENCH_TAB_KIND
 from src.modules.binary_workbench_dtos import (
     BinaryWorkbenchPreferencesDTO,
@@ -15,12 +17,20 @@ from src.modules.binary_workbench_dtos import (
 def reader_for_context(
     context: BinaryWorkbenchTabContextDTO,
     preferences: BinaryWorkbenchPreferencesDTO,
+    sector_maps: SectorMapStore | None = None,
 ) -> CachedBinaryReader | InternalFileView | None:
     path = Path(context.source_path) if context.source_path else None
     if path is None or not path.exists():
         return None
     if context.kind == BINARY_WORKBENCH_TAB_KIND.BINARY:
-        return CachedBinaryReader(path, preferences.block_size, preferences.cache_max_blocks)
+        return CachedBinaryReader(
+            path,
+            preferences.block_size,
+            preferences.cache_max_blocks,
+            preferences.memory_mapped_reads,
+            preferences.cache_policy,
+            shared_cache=shared_reader_cache(preferences),
+        )
     if context.kind != BINARY_WORKBENCH_TAB_KIND.INTERNAL:
         return None
     target = next(
@@ -39,7 +49,21 @@ def reader_for_context(
         context.internal_files,
         context.lba_sector_size,
     )
-    return InternalFileView(region, preferences.block_size, preferences.cache_max_blocks)
+    return InternalFileView(
+        region,
+        preferences.block_size,
+        preferences.cache_max_blocks,
+        preferences.cache_policy,
+        shared_cache=shared_reader_cache(preferences),
+        sector_maps=sector_maps,
+    )
+
+
+def shared_reader_cache(preferences: BinaryWorkbenchPreferencesDTO) -> SharedBlockCache:
+    return shared_block_cache(
+        preferences.block_size * preferences.cache_max_blocks,
+        preferences.cache_policy,
+    )
 
 
 def effective_reader_size(
@@ -47,3 +71,8 @@ def effective_reader_size(
     context_size: int,
 ) -> int:
     return max(reader.file_size, context_size)
+
+
+def close_reader(reader: CachedBinaryReader | InternalFileView | None) -> None:
+    if reader is not None:
+        reader.close()
@@ -1,24 +1,37 @@
+from collections.abc import Callable, Iterator
+
 from PySide6.QtCore import QCoreApplication
 
 from src.core.binary_workbench.searching import (
+    SearchBatch,
+    drain_search,
     effective_search_end,
-    find_reader_bytes,
-    find_reader_hex,
-    find_reader_instruction,
+    find_reader_patterns,
     offset_matches_decoded_text,
     offset_matches_hex,
     offset_matches_instruction,
+    offset_matches_search_list,
+    reader_search_batches,
 )
+from src.core.binary_workbench.multi_pattern_search import BytePatternAutomaton, PatternMatch
+from src.core.binary_workbench.opcode_index import OpcodeIndex
+from src.core.binary_workbench.searching.pointer_scan import find_pointers_in_rows, pointer_range, pointer_target
+from src.core.binary_workbench.searching.suffix_index import SuffixIndex
 from src.core.binary_workbench.text_search import (
     ansi_text_bytes,
     find_bytes_in_rows,
     find_hex_nibbles_in_rows,
+    find_patterns_in_rows,
     hex_nibbles,
+    search_list_needles,
 )
-from src.modules.binary_workbench_constants import BINARY_WORKBENCH_SEARCH_EVENT_CHUNKS
+from src.core.binary_workbench.searching.workspace_search import SearchJob
+from src.modules.binary_workbench_constants import BINARY_WORKBENCH_SEARCH_EVENT_CHUNKS, BINARY_WORKBENCH_TAB_KIND
 from src.presentation.ui.components.binary_workbench.constants import BINARY_WORKBENCH_TEXT
 from src.presentation.ui.components.binary_workbench.editor.page_overlays import overlay_bytes
 
+SEARCH_FILE_TAB_KINDS = frozenset({BINARY_WORKBENCH_TAB_KIND.BINARY, BINARY_WORKBENCH_TAB_KIND.INTERNAL})
+
 
 class EditorPageSearchMixin:
     def commit_current_editor_text(self) -> None:
@@ -47,16 +60,97 @@ class EditorPageSearchMixin:
         return False
 
     def find_offsets(self, mode: str, query: str, start_offset=None, end_offset=None, max_results=None) -> list[int]:
+        batches = self.search_batches(mode, query, start_offset, end_offset, max_results)
+        return drain_search(batches, self._yield_search_events)
+
+    def search_batches(
+        self,
+        mode: str,
+        query: str,
+        start_offset=None,
+        end_offset=None,
+        max_results=None,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> Iterator[SearchBatch]:
         if start_offset is not None and end_offset is not None and start_offset > end_offset:
-            return []
+            return
         self.remember_search_end_offset(start_offset, end_offset)
-        if mode == BINARY_WORKBENCH_TEXT.FIND_HEX_BYTES:
-            return self._find_hex_bytes(query, start_offset, end_offset, max_results)
-        if mode == BINARY_WORKBENCH_TEXT.FIND_ASSEMBLY:
-            return self._find_instruction(query, start_offset, end_offset, max_results)
-        if mode == BINARY_WORKBENCH_TEXT.FIND_DECODED_TEXT:
-            return self._find_decoded_text(query, start_offset, end_offset, max_results)
-        return []
+        self._search_cancel_requested = False
+        cancelled = cancelled or self._search_cancelled
+        if self._reader is None:
+            yield from self._row_batches(mode, query, start_offset, end_offset, max_results)
+            return
+        yield from reader_search_batches(
+            self._reader,
+            self.grid._codec,
+            overlay_bytes(self._context.byte_overlays),
+            mode,
+            query,
+            start_offset,
+            end_offset,
+            max_results,
+            cancelled,
+            _suffix_index_lookup(getattr(self, "_suffix_index_store", None), self._reader),
+            _opcode_index_lookup(getattr(self, "_opcode_index_store", None), self._reader, self.grid._codec),
+            self._context.reference_offset_bases,
+        )
+
+    def search_unloaded(self) -> bool:
+        return self._reader is None and not self._context.rows and self._context.kind in SEARCH_FILE_TAB_KINDS
+
+    def search_job(self, mode: str, query: str, start_offset=None, end_offset=None, max_results=None) -> SearchJob:
+        if self._reader is None:
+            results = drain_search(self._row_batches(mode, query, start_offset, end_offset, max_results))
+            return lambda _cancelled=None: results
+        reader = self._reader
+        codec = self.grid._codec
+        overlays = overlay_bytes(self._context.byte_overlays)
+        suffix_index_for = _suffix_index_lookup(getattr(self, "_suffix_index_store", None), reader)
+        opcode_index_for = _opcode_index_lookup(getattr(self, "_opcode_index_store", None), reader, codec)
+        address_bases = dict(self._context.reference_offset_bases)
+
+        def run(cancelled: Callable[[], bool] | None = None) -> list[int]:
+            batches = reader_search_batches(
+                reader,
+                codec,
+                overlays,
+                mode,
+                query,
+                start_offset,
+                end_offset,
+                max_results,
+                cancelled,
+                suffix_index_for,
+                opcode_index_for,
+                address_bases,
+            )
+            return drain_search(batches)
+
+        return run
+
+    def find_pattern_matches(
+        self,
+        needles: list[bytes],
+        start_offset=None,
+        end_offset=None,
+        max_results=None,
+    ) -> list[PatternMatch]:
+        automaton = BytePatternAutomaton(needles)
+        if self._reader is None:
+            return find_patterns_in_rows(self._context.rows, automaton, start_offset, end_offset, max_results)
+        return find_reader_patterns(
+            self._reader,
+            overlay_bytes(self._context.byte_overlays),
+            automaton,
+            start_offset,
+            end_offset,
+            max_results,
+            self._yield_search_events,
+            self._search_cancelled,
+        )
+
+    def cancel_search(self) -> None:
+        self._search_cancel_requested = True
 
     def last_search_end_offset(self) -> int | None:
         return getattr(self, "_last_search_end_offset", None)
@@ -71,24 +165,38 @@ class EditorPageSearchMixin:
             return offset_matches_decoded_text(self._read_match_bytes, query, offset)
         if mode == BINARY_WORKBENCH_TEXT.FIND_ASSEMBLY:
             return offset_matches_instruction(self._read_match_bytes, self.grid._codec, query.strip(), offset)
+        if mode == BINARY_WORKBENCH_TEXT.FIND_SEARCH_LIST:
+            return offset_matches_search_list(self._read_match_bytes, query, offset)
         return False
 
-    def _find_instruction(self, query: str, start_offset=None, end_offset=None, max_results=None) -> list[int]:
-        instruction = query.strip()
-        if not instruction:
-            return []
-        if self._reader is not None:
-            return find_reader_instruction(
-                self._reader,
-                self.grid._codec,
-                overlay_bytes(self._context.byte_overlays),
-                instruction,
-                start_offset,
-                end_offset,
-                max_results,
-                self._yield_search_events,
-            )
-        return self._find_instruction_rows(instruction, start_offset, end_offset, max_results)
+    def _row_batches(self, mode: str, query: str, start_offset, end_offset, max_results) -> Iterator[SearchBatch]:
+        if mode == BINARY_WORKBENCH_TEXT.FIND_HEX_BYTES:
+            needle = hex_nibbles(query)
+            if needle:
+                yield _rows_batch(find_hex_nibbles_in_rows(self._context.rows, needle, start_offset, end_offset, max_results))
+        elif mode == BINARY_WORKBENCH_TEXT.FIND_ASSEMBLY:
+            instruction = query.strip()
+            if instruction:
+                yield _rows_batch(self._find_instruction_rows(instruction, start_offset, end_offset, max_results))
+        elif mode == BINARY_WORKBENCH_TEXT.FIND_DECODED_TEXT:
+            needle = ansi_text_bytes(query.strip())
+            if needle:
+                yield _rows_batch(find_bytes_in_rows(self._context.rows, needle, start_offset, end_offset, max_results))
+        elif mode == BINARY_WORKBENCH_TEXT.FIND_SEARCH_LIST:
+            automaton = BytePatternAutomaton(search_list_needles(query))
+            matches = find_patterns_in_rows(self._context.rows, automaton, start_offset, end_offset, max_results)
+            yield _rows_batch(list(dict.fromkeys(match.offset for match in matches)))
+        elif mode == BINARY_WORKBENCH_TEXT.FIND_POINTERS:
+            bounds = pointer_range(query)
+            if bounds is not None:
+                hits = find_pointers_in_rows(self._context.rows, *bounds, start_offset, end_offset, max_results)
+                bases = self._context.reference_offset_bases
+                yield SearchBatch(
+                    tuple(hit.offset for hit in hits),
+                    0,
+                    0,
+                    targets=tuple(pointer_target(hit.value, bases) for hit in hits),
+                )
 
     def _find_instruction_rows(self, query: str, start_offset=None, end_offset=None, max_results=None) -> list[int]:
         needle = query.lower()
@@ -106,22 +214,6 @@ class EditorPageSearchMixin:
                     break
         return results
 
-    def _find_hex_bytes(self, query: str, start_offset=None, end_offset=None, max_results=None) -> list[int]:
-        needle = hex_nibbles(query)
-        if not needle:
-            return []
-        if self._reader is None:
-            return find_hex_nibbles_in_rows(self._context.rows, needle, start_offset, end_offset, max_results)
-        return find_reader_hex(self._reader, overlay_bytes(self._context.byte_overlays), needle, start_offset, end_offset, max_results, self._yield_search_events)
-
-    def _find_decoded_text(self, query: str, start_offset=None, end_offset=None, max_results=None) -> list[int]:
-        needle = ansi_text_bytes(query.strip())
-        if not needle:
-            return []
-        if self._reader is None:
-            return find_bytes_in_rows(self._context.rows, needle, start_offset, end_offset, max_results)
-        return find_reader_bytes(self._reader, overlay_bytes(self._context.byte_overlays), needle, start_offset, end_offset, max_results, self._yield_search_events)
-
     def _read_match_bytes(self, offset: int, size: int) -> bytes:
         if self._reader is None:
             for row in self._context.rows:
@@ -130,10 +222,51 @@ class EditorPageSearchMixin:
             return b""
         return self._reader.read_uncached(offset, size, overlay_bytes(self._context.byte_overlays))
 
-    def _yield_search_events(self) -> None:
+    def search_index_status(self) -> str:
+        store = getattr(self, "_suffix_index_store", None)
+        path = getattr(self._reader, "path", None)
+        if store is None or path is None:
+            return BINARY_WORKBENCH_TEXT.FIND_INDEX_UNAVAILABLE
+        progress = store.progress(path)
+        if progress is not None:
+            return BINARY_WORKBENCH_TEXT.FIND_INDEX_BUILDING.format(percent=int(progress * 100))
+        index = store.index_for(path)
+        if index is None:
+            return BINARY_WORKBENCH_TEXT.FIND_INDEX_MISSING
+        return BINARY_WORKBENCH_TEXT.FIND_INDEX_READY.format(size=_size_text(index.size_bytes))
+
+    def build_search_index(self) -> None:
+        store = getattr(self, "_suffix_index_store", None)
+        path = getattr(self._reader, "path", None)
+        if store is not None and path is not None and store.index_for(path) is None:
+            store.build(path)
+
+    def _search_cancelled(self) -> bool:
+        return getattr(self, "_search_cancel_requested", False)
+
+    def _yield_search_events(self, _found) -> None:
         count = getattr(self, "_search_event_chunks", 0) + 1
         self._search_event_chunks = count
         if count % BINARY_WORKBENCH_SEARCH_EVENT_CHUNKS == 0:
             app = QCoreApplication.instance()
             if app is not None:
                 app.processEvents()
+
+
+def _suffix_index_lookup(store, reader) -> Callable[[], SuffixIndex | None]:
+    """Resolves the index for ``reader``'s file when called, without reading the page's current reader."""
+    path = getattr(reader, "path", None)
+    return lambda: None if store is None or path is None else store.index_for(path)
+
+
+def _opcode_index_lookup(store, reader, codec) -> Callable[[], OpcodeIndex | None]:
+    path = getattr(reader, "path", None)
+    return lambda: None if store is None or path is None else store.index_for(path, codec)
+
+
+def _rows_batch(results: list[int]) -> SearchBatch:
+    return SearchBatch(tuple(results), 0, 0)
+
+
+def _size_text(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
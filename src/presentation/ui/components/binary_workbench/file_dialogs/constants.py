@@ -20,6 +20,13 @@ class BINARY_WORKBENCH_FILE_DIALOG_TEXT:
     CONFIRM: str = "Confirm"
     INTERNAL_NAME_LABEL: str = "Internal file"
     LOAD: str = "Load"
+    READ_ISO9660: str = "Read ISO9660"
+    VERIFY_SECTORS: str = "Verify Sectors"
+    VERIFY_PROGRESS: str = "Verifying sectors {percent}%"
+    VERIFY_RAW_REQUIRED: str = "Sector verification needs 2352-byte raw sectors."
+    VERIFY_VALID: str = "All sector EDC/ECC values are valid."
+    VERIFY_FAULTS: str = "{count} bad sectors: {sectors}"
+    VERIFY_FAULT: str = "LBA {lba} {name}({codes})"
     SAVE: str = "Save"
     OK: str = "OK"
 
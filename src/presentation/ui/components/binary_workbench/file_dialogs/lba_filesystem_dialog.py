@@ -1,6 +1,9 @@
+from pathlib import Path
+
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QDialog, QFrame, QLineEdit, QVBoxLayout, QWidget
 
+from src.core.binary_workbench.searching import CancellationToken
 from src.modules.binary_workbench_constants import BINARY_WORKBENCH_DEFAULT_LBA_SECTOR_SIZE
 from src.modules.binary_workbench_dtos import BinaryWorkbenchInternalFileDTO, BinaryWorkbenchLbaFilesystemDTO
 from src.presentation.ui.components.binary_workbench.constants import BINARY_WORKBENCH_LAYOUT
@@ -38,6 +41,7 @@ class BinaryWorkbenchLbaFilesystemDialog(
         default_library_name: str = "",
         default_directory: str = "",
         parent=None,
+        source_path: Path | None = None,
     ) -> None:
         if parent is None and not isinstance(lba_sector_size, int):
             parent = lba_sector_size
@@ -61,7 +65,10 @@ class BinaryWorkbenchLbaFilesystemDialog(
         self._saved_library_path = ""
         self._loaded_library_name = ""
         self._loaded_library_path = ""
+        self._source_path = source_path
         self._rows: list[tuple[QLineEdit, QLineEdit, QWidget, QWidget]] = []
+        self._row_sizes: dict[QLineEdit, tuple[str, int]] = {}
+        self._verify_running: CancellationToken | None = None
         self._build_dialog(internal_files, default_library_name, lba_sector_size)
 
     def _build_dialog(
@@ -83,6 +90,11 @@ class BinaryWorkbenchLbaFilesystemDialog(
         self._build_footer_actions(shell_layout)
         layout.addWidget(self.shell, 1)
 
+    def done(self, result: int) -> None:
+        if self._verify_running is not None:
+            self._verify_running.cancel()
+        super().done(result)
+
     def should_save_library(self) -> bool:
         return self._save_requested
 
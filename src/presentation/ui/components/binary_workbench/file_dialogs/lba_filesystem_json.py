@@ -8,6 +8,7 @@ from src.modules.binary_workbench_constants import (
 )
 from src.modules.binary_workbench_dtos import BinaryWorkbenchInternalFileDTO, BinaryWorkbenchLbaFilesystemDTO
 from src.modules.utils import read_json, write_json
+from src.presentation.repository.binary_workbench_payload import internal_file_payload
 from src.presentation.ui.components.binary_workbench.file_dialogs.constants import (
     BINARY_WORKBENCH_FILE_DIALOG_TEXT,
 )
@@ -24,7 +25,7 @@ class LbaFilesystemJsonMixin:
         self._loaded_library_path = str(path)
         self.sector_size.setCurrentText(f"{library.sector_size} bytes")
         for item in library.internal_files:
-            self._append_row(item.name, str(item.start_lba))
+            self._append_row(item.name, str(item.start_lba), item.size)
         self._remember_library_directory(path)
         return True
 
@@ -92,7 +93,8 @@ def internal_files_from_payload(raw: object) -> list[BinaryWorkbenchInternalFile
     files: list[BinaryWorkbenchInternalFileDTO] = []
     for item in raw:
         if isinstance(item, dict) and isinstance(item.get("name"), str) and isinstance(item.get("start_lba"), int):
-            files.append(BinaryWorkbenchInternalFileDTO(name=item["name"], start_lba=item["start_lba"]))
+            size = item.get("size")
+            files.append(BinaryWorkbenchInternalFileDTO(item["name"], item["start_lba"], size if isinstance(size, int) else 0))
     return files
 
 
@@ -113,7 +115,7 @@ def filesystem_payload(
     return {
         "name": name,
         "sector_size": sector_size,
-        "internal_files": [{"name": item.name, "start_lba": item.start_lba} for item in internal_files],
+        "internal_files": [internal_file_payload(item) for item in internal_files],
     }
 
 
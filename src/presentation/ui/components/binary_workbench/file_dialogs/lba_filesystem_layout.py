@@ -1,5 +1,5 @@
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QComboBox, QFrame, QHBoxLayout, QScrollArea, QSizePolicy, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QComboBox, QFrame, QHBoxLayout, QLabel, QScrollArea, QSizePolicy, QVBoxLayout, QWidget
 
 from src.modules.binary_workbench_constants import (
     BINARY_WORKBENCH_DEFAULT_LBA_SECTOR_SIZE,
@@ -44,17 +44,30 @@ class LbaFilesystemLayoutMixin:
         row.setSpacing(ENVIRONMENT_LAYOUT.ZERO)
         load = lba_button(BINARY_WORKBENCH_FILE_DIALOG_TEXT.LOAD, "binary-workbench-lba-action", footer)
         save = lba_button(BINARY_WORKBENCH_FILE_DIALOG_TEXT.SAVE, "binary-workbench-lba-action", footer)
+        read_iso = lba_button(BINARY_WORKBENCH_FILE_DIALOG_TEXT.READ_ISO9660, "binary-workbench-lba-action", footer)
+        verify = lba_button(BINARY_WORKBENCH_FILE_DIALOG_TEXT.VERIFY_SECTORS, "binary-workbench-lba-action", footer)
         ok = lba_button(BINARY_WORKBENCH_FILE_DIALOG_TEXT.OK, "binary-workbench-lba-action", footer)
-        for button in (load, save, ok):
+        for button in (load, read_iso, verify, save, ok):
             configure_binary_workbench_dialog_action(button)
+        read_iso.setEnabled(self._source_path is not None)
+        verify.setEnabled(self._source_path is not None)
+        self.verify_button = verify
+        self.verify_status = QLabel(self.shell)
+        self.verify_status.setObjectName("preferences-subtitle")
+        self.verify_status.setWordWrap(True)
         load.clicked.connect(self._load_library_json_dialog)
+        read_iso.clicked.connect(self.read_iso9660)
+        verify.clicked.connect(self.verify_sectors)
         save.clicked.connect(self._save_library_json_dialog)
         ok.clicked.connect(self.accept)
         row.addWidget(load, 0, Qt.AlignLeft)
+        row.addWidget(read_iso, 0, Qt.AlignLeft)
+        row.addWidget(verify, 0, Qt.AlignLeft)
         row.addStretch(1)
         row.addWidget(ok, 0, Qt.AlignHCenter)
         row.addStretch(1)
         row.addWidget(save, 0, Qt.AlignRight)
+        parent.addWidget(self.verify_status, 0)
         parent.addWidget(footer, 0)
 
     def _build_library_controls(
@@ -152,7 +165,7 @@ class LbaFilesystemLayoutMixin:
         scroll_layout.addWidget(self.remove_body, 0)
         self.scroll.setWidget(self.scroll_body)
         for item in internal_files:
-            self._append_row(item.name, str(item.start_lba))
+            self._append_row(item.name, str(item.start_lba), item.size)
         parent.addWidget(self.scroll, 1)
 
 
@@ -1,6 +1,10 @@
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QCoreApplication, Qt
 from PySide6.QtWidgets import QHBoxLayout, QSizePolicy, QVBoxLayout, QWidget
 
+from src.core.binary_workbench.iso9660 import read_iso9660_files
+from src.core.binary_workbench.psx_sector_layout import RAW_SECTOR_SIZE
+from src.core.binary_workbench.searching import CancellationToken
+from src.core.binary_workbench.sector_verify import SectorFault, verify_sector_image
 from src.modules.binary_workbench_dtos import BinaryWorkbenchInternalFileDTO
 from src.presentation.ui.components.binary_workbench.action_controls import (
     configure_binary_workbench_dialog_action,
@@ -10,6 +14,9 @@ from src.presentation.ui.components.binary_workbench.constants import BINARY_WOR
 from src.presentation.ui.components.binary_workbench.constants import (
     BINARY_WORKBENCH_DIALOG_LAYOUT as ENVIRONMENT_LAYOUT,
 )
+from src.presentation.ui.components.binary_workbench.file_dialogs.constants import (
+    BINARY_WORKBENCH_FILE_DIALOG_TEXT,
+)
 from src.presentation.ui.components.binary_workbench.file_dialogs.lba_filesystem_widgets import (
     LbaRemoveRowButton,
     lba_button,
@@ -21,15 +28,60 @@ from src.presentation.ui.components.binary_workbench.input_validators import (
 )
 from src.presentation.ui.components.workspace_table.constants.layout import WORKSPACE_TABLE_SIZE
 
+VERIFY_FAULTS_SHOWN = 8
+
 
 class LbaFilesystemRowsMixin:
     def mappings(self) -> list[BinaryWorkbenchInternalFileDTO]:
         rows: list[BinaryWorkbenchInternalFileDTO] = []
         for name, lba, _, _ in self._rows:
             if name.text().strip() and lba.text().strip():
-                rows.append(BinaryWorkbenchInternalFileDTO(name=name.text().strip(), start_lba=int(lba.text().strip(), 0)))
+                lba_text, size = self._row_sizes.get(lba, ("", 0))
+                rows.append(
+                    BinaryWorkbenchInternalFileDTO(
+                        name=name.text().strip(),
+                        start_lba=int(lba.text().strip(), 0),
+                        size=size if lba_text == lba.text().strip() else 0,
+                    )
+                )
         return rows
 
+    def read_iso9660(self) -> bool:
+        if self._source_path is None:
+            return False
+        files = read_iso9660_files(self._source_path, self.selected_lba_sector_size())
+        if not files:
+            return False
+        self._clear_rows()
+        for item in files:
+            self._append_row(item.name, str(item.start_lba), item.size)
+        return True
+
+    def verify_sectors(self) -> list[SectorFault]:
+        if self._source_path is None or self._verify_running is not None:
+            return []
+        if self.selected_lba_sector_size() != RAW_SECTOR_SIZE:
+            self.verify_status.setText(BINARY_WORKBENCH_FILE_DIALOG_TEXT.VERIFY_RAW_REQUIRED)
+            return []
+        token = CancellationToken()
+        self._verify_running = token
+        self.verify_button.setEnabled(False)
+        faults: list[SectorFault] = []
+        app = QCoreApplication.instance()
+        try:
+            for batch in verify_sector_image(self._source_path, self.mappings(), token):
+                faults.extend(batch.faults)
+                percent = batch.scanned * 100 // batch.total
+                self.verify_status.setText(BINARY_WORKBENCH_FILE_DIALOG_TEXT.VERIFY_PROGRESS.format(percent=percent))
+                if app is not None:
+                    app.processEvents()
+        finally:
+            self._verify_running = None
+            self.verify_button.setEnabled(True)
+        if not token.cancelled:
+            self.verify_status.setText(_verify_summary(faults))
+        return faults
+
     def _append_from_entry(self) -> None:
         self._append_row(self.name.text(), self.lba.text())
         self.name.clear()
@@ -40,8 +92,9 @@ class LbaFilesystemRowsMixin:
             row.deleteLater()
             remove_slot.deleteLater()
         self._rows.clear()
+        self._row_sizes.clear()
 
-    def _append_row(self, name: str, lba: str) -> None:
+    def _append_row(self, name: str, lba: str, size: int = 0) -> None:
         row = QWidget(self.body)
         row.setObjectName("workspace-row")
         row.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
@@ -81,6 +134,9 @@ class LbaFilesystemRowsMixin:
         layout.addWidget(go_to, 1, Qt.AlignVCenter)
         remove_slot.layout().addWidget(remove, 0, Qt.AlignCenter)
         self._rows.append((name_edit, lba_edit, row, remove_slot))
+        if size > 0:
+            # An exact size only describes the LBA it was read with.
+            self._row_sizes[lba_edit] = (lba.strip(), size)
         self.body_layout.addWidget(row, 0)
         self.remove_layout.addWidget(remove_slot, 0)
 
@@ -92,6 +148,7 @@ class LbaFilesystemRowsMixin:
 
     def _remove_row(self, row: QWidget, remove_slot: QWidget) -> None:
         self._rows = [item for item in self._rows if item[2] is not row]
+        self._row_sizes = {lba: size for lba, size in self._row_sizes.items() if lba.parentWidget() is not row}
         row.deleteLater()
         remove_slot.deleteLater()
 
@@ -103,3 +160,19 @@ def _remove_slot(parent: QWidget) -> QWidget:
     layout = QVBoxLayout(slot)
     layout.setContentsMargins(*ENVIRONMENT_LAYOUT.EMPTY_MARGINS)
     return slot
+
+
+def _verify_summary(faults: list[SectorFault]) -> str:
+    if not faults:
+        return BINARY_WORKBENCH_FILE_DIALOG_TEXT.VERIFY_VALID
+    sectors = ", ".join(
+        BINARY_WORKBENCH_FILE_DIALOG_TEXT.VERIFY_FAULT.format(
+            lba=fault.sector_index,
+            name=f"{fault.internal_file} " if fault.internal_file else "",
+            codes="/".join(code for code, valid in (("EDC", fault.edc_valid), ("ECC", fault.ecc_valid)) if not valid),
+        )
+        for fault in faults[:VERIFY_FAULTS_SHOWN]
+    )
+    if len(faults) > VERIFY_FAULTS_SHOWN:
+        sectors += ", ..."
+    return BINARY_WORKBENCH_FILE_DIALOG_TEXT.VERIFY_FAULTS.format(count=len(faults), sectors=sectors)
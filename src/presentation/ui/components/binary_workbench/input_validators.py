@@ -8,7 +8,9 @@ from src.modules.constants import (
     DECIMAL_DIGITS,
     DECIMAL_INPUT_PATTERN as DECIMAL_INTEGER_PATTERN,
     HEX_INPUT_PATTERN as HEX_VALUE_PATTERN,
+    HEX_LIST_INPUT_PATTERN as HEX_LIST_PATTERN,
     HEX_LOWER_INPUT_PATTERN as HEX_BYTES_PATTERN,
+    HEX_RANGE_INPUT_PATTERN as HEX_RANGE_PATTERN,
 )
 
 PYTHON_IDENTIFIER_PATTERN = r"[A-Za-z_][A-Za-z0-9_]*"
@@ -65,3 +67,11 @@ def set_hex_value_validator(editor: QLineEdit) -> None:
 
 def set_hex_bytes_validator(editor: QLineEdit) -> None:
     editor.setValidator(QRegularExpressionValidator(QRegularExpression(HEX_BYTES_PATTERN), editor))
+
+
+def set_hex_list_validator(editor: QLineEdit) -> None:
+    editor.setValidator(QRegularExpressionValidator(QRegularExpression(HEX_LIST_PATTERN), editor))
+
+
+def set_hex_range_validator(editor: QLineEdit) -> None:
+    editor.setValidator(QRegularExpressionValidator(QRegularExpression(HEX_RANGE_PATTERN), editor))
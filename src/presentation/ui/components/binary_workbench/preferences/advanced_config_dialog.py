@@ -10,8 +10,10 @@ from src.core.binary_workbench.selection_limits import (
 from src.modules.binary_workbench_constants import (
     BINARY_WORKBENCH_BLOCK_SIZE_OPTIONS,
     BINARY_WORKBENCH_CACHE_MAX_BLOCKS_OPTIONS,
+    BINARY_WORKBENCH_CACHE_POLICY_OPTIONS,
     BINARY_WORKBENCH_DEFAULT_BLOCK_SIZE,
     BINARY_WORKBENCH_DEFAULT_CACHE_MAX_BLOCKS,
+    BINARY_WORKBENCH_DEFAULT_CACHE_POLICY,
     BINARY_WORKBENCH_PSX_MIPS_R3000A_DISPLAY_NAME,
 )
 from src.presentation.ui.components.binary_workbench.action_controls import (
@@ -34,6 +36,8 @@ class BinaryWorkbenchAdvancedConfigDialog(QDialog):
         current_cache_max_blocks: int,
         current_selection_limit_bytes: int,
         parent=None,
+        current_memory_mapped_reads: bool = False,
+        current_cache_policy: str = BINARY_WORKBENCH_DEFAULT_CACHE_POLICY,
     ) -> None:
         super().__init__(parent)
         self.setObjectName("preferences-dialog")
@@ -93,6 +97,33 @@ class BinaryWorkbenchAdvancedConfigDialog(QDialog):
                 )
             )
         )
+        cache_policy_label = QLabel(BINARY_WORKBENCH_ADVANCED_CONFIG_TEXT.CACHE_POLICY_LABEL, self)
+        cache_policy_label.setObjectName("preferences-section-title")
+        self.cache_policy = QComboBox(self)
+        self.cache_policy.setObjectName("advanced-config-dropdown")
+        self.cache_policy.setCursor(Qt.PointingHandCursor)
+        self.cache_policy.addItems(list(BINARY_WORKBENCH_CACHE_POLICY_OPTIONS))
+        self.cache_policy.setCurrentText(
+            current_cache_policy
+            if current_cache_policy in BINARY_WORKBENCH_CACHE_POLICY_OPTIONS
+            else BINARY_WORKBENCH_DEFAULT_CACHE_POLICY
+        )
+        reader_label = QLabel(BINARY_WORKBENCH_ADVANCED_CONFIG_TEXT.READER_LABEL, self)
+        reader_label.setObjectName("preferences-section-title")
+        self.reader_combo = QComboBox(self)
+        self.reader_combo.setObjectName("advanced-config-dropdown")
+        self.reader_combo.setCursor(Qt.PointingHandCursor)
+        self.reader_combo.addItems(
+            [
+                BINARY_WORKBENCH_ADVANCED_CONFIG_TEXT.BLOCK_CACHE_READER,
+                BINARY_WORKBENCH_ADVANCED_CONFIG_TEXT.MEMORY_MAPPED_READER,
+            ]
+        )
+        self.reader_combo.setCurrentText(
+            BINARY_WORKBENCH_ADVANCED_CONFIG_TEXT.MEMORY_MAPPED_READER
+            if current_memory_mapped_reads
+            else BINARY_WORKBENCH_ADVANCED_CONFIG_TEXT.BLOCK_CACHE_READER
+        )
         selection_limit_label = QLabel(
             BINARY_WORKBENCH_ADVANCED_CONFIG_TEXT.SELECTION_LIMIT_LABEL,
             self,
@@ -119,6 +150,8 @@ class BinaryWorkbenchAdvancedConfigDialog(QDialog):
             self.read_mode_combo,
             self.block_size,
             self.cache_max_blocks,
+            self.cache_policy,
+            self.reader_combo,
             self.selection_limit,
         )
         layout.addWidget(arch_label)
@@ -129,6 +162,10 @@ class BinaryWorkbenchAdvancedConfigDialog(QDialog):
         layout.addWidget(self.block_size)
         layout.addWidget(cache_label)
         layout.addWidget(self.cache_max_blocks)
+        layout.addWidget(cache_policy_label)
+        layout.addWidget(self.cache_policy)
+        layout.addWidget(reader_label)
+        layout.addWidget(self.reader_combo)
         layout.addWidget(selection_limit_label)
         layout.addWidget(self.selection_limit)
         layout.addSpacing(
@@ -152,6 +189,12 @@ class BinaryWorkbenchAdvancedConfigDialog(QDialog):
     def selected_cache_max_blocks(self) -> int:
         return int(self.cache_max_blocks.currentText())
 
+    def selected_cache_policy(self) -> str:
+        return self.cache_policy.currentText()
+
+    def selected_memory_mapped_reads(self) -> bool:
+        return self.reader_combo.currentText() == BINARY_WORKBENCH_ADVANCED_CONFIG_TEXT.MEMORY_MAPPED_READER
+
     def selected_selection_limit_bytes(self) -> int:
         return _selection_limit_bytes(self.selection_limit.currentText())
 
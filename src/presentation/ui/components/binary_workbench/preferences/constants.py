@@ -4,6 +4,10 @@ class BINARY_WORKBENCH_ADVANCED_CONFIG_TEXT:
     READ_MODE_LABEL: str = "Read Mode"
     BLOCK_SIZE_LABEL: str = "Block Size"
     CACHE_MAX_BLOCKS_LABEL: str = "Cache Max Blocks"
+    CACHE_POLICY_LABEL: str = "Cache Policy"
+    READER_LABEL: str = "Reader"
+    BLOCK_CACHE_READER: str = "Block Cache"
+    MEMORY_MAPPED_READER: str = "Memory Mapped"
     SELECTION_LIMIT_LABEL: str = "Selection Limit"
     CONFIRM: str = "Confirm"
 
@@ -1,18 +1,28 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QComboBox, QDialog, QPushButton
+from PySide6.QtCore import QCoreApplication, Qt, QTimer, Signal
+from PySide6.QtWidgets import QCheckBox, QComboBox, QDialog, QFileDialog, QHBoxLayout, QLabel, QPushButton
 
+from src.core.binary_workbench.searching import CancellationToken, SearchBatch, drain_search
+from src.core.binary_workbench.searching.workspace_search import WorkspaceSearchResult
 from src.modules.binary_workbench_constants import (
     BINARY_WORKBENCH_FIND_DEFAULT_LENGTH_KB,
     BINARY_WORKBENCH_FIND_MAX_LENGTH_BYTES,
     BINARY_WORKBENCH_FIND_MAX_LENGTH_KB,
 )
 from src.modules.constants import HEX_DIGITS_LOWER
-from src.presentation.ui.components.binary_workbench.constants import BINARY_WORKBENCH_LAYOUT, BINARY_WORKBENCH_TEXT
+from src.presentation.ui.components.binary_workbench.action_controls import configure_binary_workbench_dialog_action
+from src.presentation.ui.components.binary_workbench.constants import (
+    BINARY_WORKBENCH_LAYOUT,
+    BINARY_WORKBENCH_TEXT,
+    BINARY_WORKBENCH_TIMING,
+)
 from src.presentation.ui.components.binary_workbench.input_validators import (
     set_decimal_integer_validator,
     set_hex_bytes_validator,
+    set_hex_list_validator,
+    set_hex_range_validator,
     set_hex_value_validator,
 )
 from src.presentation.ui.components.binary_workbench.search.dialog_layout import (
@@ -21,22 +31,38 @@ from src.presentation.ui.components.binary_workbench.search.dialog_layout import
     finish_search_dialog,
     search_line_edit,
 )
-from src.presentation.ui.components.binary_workbench.search.results_list import SearchResultsList
+from src.presentation.ui.components.binary_workbench.search.results_list import (
+    SEARCH_RESULT_TARGET_ROLE,
+    SearchResultsList,
+)
 
 
 class BinaryWorkbenchFindDialog(QDialog):
     goToRequested = Signal(int)
+    targetRequested = Signal(str, int)
 
     def __init__(
         self,
         search: Callable[[str, str, int | None, int | None, int | None], list[int]],
         last_search_end: Callable[[], int | None] | None = None,
         parent=None,
+        index_status: Callable[[], str] | None = None,
+        build_index: Callable[[], None] | None = None,
+        search_batches: Callable[..., Iterator[SearchBatch]] | None = None,
+        search_all: Callable[..., Iterator[WorkspaceSearchResult]] | None = None,
     ) -> None:
         super().__init__(parent)
         self._search = search
+        self._search_batches = search_batches
+        self._search_all = search_all
+        self._running: CancellationToken | None = None
+        self._extra_paths: list[Path] = []
+        self._targets: list[tuple[str, int]] = []
+        self.all_tabs: QCheckBox | None = None
         self._last_search_end = last_search_end
+        self._index_status = index_status
         self._offsets: list[int] = []
+        self._pointer_targets: dict[int, int] = {}
         self.setObjectName("preferences-dialog")
         self.setWindowTitle(BINARY_WORKBENCH_TEXT.FIND)
         self.setFixedSize(
@@ -57,6 +83,8 @@ class BinaryWorkbenchFindDialog(QDialog):
             BINARY_WORKBENCH_TEXT.FIND_ASSEMBLY,
             BINARY_WORKBENCH_TEXT.FIND_HEX_BYTES,
             BINARY_WORKBENCH_TEXT.FIND_DECODED_TEXT,
+            BINARY_WORKBENCH_TEXT.FIND_SEARCH_LIST,
+            BINARY_WORKBENCH_TEXT.FIND_POINTERS,
         ])
         self.query = search_line_edit(self, BINARY_WORKBENCH_TEXT.VALUE)
         self.mode.currentTextChanged.connect(self._sync_query_validator)
@@ -73,13 +101,21 @@ class BinaryWorkbenchFindDialog(QDialog):
         layout.addWidget(self.end)
         layout.addWidget(self.length)
         layout.addWidget(self.results)
-        search_button = QPushButton(BINARY_WORKBENCH_TEXT.FIND, self)
+        self.progress = QLabel(self)
+        self.progress.setObjectName("preferences-subtitle")
+        layout.addWidget(self.progress)
+        if search_all is not None:
+            layout.addLayout(self._workspace_row())
+        if index_status is not None:
+            layout.addLayout(self._index_row(build_index))
+        self.search_button = search_button = QPushButton(BINARY_WORKBENCH_TEXT.FIND, self)
         search_button.clicked.connect(self.refresh_results)
         self.query.returnPressed.connect(self.refresh_results)
         self.start.returnPressed.connect(self.refresh_results)
         self.end.returnPressed.connect(self.refresh_results)
         self.length.returnPressed.connect(self.refresh_results)
         self.results.offsetActivated.connect(self.goToRequested)
+        self.results.targetActivated.connect(self.targetRequested)
         finish_search_dialog(
             layout,
             search_button,
@@ -89,31 +125,55 @@ class BinaryWorkbenchFindDialog(QDialog):
         self._sync_query_validator(self.mode.currentText())
 
     def refresh_results(self) -> None:
+        if self._running is not None:
+            self._running.cancel()
+            return
         try:
             start_offset, end_offset = self._offset_range()
         except ValueError:
             self._offsets = []
         else:
-            self._offsets = self._search(
-                self.mode.currentText(),
-                self.query.text().strip(),
-                start_offset,
-                end_offset,
-                None,
-            )
+            mode = self.mode.currentText()
+            query = self.query.text().strip()
+            self._pointer_targets = {}
+            if self._workspace_mode():
+                self._run_workspace_search(mode, query, start_offset, end_offset)
+                return
+            if self._search_batches is None:
+                self._offsets = self._search(mode, query, start_offset, end_offset, None)
+            else:
+                self._offsets = self._run_search_batches(mode, query, start_offset, end_offset)
             self._fill_next_start_offset()
         self.results.clear()
         for offset in self._offsets:
-            self.results.addItem(f"0x{offset:08X}")
+            self.results.add_offset(offset, self._pointer_targets.get(offset))
+
+    def done(self, result: int) -> None:
+        if self._running is not None:
+            self._running.cancel()
+        super().done(result)
+
+    def refresh_index_status(self) -> None:
+        if self._index_status is not None:
+            self.index_status.setText(self._index_status())
 
     def selected_offset(self) -> int | None:
-        if not self._offsets:
+        if not self._offsets and not self._workspace_mode():
             self.refresh_results()
         row = self.results.currentRow()
         if 0 <= row < len(self._offsets):
             return self._offsets[row]
         return self._offsets[0] if self._offsets else None
 
+    def selected_target(self) -> tuple[str, int] | None:
+        if not self._workspace_mode():
+            return None
+        item = self.results.currentItem()
+        key = None if item is None else item.data(SEARCH_RESULT_TARGET_ROLE)
+        if key is not None:
+            return key, int(item.text(), 0)
+        return self._targets[0] if self._targets else None
+
     def _offset_range(self) -> tuple[int | None, int | None]:
         start = self.start.text().strip()
         end = self.end.text().strip()
@@ -133,6 +193,99 @@ class BinaryWorkbenchFindDialog(QDialog):
             return max(0, end_offset - length_value + 1), end_offset
         return 0, length_value - 1
 
+    def _run_search_batches(self, mode: str, query: str, start_offset: int | None, end_offset: int | None) -> list[int]:
+        token = CancellationToken()
+        self._running = token
+        self.search_button.setText(BINARY_WORKBENCH_TEXT.FIND_STOP)
+        self.results.clear()
+        try:
+            found = drain_search(self._search_batches(mode, query, start_offset, end_offset, None, token), self._show_batch)
+        finally:
+            self._running = None
+            self.search_button.setText(BINARY_WORKBENCH_TEXT.FIND)
+            self.progress.clear()
+        return sorted(dict.fromkeys(found))
+
+    def _run_workspace_search(self, mode: str, query: str, start_offset: int | None, end_offset: int | None) -> None:
+        token = CancellationToken()
+        self._running = token
+        self._offsets = []
+        self._targets = []
+        self.search_button.setText(BINARY_WORKBENCH_TEXT.FIND_STOP)
+        self.results.clear()
+        app = QCoreApplication.instance()
+        idle = None if app is None else app.processEvents
+        paths = list(self._extra_paths)
+        try:
+            for result in self._search_all(mode, query, start_offset, end_offset, paths, token, idle):
+                if result.error:
+                    self.results.add_target_error(
+                        BINARY_WORKBENCH_TEXT.FIND_TARGET_FAILED.format(label=result.label, error=result.error)
+                    )
+                elif result.offsets:
+                    self.results.add_target_group(result.label, result.key, result.offsets)
+                    self._targets.extend((result.key, offset) for offset in result.offsets)
+                if idle is not None:
+                    idle()
+        finally:
+            self._running = None
+            self.search_button.setText(BINARY_WORKBENCH_TEXT.FIND)
+
+    def _workspace_mode(self) -> bool:
+        return self.all_tabs is not None and self.all_tabs.isChecked()
+
+    def _workspace_row(self) -> QHBoxLayout:
+        self.all_tabs = QCheckBox(BINARY_WORKBENCH_TEXT.FIND_ALL_TABS, self)
+        self.all_tabs.setObjectName("binary-workbench-dialog-check")
+        self.all_tabs.setCursor(Qt.PointingHandCursor)
+        self.extra_files = QLabel(self)
+        self.extra_files.setObjectName("preferences-subtitle")
+        add_files = QPushButton(BINARY_WORKBENCH_TEXT.FIND_ADD_FILES, self)
+        configure_binary_workbench_dialog_action(add_files)
+        add_files.clicked.connect(self._add_extra_files)
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        row.addWidget(self.all_tabs)
+        row.addWidget(self.extra_files, 1)
+        row.addWidget(add_files, 0, Qt.AlignRight)
+        return row
+
+    def _add_extra_files(self) -> None:
+        paths, _ = QFileDialog.getOpenFileNames(self, BINARY_WORKBENCH_TEXT.FIND_ADD_FILES)
+        self._extra_paths.extend(Path(path) for path in paths if Path(path) not in self._extra_paths)
+        if self._extra_paths and self.all_tabs is not None:
+            self.all_tabs.setChecked(True)
+            self.extra_files.setText(BINARY_WORKBENCH_TEXT.FIND_EXTRA_FILES.format(count=len(self._extra_paths)))
+
+    def _show_batch(self, batch: SearchBatch) -> None:
+        self._pointer_targets.update(zip(batch.offsets, batch.targets))
+        for offset in batch.offsets:
+            self.results.add_offset(offset, self._pointer_targets.get(offset))
+        if batch.total:
+            self.progress.setText(BINARY_WORKBENCH_TEXT.FIND_PROGRESS.format(percent=batch.scanned * 100 // batch.total))
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.processEvents()
+
+    def _index_row(self, build_index: Callable[[], None] | None) -> QHBoxLayout:
+        self.index_status = QLabel(self)
+        self.index_status.setObjectName("preferences-subtitle")
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        row.addWidget(self.index_status, 1)
+        if build_index is not None:
+            self.build_index_button = QPushButton(BINARY_WORKBENCH_TEXT.FIND_BUILD_INDEX, self)
+            configure_binary_workbench_dialog_action(self.build_index_button)
+            self.build_index_button.clicked.connect(build_index)
+            self.build_index_button.clicked.connect(self.refresh_index_status)
+            row.addWidget(self.build_index_button, 0, Qt.AlignRight)
+        self._index_timer = QTimer(self)
+        self._index_timer.setInterval(BINARY_WORKBENCH_TIMING.SEARCH_INDEX_REFRESH_MS)
+        self._index_timer.timeout.connect(self.refresh_index_status)
+        self._index_timer.start()
+        self.refresh_index_status()
+        return row
+
     def _fill_next_start_offset(self) -> None:
         if self._last_search_end is None:
             return
@@ -141,6 +294,16 @@ class BinaryWorkbenchFindDialog(QDialog):
             self.start.setText(f"0x{end_offset:08X}")
 
     def _sync_query_validator(self, mode: str) -> None:
+        if mode == BINARY_WORKBENCH_TEXT.FIND_POINTERS:
+            set_hex_range_validator(self.query)
+            return
+        if mode == BINARY_WORKBENCH_TEXT.FIND_SEARCH_LIST:
+            allowed = f"{HEX_DIGITS_LOWER} ,;"
+            clean = "".join(character for character in self.query.text().lower() if character in allowed)
+            if clean != self.query.text():
+                self.query.setText(clean)
+            set_hex_list_validator(self.query)
+            return
         if mode != BINARY_WORKBENCH_TEXT.FIND_HEX_BYTES:
             self.query.setValidator(None)
             return
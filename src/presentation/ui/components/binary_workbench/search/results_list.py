@@ -1,11 +1,16 @@
 from PySide6.QtCore import QEvent, Qt, Signal
-from PySide6.QtWidgets import QApplication, QListWidget
+from PySide6.QtWidgets import QApplication, QListWidget, QListWidgetItem
 
 from src.presentation.ui.components.binary_workbench.constants import BINARY_WORKBENCH_LAYOUT
 
 
+SEARCH_RESULT_TARGET_ROLE = Qt.UserRole + 1
+SEARCH_RESULT_POINTER_ROLE = Qt.UserRole + 2
+
+
 class SearchResultsList(QListWidget):
     offsetActivated = Signal(int)
+    targetActivated = Signal(str, int)
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
@@ -15,8 +20,41 @@ class SearchResultsList(QListWidget):
         self.setSpacing(BINARY_WORKBENCH_LAYOUT.SEARCH_RESULT_ITEM_SPACING)
         self.viewport().setMouseTracking(True)
         self.viewport().installEventFilter(self)
-        self.itemClicked.connect(lambda item: self.offsetActivated.emit(int(item.text(), 0)))
-        self.itemDoubleClicked.connect(lambda item: _copy_offset_text(item.text()))
+        self.itemClicked.connect(self._activate)
+        self.itemDoubleClicked.connect(self._double_clicked)
+
+    def add_offset(self, offset: int, target: int | None = None) -> None:
+        if target is None:
+            self.addItem(f"0x{offset:08X}")
+            return
+        item = QListWidgetItem(f"0x{offset:08X} -> 0x{target:08X}", self)
+        item.setData(SEARCH_RESULT_POINTER_ROLE, target)
+
+    def add_target_group(self, label: str, key: str, offsets: tuple[int, ...]) -> None:
+        header = QListWidgetItem(f"{label} ({len(offsets)})", self)
+        header.setFlags(Qt.NoItemFlags)
+        for offset in offsets:
+            item = QListWidgetItem(f"    0x{offset:08X}", self)
+            item.setData(SEARCH_RESULT_TARGET_ROLE, key)
+
+    def add_target_error(self, text: str) -> None:
+        header = QListWidgetItem(text, self)
+        header.setFlags(Qt.NoItemFlags)
+
+    def _activate(self, item: QListWidgetItem) -> None:
+        key = item.data(SEARCH_RESULT_TARGET_ROLE)
+        offset = int(item.text().split()[0], 0)
+        if key is None:
+            self.offsetActivated.emit(offset)
+        else:
+            self.targetActivated.emit(key, offset)
+
+    def _double_clicked(self, item: QListWidgetItem) -> None:
+        target = item.data(SEARCH_RESULT_POINTER_ROLE)
+        if target is None:
+            _copy_offset_text(item.text().strip())
+        else:
+            self.offsetActivated.emit(target)
 
     def eventFilter(self, watched, event) -> bool:
         if watched is self.viewport():
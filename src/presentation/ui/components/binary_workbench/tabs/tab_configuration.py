@@ -27,6 +27,8 @@ class TabConfigurationMixin:
         block_size: int,
         cache_max_blocks: int,
         selection_limit_bytes: int,
+        memory_mapped_reads: bool,
+        cache_policy: str,
     ) -> None:
         current = self.current_context()
         if current is None:
@@ -38,6 +40,8 @@ class TabConfigurationMixin:
                 uppercase_instructions=self._preferences.uppercase_instructions,
                 block_size=block_size,
                 cache_max_blocks=cache_max_blocks,
+                memory_mapped_reads=memory_mapped_reads,
+                cache_policy=cache_policy,
                 selection_limit_bytes=selection_limit_bytes,
                 binary_edit_rules=self._preferences.binary_edit_rules,
                 assembly_edit_rules=self._preferences.assembly_edit_rules,
@@ -67,6 +71,7 @@ class TabConfigurationMixin:
                 uppercase_instructions=uppercase_instructions,
                 block_size=self._preferences.block_size,
                 cache_max_blocks=self._preferences.cache_max_blocks,
+                memory_mapped_reads=self._preferences.memory_mapped_reads,
                 selection_limit_bytes=self._preferences.selection_limit_bytes,
                 binary_edit_rules=self._preferences.binary_edit_rules,
                 assembly_edit_rules=self._preferences.assembly_edit_rules,
@@ -102,6 +107,7 @@ class TabConfigurationMixin:
                 uppercase_instructions=self._preferences.uppercase_instructions,
                 block_size=self._preferences.block_size,
                 cache_max_blocks=self._preferences.cache_max_blocks,
+                memory_mapped_reads=self._preferences.memory_mapped_reads,
                 selection_limit_bytes=self._preferences.selection_limit_bytes,
                 binary_edit_rules=binary_rules,
                 assembly_edit_rules=assembly_rules,
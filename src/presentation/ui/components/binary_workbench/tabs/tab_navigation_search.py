@@ -1,6 +1,23 @@
+from collections.abc import Callable, Generator, Iterator
+from pathlib import Path
+
+from src.core.binary_workbench.block_reader import CachedBinaryReader
+from src.core.binary_workbench.codec_registry import binary_workbench_codec_for
 from src.core.binary_workbench.search_cache import SearchCacheQuery
-from src.modules.binary_workbench_constants import BINARY_WORKBENCH_DEFAULT_SEARCH_RESULT_LIMIT
+from src.core.binary_workbench.searching import SearchBatch, drain_search, reader_search_batches
+from src.core.binary_workbench.searching.workspace_search import (
+    SearchJob,
+    WorkspaceSearchResult,
+    WorkspaceSearchTarget,
+    search_workspace,
+)
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_DEFAULT_SEARCH_RESULT_LIMIT,
+    BINARY_WORKBENCH_PSX_MIPS_R3000A_DISPLAY_NAME,
+    BINARY_WORKBENCH_TAB_KIND,
+)
 from src.modules.binary_workbench_dtos import BinaryWorkbenchTabContextDTO
+from src.presentation.ui.components.binary_workbench.constants import BINARY_WORKBENCH_TEXT
 from src.presentation.ui.components.binary_workbench.editor import BinaryWorkbenchEditorPage
 
 
@@ -52,6 +69,17 @@ class TabNavigationSearchMixin:
         end_offset: int | None = None,
         max_results: int | None = None,
     ) -> list[int]:
+        return drain_search(self.search_batches(mode, query, start_offset, end_offset, max_results))
+
+    def search_batches(
+        self,
+        mode: str,
+        query: str,
+        start_offset: int | None = None,
+        end_offset: int | None = None,
+        max_results: int | None = None,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> Generator[SearchBatch, None, list[int]]:
         page = self.currentWidget()
         if not isinstance(page, BinaryWorkbenchEditorPage):
             return []
@@ -65,17 +93,24 @@ class TabNavigationSearchMixin:
             if not missing_ranges:
                 page.remember_search_end_offset(start_offset, end_offset)
                 self._cache_search_results(mode, query, cached, start_offset, end_offset)
+                yield SearchBatch(tuple(cached), 0, 0)
                 return cached
+        if cached:
+            yield SearchBatch(tuple(cached), 0, 0)
         results = list(cached)
         for missing_start, missing_end in missing_ranges:
             remaining = None if max_results is None else max_results - len(results)
             if remaining is not None and remaining <= 0:
                 break
-            results.extend(page.find_offsets(mode, query, missing_start, missing_end, remaining))
+            for batch in page.search_batches(mode, query, missing_start, missing_end, remaining, cancelled):
+                results.extend(batch.offsets)
+                yield batch
         results = sorted(dict.fromkeys(results))
         if max_results is not None:
             results = results[:max_results]
         page.remember_search_end_offset(start_offset, end_offset)
+        if cancelled is not None and cancelled():
+            return results
         if query_key is not None:
             search_cache = self._search_cache_for_find()
             search_cache.put(query_key, results)
@@ -84,6 +119,76 @@ class TabNavigationSearchMixin:
         self._cache_search_results(mode, query, results, start_offset, end_offset)
         return results
 
+    def search_all_tabs(
+        self,
+        mode: str,
+        query: str,
+        start_offset: int | None = None,
+        end_offset: int | None = None,
+        paths: list[Path] | None = None,
+        cancelled: Callable[[], bool] | None = None,
+        idle: Callable[[], None] | None = None,
+    ) -> Iterator[WorkspaceSearchResult]:
+        targets: list[WorkspaceSearchTarget] = []
+        codec = None
+        for index in range(self.count()):
+            page = self.widget(index)
+            context = self.context_at(index)
+            if not isinstance(page, BinaryWorkbenchEditorPage) or context is None:
+                continue
+            codec = codec or page.grid._codec
+            if page.search_unloaded():
+                job = self._unloaded_search_job(page.current_context(), mode, query, start_offset, end_offset)
+            else:
+                job = page.search_job(mode, query, start_offset, end_offset)
+            targets.append(WorkspaceSearchTarget(context.tab_id, self.tabText(index), job))
+        codec = codec or binary_workbench_codec_for(BINARY_WORKBENCH_PSX_MIPS_R3000A_DISPLAY_NAME)
+        for path in paths or []:
+            reader = CachedBinaryReader(path, self._preferences.block_size, self._preferences.cache_max_blocks)
+            job = _file_search_job(reader, codec, mode, query, start_offset, end_offset)
+            targets.append(WorkspaceSearchTarget(str(path), path.name, job))
+        return search_workspace(targets, cancelled, idle=idle)
+
+    def _unloaded_search_job(
+        self,
+        context: BinaryWorkbenchTabContextDTO,
+        mode: str,
+        query: str,
+        start_offset: int | None,
+        end_offset: int | None,
+    ) -> SearchJob:
+        """Tabs released by workspace memory are searched on their source file, or reported as not searched."""
+        path = Path(context.source_path) if context.source_path else None
+        if context.kind != BINARY_WORKBENCH_TAB_KIND.BINARY or path is None or not path.is_file():
+            return _unavailable_search_job(BINARY_WORKBENCH_TEXT.FIND_TAB_UNLOADED)
+        reader = CachedBinaryReader(path, self._preferences.block_size, self._preferences.cache_max_blocks)
+        codec = binary_workbench_codec_for(context.cpu_arch)
+        return _file_search_job(reader, codec, mode, query, start_offset, end_offset)
+
+    def go_to_search_target(self, key: str, offset: int) -> None:
+        index = next((index for index, tab in enumerate(self._state.tabs) if tab.tab_id == key), None)
+        if index is not None:
+            self.setCurrentIndex(index)
+        elif not self._activate_open_file_tab(Path(key)):
+            self.open_binary_path(Path(key))
+        self.go_to_offset(offset)
+
+    def cancel_search(self) -> None:
+        page = self.currentWidget()
+        if isinstance(page, BinaryWorkbenchEditorPage):
+            page.cancel_search()
+
+    def search_index_status(self) -> str:
+        page = self.currentWidget()
+        if isinstance(page, BinaryWorkbenchEditorPage):
+            return page.search_index_status()
+        return BINARY_WORKBENCH_TEXT.FIND_INDEX_UNAVAILABLE
+
+    def build_search_index(self) -> None:
+        page = self.currentWidget()
+        if isinstance(page, BinaryWorkbenchEditorPage):
+            page.build_search_index()
+
     def last_search_end_offset(self) -> int | None:
         page = self.currentWidget()
         if isinstance(page, BinaryWorkbenchEditorPage):
@@ -128,7 +233,7 @@ class TabNavigationSearchMixin:
         max_results: int | None,
     ) -> SearchCacheQuery | None:
         current = self.current_context()
-        if current is None or not query or max_results is not None:
+        if current is None or not query or max_results is not None or mode == BINARY_WORKBENCH_TEXT.FIND_POINTERS:
             return None
         source = current.source_path or current.workspace_path or current.tab_id
         source_id = f"{current.kind}:{source}:{current.file_size}:{current.active_version_name or ''}"
@@ -140,3 +245,17 @@ class TabNavigationSearchMixin:
             end_offset=end_offset,
             result_limit=max_results,
         )
+
+
+def _file_search_job(reader: CachedBinaryReader, codec, mode: str, query: str, start_offset, end_offset) -> SearchJob:
+    def run(cancelled: Callable[[], bool] | None = None) -> list[int]:
+        return drain_search(reader_search_batches(reader, codec, {}, mode, query, start_offset, end_offset, None, cancelled))
+
+    return run
+
+
+def _unavailable_search_job(reason: str) -> SearchJob:
+    def run(cancelled: Callable[[], bool] | None = None) -> list[int]:
+        raise RuntimeError(reason)
+
+    return run
@@ -74,6 +74,9 @@ class TabPageManagementMixin:
             context,
             self._preferences,
             self._command_directory(),
+            self._opcode_index_store,
+            self._suffix_index_store,
+            self._sector_map_store,
         )
         page.contextChanged.connect(
             lambda updated, tab_id=context.tab_id: self._handle_page_context_change(
@@ -6,6 +6,9 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QHBoxLayout, QTabWidget, QToolButton, QWidget
 
 from src.controllers.binary_workbench_controller import BinaryWorkbenchController
+from src.core.binary_workbench.opcode_index import OpcodeIndexStore
+from src.core.binary_workbench.searching.suffix_index import SuffixIndexStore
+from src.core.binary_workbench.sector_map import SectorMapStore
 from src.core.binary_workbench.search_cache import (
     SearchCacheRepository,
     SearchCacheService,
@@ -101,6 +104,15 @@ class BinaryWorkbenchTabs(
             self._workspace_repository.directory.parent / "search_cache.json"
         )
         self._search_cache: SearchCacheService | None = None
+        self._opcode_index_store = OpcodeIndexStore(
+            self._workspace_repository.directory.parent / "opcode_index"
+        )
+        self._suffix_index_store = SuffixIndexStore(
+            self._workspace_repository.directory.parent / "suffix_index"
+        )
+        self._sector_map_store = SectorMapStore(
+            self._workspace_repository.directory.parent / "sector_map"
+        )
         self._preferences = preferences or BinaryWorkbenchPreferencesDTO()
         self._program_context = program_context or ProgramContextDTO()
         self._controller = BinaryWorkbenchController()
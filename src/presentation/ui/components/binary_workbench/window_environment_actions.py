@@ -40,6 +40,8 @@ class BinaryWorkbenchWindowEnvironmentMixin:
             preferences.cache_max_blocks,
             preferences.selection_limit_bytes,
             self,
+            preferences.memory_mapped_reads,
+            preferences.cache_policy,
         )
         if dialog.exec() == dialog.DialogCode.Accepted:
             self.tabs.set_current_advanced_config(
@@ -48,6 +50,8 @@ class BinaryWorkbenchWindowEnvironmentMixin:
                 dialog.selected_block_size(),
                 dialog.selected_cache_max_blocks(),
                 dialog.selected_selection_limit_bytes(),
+                dialog.selected_memory_mapped_reads(),
+                dialog.selected_cache_policy(),
             )
 
     def _open_lba_filesystem(self) -> None:
@@ -55,7 +59,7 @@ class BinaryWorkbenchWindowEnvironmentMixin:
         if current is None or not current.source_path:
             self._show_status(BINARY_WORKBENCH_TEXT.STATUS_INTERNAL_SOURCE_REQUIRED, BINARY_WORKBENCH_TIMING.STATUS_MESSAGE_VISIBLE_MS)
             return
-        dialog = BinaryWorkbenchLbaFilesystemDialog(current.internal_files, current.lba_sector_size, [], current.display_name, self.tabs.directory_for(BINARY_WORKBENCH_STATE.LBA_FILESYSTEM_DIRECTORY), self)
+        dialog = BinaryWorkbenchLbaFilesystemDialog(current.internal_files, current.lba_sector_size, [], current.display_name, self.tabs.directory_for(BINARY_WORKBENCH_STATE.LBA_FILESYSTEM_DIRECTORY), self, source_path=Path(current.source_path))
         dialog.directoryChanged.connect(lambda value: self.tabs.set_directory(BINARY_WORKBENCH_STATE.LBA_FILESYSTEM_DIRECTORY, Path(value)))
         dialog.goToRequested.connect(self.tabs.go_to_offset)
         if dialog.exec() == dialog.DialogCode.Accepted:
@@ -32,10 +32,20 @@ class BinaryWorkbenchWindowSearchMixin:
             self.tabs.find_offsets,
             self.tabs.last_search_end_offset,
             self,
+            self.tabs.search_index_status,
+            self.tabs.build_search_index,
+            self.tabs.search_batches,
+            self.tabs.search_all_tabs,
         )
         dialog.goToRequested.connect(self.tabs.go_to_offset)
+        dialog.targetRequested.connect(self.tabs.go_to_search_target)
+        dialog.rejected.connect(self.tabs.cancel_search)
         if dialog.exec() != dialog.DialogCode.Accepted:
             return
+        target = dialog.selected_target()
+        if target is not None:
+            self.tabs.go_to_search_target(*target)
+            return
         offset = dialog.selected_offset()
         if offset is None:
             self._show_status(BINARY_WORKBENCH_TEXT.STATUS_NOT_FOUND, BINARY_WORKBENCH_TIMING.STATUS_MESSAGE_VISIBLE_MS)
@@ -32,8 +32,10 @@ PAGE = HelpPageDefinition(
         <h2>Advanced Configuration</h2>
         <ul>
             <li>Choose CPU Arch and read mode for the active context.</li>
-            <li>Block Size and Cache Max Blocks tune how much binary data the editor reads and keeps ready.</li>
+            <li>Block Size and Cache Max Blocks tune how much binary data the editor reads and keeps ready. The cache is shared by every open tab, so Block Size x Cache Max Blocks is the total memory budget.</li>
             <li>Increasing cache can make Editor Assembly navigation smoother on large binaries, while smaller values reduce memory use.</li>
+            <li>Cache Policy picks how blocks are evicted: 2Q keeps revisited blocks while long scans pass through, LRU evicts the least recently read block.</li>
+            <li>Reader switches between the Block Cache and a Memory Mapped view of the source file, which avoids copying bytes while scrolling large images.</li>
             <li>Selection Limit controls the maximum block size selected by Select Block and virtual selections.</li>
         </ul>
     """,
@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from threading import Event
 
 from src.core.binary_workbench.block_reader import CachedBinaryReader
+from src.core.binary_workbench.read_ahead import InFlightBlockLoads, ReadAheadTracker
+from src.core.binary_workbench.shared_block_cache import SharedBlockCache, shared_block_cache
 
 
 def test_cached_binary_reader_reads_across_blocks(tmp_path: Path):
@@ -37,3 +41,168 @@ def test_cached_binary_reader_applies_overlay_without_touching_source(tmp_path:
 
     assert patched == bytes([2, 3, 0xAA, 0xBB, 0xCC, 0xDD])
     assert source.read_bytes()[4:8] == bytes([4, 5, 6, 7])
+
+
+def test_cached_binary_reader_memory_mapped_returns_views_and_copies_for_overlays(tmp_path: Path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(bytes(range(16)))
+    reader = CachedBinaryReader(source, block_size=4, cache_max_blocks=8, memory_mapped=True)
+
+    view = reader.read_view(2, 8)
+    patched = reader.read_view(2, 6, {4: bytes.fromhex("AA BB")})
+
+    assert reader.memory_mapped
+    assert isinstance(view, memoryview)
+    assert view.readonly
+    assert bytes(view) == bytes(range(2, 10))
+    assert bytes(patched) == bytes([2, 3, 0xAA, 0xBB, 6, 7])
+    assert reader.read(14, 8) == bytes([14, 15])
+    assert len(reader.cache) == 0
+    view.release()
+    patched.release()
+    reader.close()
+    assert not reader.memory_mapped
+
+
+def test_cached_binary_reader_falls_back_to_blocks_for_unmappable_files(tmp_path: Path):
+    source = tmp_path / "empty.bin"
+    source.write_bytes(b"")
+    reader = CachedBinaryReader(source, block_size=4, cache_max_blocks=8, memory_mapped=True)
+
+    assert not reader.memory_mapped
+    assert reader.read(0, 4) == b""
+
+
+def test_two_queue_cache_keeps_revisited_blocks_during_sequential_scan(tmp_path: Path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(bytes(256))
+    readers = {
+        policy: CachedBinaryReader(source, block_size=4, cache_max_blocks=8, cache_policy=policy)
+        for policy in ("LRU", "2Q")
+    }
+
+    for reader in readers.values():
+        for block in [0, 1, 2, 3, *range(10, 18), 0, 1, 2, 3, *range(20, 64)]:
+            reader.read(block * 4, 4)
+
+    assert all(readers["2Q"].cache.has(block) for block in range(4))
+    assert not any(readers["LRU"].cache.has(block) for block in range(4))
+    assert len(readers["2Q"].cache) == 8
+
+
+def test_block_cache_counts_hits_misses_and_evictions(tmp_path: Path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(bytes(range(32)))
+    reader = CachedBinaryReader(source, block_size=4, cache_max_blocks=2)
+
+    reader.read(0, 4)
+    reader.read(0, 4)
+    reader.read(4, 8)
+    stats = reader.cache.stats()
+
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 3, 1)
+    assert stats.hit_rate == 0.25
+
+
+def test_shared_block_cache_is_reused_by_readers_on_the_same_file(tmp_path: Path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(bytes(range(64)))
+    shared = SharedBlockCache(budget_bytes=32, policy="LRU")
+    first = CachedBinaryReader(source, block_size=8, cache_max_blocks=1, shared_cache=shared)
+    second = CachedBinaryReader(source, block_size=8, cache_max_blocks=1, shared_cache=shared)
+
+    assert first.read(0, 16) == bytes(range(16))
+    assert second.read(0, 16) == bytes(range(16))
+
+    assert shared.stats().hits == 2
+    assert len(second.cache) == 2
+
+
+def test_shared_block_cache_evicts_by_byte_budget(tmp_path: Path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(bytes(range(64)))
+    shared = SharedBlockCache(budget_bytes=24, policy="LRU")
+    reader = CachedBinaryReader(source, block_size=8, cache_max_blocks=100, shared_cache=shared)
+
+    reader.read(0, 64)
+
+    assert shared.size_bytes == 24
+    assert [reader.cache.has(block) for block in range(8)] == [False] * 5 + [True] * 3
+
+
+def test_shared_block_cache_reconfigures_in_place_for_open_readers(tmp_path: Path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(bytes(range(64)))
+    shared = SharedBlockCache(budget_bytes=64, policy="LRU")
+    reader = CachedBinaryReader(source, block_size=8, cache_max_blocks=100, shared_cache=shared)
+    reader.read(0, 64)
+
+    shared.configure(budget_bytes=24)
+
+    assert shared.size_bytes == 24
+    assert [reader.cache.has(block) for block in range(8)] == [False] * 5 + [True] * 3
+
+    shared.configure(budget_bytes=16, policy="2Q")
+
+    assert shared.policy_name == "2Q"
+    assert [reader.cache.has(block) for block in range(8)] == [False] * 6 + [True] * 2
+    assert shared.stats().evictions == 6
+
+
+def test_shared_block_cache_factory_keeps_one_instance():
+    cache = shared_block_cache()
+    budget, policy = cache.budget_bytes, cache.policy_name
+    try:
+        assert shared_block_cache(budget + 8, "LRU") is cache
+        assert (cache.budget_bytes, cache.policy_name) == (budget + 8, "LRU")
+    finally:
+        shared_block_cache(budget, policy)
+
+
+def test_cached_binary_reader_prefetches_blocks_in_background(tmp_path: Path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(bytes(range(64)))
+    reader = CachedBinaryReader(source, block_size=4, cache_max_blocks=16)
+
+    futures = reader.prefetch_for_offset(8, 1)
+    for future in futures:
+        future.result(timeout=5)
+
+    assert [future.result().block_index for future in futures] == [3]
+    assert reader.cache.has(3)
+    assert reader.prefetch_for_offset(8, 1) == []
+
+
+def test_read_ahead_tracker_widens_window_with_scroll_velocity():
+    now = [0.0]
+    tracker = ReadAheadTracker(block_size=4, max_blocks=8, clock=lambda: now[0])
+
+    assert tracker.blocks_ahead(40, -1) == [9]
+    now[0] = 0.25
+    assert tracker.blocks_ahead(32, 1) == [7, 6]
+    now[0] = 0.5
+    assert tracker.blocks_ahead(200, 1) == list(range(51, 59))
+
+
+def test_in_flight_loads_share_one_running_load():
+    loads: InFlightBlockLoads[int] = InFlightBlockLoads()
+    started = Event()
+    release = Event()
+    calls: list[int] = []
+
+    def slow_loader(block_index: int) -> int:
+        calls.append(block_index)
+        started.set()
+        release.wait(5)
+        return block_index * 10
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = loads.submit(executor, 2, slow_loader)
+        started.wait(5)
+        assert 2 in loads
+        release.set()
+        assert loads.load(2, slow_loader) == 20
+        assert future.result(timeout=5) == 20
+
+    assert calls == [2]
+    assert 2 not in loads
@@ -0,0 +1,42 @@
+from src.core.binary_workbench.byte_overlay_index import (
+    ByteOverlayIndex,
+    hex_byte_overlay_index,
+)
+
+
+def test_byte_overlay_index_returns_only_intersecting_patches():
+    index = ByteOverlayIndex({offset: b"\xAA\xBB\xCC\xDD" for offset in range(0, 4000, 4)})
+
+    assert index.intersecting(10, 18) == [(8, b"\xAA\xBB\xCC\xDD"), (12, b"\xAA\xBB\xCC\xDD"), (16, b"\xAA\xBB\xCC\xDD")]
+    assert index.intersecting(5000, 5004) == []
+    assert index.touches(3999, 4000)
+    assert not index.touches(4000, 4100)
+
+
+def test_byte_overlay_index_applies_patches_with_last_insert_winning():
+    index = ByteOverlayIndex({6: b"\x11\x22\x33\x44", 2: b"\xAA\xBB\xCC\xDD\xEE"})
+
+    assert index.apply(0, bytes(10)) == bytes([0, 0, 0xAA, 0xBB, 0xCC, 0xDD, 0xEE, 0x22, 0x33, 0x44])
+    assert index.apply(7, bytes(2)) == bytes([0x22, 0x33])
+    assert index.apply(20, b"\x01") == b"\x01"
+
+
+def test_hex_byte_overlay_index_is_reused_for_the_same_overlay_map():
+    values = {"0x00000004": "AA BB", "0x00000010": "CC"}
+
+    index = hex_byte_overlay_index(values)
+
+    assert hex_byte_overlay_index(values) is index
+    assert hex_byte_overlay_index(dict(values)) is index
+    assert dict(index) == {4: b"\xAA\xBB", 16: b"\xCC"}
+
+
+def test_hex_byte_overlay_index_sees_in_place_edits_that_keep_the_key_count():
+    values = {"0x00000004": "AA BB", "0x00000010": "CC"}
+    index = hex_byte_overlay_index(values)
+
+    values["0x00000010"] = "DD"
+    edited = hex_byte_overlay_index(values)
+
+    assert edited is not index
+    assert dict(edited) == {4: b"\xAA\xBB", 16: b"\xDD"}
@@ -6,12 +6,15 @@ from src.core.binary_workbench.internal_file_patch import (
     binary_overlays_from_internal_overlays,
     internal_overlays_from_binary_overlays,
 )
+from src.core.binary_workbench.block_reader import CachedBinaryReader
 from src.core.binary_workbench.internal_file_reader import InternalFileView
 from src.core.binary_workbench.internal_file_region import define_internal_file_region
 from src.core.binary_workbench.internal_offset_mapper import InternalOffsetMapper
 from src.core.binary_workbench.internal_versioned_binary_saver import save_internal_versioned_binary
 from src.core.binary_workbench.psx_sector_io import rebuild_psx_sector
 from src.core.binary_workbench.psx_sector_layout import RAW_SECTOR_SIZE, SYNC_HEADER, sector_layout
+from src.core.binary_workbench.sector_map import SectorMapStore
+from src.core.binary_workbench.shared_block_cache import SharedBlockCache
 from src.modules.binary_workbench_dtos import BinaryWorkbenchInternalFileDTO, BinaryWorkbenchRowDTO
 
 
@@ -37,6 +40,26 @@ def test_lazy_view_reads_only_useful_bytes_and_caches_requested_sector(tmp_path:
     assert view.mapper.cached_sector_count == 2
 
 
+def test_internal_view_reuses_parent_disc_blocks_from_shared_cache(tmp_path: Path):
+    source = tmp_path / "disc.bin"
+    payloads = [bytes([value]) * 2048 for value in (0x11, 0x22)]
+    source.write_bytes(b"".join(_mode2_form1_sector(data, index) for index, data in enumerate(payloads)))
+    files = [BinaryWorkbenchInternalFileDTO("FILE", 0)]
+    region = define_internal_file_region(source, files[0], files, RAW_SECTOR_SIZE)
+    shared = SharedBlockCache(budget_bytes=64 * 1024)
+    disc = CachedBinaryReader(source, block_size=2048, cache_max_blocks=1, shared_cache=shared)
+    disc.read(0, RAW_SECTOR_SIZE * 2)
+    misses = shared.stats().misses
+
+    view = InternalFileView(region, block_size=2048, cache_max_blocks=1, shared_cache=shared)
+
+    assert view.read(2046, 6) == payloads[0][-2:] + payloads[1][:4]
+    assert view.read(2046, 6) == payloads[0][-2:] + payloads[1][:4]
+    assert shared.stats().misses == misses
+    assert len(shared) == len(disc.cache) == 3
+    assert view.preload_block_async(1) is None
+
+
 def test_mapper_splits_range_at_useful_sector_boundary(tmp_path: Path):
     source = tmp_path / "disc.bin"
     source.write_bytes(_mode2_form1_sector(bytes(2048), 0) + _mode2_form1_sector(bytes(2048), 1))
@@ -51,6 +74,56 @@ def test_mapper_splits_range_at_useful_sector_boundary(tmp_path: Path):
     ]
 
 
+def test_mapper_bisects_loaded_spans_and_keeps_one_source_handle(tmp_path: Path, monkeypatch):
+    source = tmp_path / "disc.bin"
+    source.write_bytes(b"".join(_mode2_form1_sector(bytes([index]) * 2048, index) for index in range(40)))
+    target = BinaryWorkbenchInternalFileDTO("FILE", 0)
+    region = define_internal_file_region(source, target, [target], RAW_SECTOR_SIZE)
+    opened: list[Path] = []
+    original_open = Path.open
+
+    def tracked_open(path, *args, **kwargs):
+        opened.append(path)
+        return original_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", tracked_open)
+
+    with InternalOffsetMapper(region) as mapper:
+        assert mapper.read(2048 * 39 + 10, 2) == b"\x27\x27"
+        assert mapper.read(2048 * 3 - 1, 2) == b"\x02\x03"
+        chunks = mapper.chunks_for_internal_range(2048 * 20 + 5, 2048)
+
+    assert [(chunk.binary_offset, chunk.size, chunk.sector_index) for chunk in chunks] == [
+        (RAW_SECTOR_SIZE * 20 + 24 + 5, 2043, 20),
+        (RAW_SECTOR_SIZE * 21 + 24, 5, 21),
+    ]
+    assert mapper.cached_sector_count == 40
+    assert opened == [source]
+
+
+def test_sector_map_sidecar_restores_exact_layout_until_source_changes(tmp_path: Path):
+    source = tmp_path / "mixed.bin"
+    source.write_bytes(
+        _mode1_sector(bytes([0x11]) * 2048)
+        + _mode2_form2_sector(bytes([0x22]) * 2324)
+        + _mode2_form1_sector(bytes([0x33]) * 2048, 2)
+    )
+    target = BinaryWorkbenchInternalFileDTO("FILE", 0)
+    region = define_internal_file_region(source, target, [target], RAW_SECTOR_SIZE)
+    store = SectorMapStore(tmp_path / "sector_map")
+    with InternalOffsetMapper(region, store) as first:
+        chunks = first.sector_chunks()
+
+    restored = InternalOffsetMapper(region, store)
+
+    assert restored.complete
+    assert restored.logical_size == 2048 + 2324 + 2048
+    assert restored.sector_chunks() == chunks
+    assert InternalFileView(region, 2048, 2, sector_maps=store).read(2046, 4) == bytes.fromhex("11 11 22 22")
+    source.write_bytes(source.read_bytes()[:-1] + b"\x01")
+    assert not InternalOffsetMapper(region, store).complete
+
+
 def test_internal_and_binary_overlays_round_trip_across_sector_boundary(tmp_path: Path):
     source = tmp_path / "disc.bin"
     source.write_bytes(
@@ -0,0 +1,112 @@
+from pathlib import Path
+
+from src.core.binary_workbench.internal_file_reader import InternalFileView
+from src.core.binary_workbench.internal_file_region import define_internal_file_region
+from src.core.binary_workbench.iso9660 import read_iso9660_files
+from src.core.binary_workbench.psx_sector_io import rebuild_psx_sector
+from src.core.binary_workbench.psx_sector_layout import RAW_SECTOR_SIZE, SYNC_HEADER
+from src.modules.binary_workbench_dtos import BinaryWorkbenchInternalFileDTO
+
+
+def test_iso9660_reads_exact_files_from_raw_mode2_image(tmp_path: Path):
+    source = tmp_path / "disc.bin"
+    source.write_bytes(b"".join(_mode2_form1_sector(block, index) for index, block in enumerate(_iso_blocks())))
+
+    files = read_iso9660_files(source, RAW_SECTOR_SIZE)
+
+    assert files == [
+        BinaryWorkbenchInternalFileDTO("SYSTEM.CNF", 22, 70),
+        BinaryWorkbenchInternalFileDTO("DATA_MAIN.EXE", 23, 3000),
+        BinaryWorkbenchInternalFileDTO("MAIN.EXE", 25, 10),
+    ]
+
+
+def test_iso9660_reads_cooked_images_and_ignores_other_files(tmp_path: Path):
+    cooked = tmp_path / "disc.iso"
+    cooked.write_bytes(b"".join(_iso_blocks()))
+    other = tmp_path / "other.bin"
+    other.write_bytes(bytes(2048 * 20))
+
+    assert [item.start_lba for item in read_iso9660_files(cooked, 2048)] == [22, 23, 25]
+    assert read_iso9660_files(other, 2048) == []
+
+
+def test_exact_size_ends_region_and_view_at_last_byte(tmp_path: Path):
+    source = tmp_path / "disc.bin"
+    source.write_bytes(b"".join(_mode2_form1_sector(block, index) for index, block in enumerate(_iso_blocks())))
+    files = read_iso9660_files(source, RAW_SECTOR_SIZE)
+
+    region = define_internal_file_region(source, files[1], files, RAW_SECTOR_SIZE)
+    view = InternalFileView(region, block_size=2048, cache_max_blocks=2)
+
+    assert (region.start_lba, region.end_lba, region.approximate_size) == (23, 25, 3000)
+    assert view.mapper.chunks_for_internal_range(0, 4096)[-1].size == 3000 - 2048
+    view.close()
+
+
+def test_joined_directory_names_never_collide_with_existing_names(tmp_path: Path):
+    blocks = _iso_blocks()
+    used = 0
+    while blocks[20][used]:
+        used += blocks[20][used]
+    blocks[20] = (blocks[20][:used] + _record(24, 10, 0, b"DATA_MAIN.EXE;1")).ljust(2048, b"\x00")
+    cooked = tmp_path / "disc.iso"
+    cooked.write_bytes(b"".join(blocks))
+
+    names = [item.name for item in read_iso9660_files(cooked, 2048)]
+
+    assert names == ["SYSTEM.CNF", "DATA_MAIN.EXE", "DATA_MAIN.EXE_2", "MAIN.EXE"]
+
+
+def _iso_blocks() -> list[bytes]:
+    blocks = [bytes(2048) for _ in range(26)]
+    root = _record(20, 2048, 0x02, b"\x00") + _record(20, 2048, 0x02, b"\x01")
+    root += _record(21, 2048, 0x02, b"DATA") + _record(25, 10, 0, b"MAIN.EXE;1") + _record(22, 70, 0, b"SYSTEM.CNF;1")
+    data = _record(21, 2048, 0x02, b"\x00") + _record(20, 2048, 0x02, b"\x01")
+    data += _record(23, 3000, 0, b"MAIN.EXE;1")
+    path_table = _path_entry(20, 1, b"\x00") + _path_entry(21, 1, b"DATA")
+    descriptor = bytearray(2048)
+    descriptor[0:7] = b"\x01CD001\x01"
+    descriptor[128:130] = (2048).to_bytes(2, "little")
+    descriptor[132:136] = len(path_table).to_bytes(4, "little")
+    descriptor[140:144] = (18).to_bytes(4, "little")
+    descriptor[156:190] = _record(20, 2048, 0x02, b"\x00")
+    terminator = bytearray(2048)
+    terminator[0:7] = b"\xffCD001\x01"
+    for lba, content in (
+        (16, descriptor),
+        (17, terminator),
+        (18, path_table),
+        (20, root),
+        (21, data),
+        (23, b"\x5a" * 2048),
+        (24, b"\x5b" * 952),
+    ):
+        blocks[lba] = bytes(content).ljust(2048, b"\x00")
+    return blocks
+
+
+def _record(lba: int, size: int, flags: int, name: bytes) -> bytes:
+    record = bytearray(33 + len(name) + (1 - len(name) % 2))
+    record[0] = len(record)
+    record[2:6] = lba.to_bytes(4, "little")
+    record[6:10] = lba.to_bytes(4, "big")
+    record[10:14] = size.to_bytes(4, "little")
+    record[14:18] = size.to_bytes(4, "big")
+    record[25] = flags
+    record[32] = len(name)
+    record[33:33 + len(name)] = name
+    return bytes(record)
+
+
+def _path_entry(lba: int, parent: int, name: bytes) -> bytes:
+    entry = bytes([len(name), 0]) + lba.to_bytes(4, "little") + parent.to_bytes(2, "little") + name
+    return entry + b"\x00" * (len(name) % 2)
+
+
+def _mode2_form1_sector(data: bytes, sector_index: int) -> bytes:
+    sector = bytearray(RAW_SECTOR_SIZE)
+    sector[:12] = SYNC_HEADER
+    sector[15] = 2
+    sector[24:2072] = data
+    return rebuild_psx_sector(bytes(sector), sector_index)
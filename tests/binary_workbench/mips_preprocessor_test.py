@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from src.core.binary_workbench.mips_r3000a import (
     build_rows_from_instructions,
     extract_labels_from_instructions,
@@ -7,6 +9,9 @@ from src.core.binary_workbench.mips_r3000a import (
     raw_mips_instruction,
     validate_mips_hazards,
 )
+from src.core.binary_workbench.mips_r3000a.assemble_cache import AssembleCache
+from src.core.binary_workbench.mips_r3000a.disassembler import decode_word, disassemble_fallback
+from src.modules.binary_workbench_constants import BINARY_WORKBENCH_MIPS_DISASSEMBLY_WINDOW_BYTES
 
 
 def test_mips_preprocessor_resolves_symbols_and_removes_noise():
@@ -116,3 +121,121 @@ def test_mips_hazard_validator_reports_load_use_and_jump_sequence():
     )
 
     assert [(item.line_index, item.severity) for item in hazards] == [(1, "warning"), (3, "error")]
+
+
+def test_mips_batch_codec_calls_match_single_word_calls():
+    codec = PsxMipsR3000ACodec(AssembleCache())
+    codec._capstone = None
+    codec._keystone = None
+    data = bytes.fromhex("00000000 2110a000 0400a28c 03000010 0000023c 0800e003 ffffffff".replace(" ", ""))
+    lines = ["nop", "addiu $v0, $zero, 1", "beq $zero, $zero, 0x10", "word 0x12345678", "not an opcode"]
+
+    assert codec.disassemble_many(data, 0x100) == [
+        codec.disassemble(data[index:index + 4], 0x100 + index) for index in range(0, len(data), 4)
+    ]
+    assert codec.assemble_many(lines, 0x100) == [
+        codec.assemble(line, 0x100 + index * 4) for index, line in enumerate(lines)
+    ]
+
+
+def test_mips_batch_disassembly_reuses_engine_and_resumes_after_invalid_word():
+    class Engine:
+        created = 0
+
+        def __init__(self, arch, mode):
+            Engine.created += 1
+            self.detail = True
+
+        def disasm_lite(self, data, address):
+            for index in range(0, len(data) - 3, 4):
+                if data[index:index + 4] == b"\xff\xff\xff\xff":
+                    return
+                yield address + index, 4, "op", f"0x{address + index:X}"
+
+    codec = PsxMipsR3000ACodec()
+    codec._capstone = SimpleNamespace(Cs=Engine, CS_ARCH_MIPS=0, CS_MODE_MIPS32=0, CS_MODE_LITTLE_ENDIAN=0)
+    data = bytes.fromhex("2110a000") + b"\xff" * 4 + bytes.fromhex("0400a28c")
+
+    texts = codec.disassemble_many(data, 0x100)
+    codec.disassemble(data[:4], 0x100)
+
+    assert texts[0] == "op 0x100"
+    assert texts[1] == codec.disassemble(b"\xff" * 4, 0x104)
+    assert texts[2] == "op 0x108"
+    assert Engine.created == 1
+
+
+def test_mips_batch_disassembly_restarts_stay_linear_on_data_regions():
+    seen: list[int] = []
+
+    class Engine:
+        def __init__(self, arch, mode):
+            self.detail = True
+
+        def disasm_lite(self, data, address):
+            seen.append(len(data))
+            for index in range(0, len(data) - 3, 4):
+                if data[index:index + 4] == b"\xff\xff\xff\xff":
+                    return
+                yield address + index, 4, "op", ""
+
+    def scanned(size: int) -> tuple[int, int]:
+        seen.clear()
+        codec = PsxMipsR3000ACodec()
+        codec._capstone = SimpleNamespace(Cs=Engine, CS_ARCH_MIPS=0, CS_MODE_MIPS32=0, CS_MODE_LITTLE_ENDIAN=0)
+        texts = codec.disassemble_many((bytes(4) + b"\xff" * 4) * (size // 8), 0)
+        assert texts[0] == "op" and len(texts) == size // 4
+        return len(seen), max(seen)
+
+    small_calls, _ = scanned(64 * 1024)
+    large_calls, largest_slice = scanned(256 * 1024)
+
+    assert large_calls <= 4 * small_calls + 1
+    assert largest_slice <= BINARY_WORKBENCH_MIPS_DISASSEMBLY_WINDOW_BYTES
+
+
+def test_mips_table_decoder_formats_each_instruction_class_and_memoizes_words():
+    decode_word.cache_clear()
+
+    assert disassemble_fallback(0x00000000, 0) == "nop"
+    assert disassemble_fallback(0x03E00008, 0) == "jr $ra"
+    assert disassemble_fallback(0x0000F809, 0) == "jalr $zero, $ra"
+    assert disassemble_fallback(0x27BDFFE8, 0) == "addiu $sp, $sp, -0x18"
+    assert disassemble_fallback(0x8FBF0010, 0) == "lw $ra, 0x10($sp)"
+    assert disassemble_fallback(0x3C028001, 0) == "lui $v0, 0x8001"
+    assert disassemble_fallback(0x0C004000, 0) == "jal 0x10000"
+    assert disassemble_fallback(0x1440FFFE, 0) == "bne $v0, $zero, -0x2"
+    assert disassemble_fallback(0x04410003, 0) == "bgez $v0, 0x0003"
+    assert disassemble_fallback(0x0000003F, 0) == "word 0x0000003F"
+    assert disassemble_fallback(0x03E00008, 0x80010000) == "jr $ra"
+    assert decode_word.cache_info().hits == 1
+
+
+def test_mips_assemble_cache_reuses_text_and_keys_branches_by_address():
+    cache = AssembleCache()
+    codec = PsxMipsR3000ACodec(cache)
+
+    first = codec.assemble("addiu $v0, $zero, 1", 0x100)
+    assert codec.assemble("addiu $v0, $zero, 1 ; again", 0x200) == first
+    assert codec.assemble("not an opcode", 0x100) is None
+    assert codec.assemble("not an opcode", 0x104) is None
+    codec.assemble("j 0x80010000", 0x100)
+    codec.assemble("j 0x80010000", 0x104)
+    assert codec.assemble_many(["addiu $v0, $zero, 1", "j 0x80010000"], 0x100) == [
+        first,
+        codec.assemble("j 0x80010000", 0x104),
+    ]
+
+    stats = codec.assemble_cache_stats()
+    assert (stats.hits, stats.misses) == (5, 4)
+    assert len(cache) == 4
+    assert stats.hit_rate == 5 / 9
+
+
+def test_mips_assemble_cache_keys_engine_only_branches_by_address(monkeypatch):
+    codec = PsxMipsR3000ACodec(AssembleCache())
+    monkeypatch.setattr(codec, "_assemble_line", lambda text, address: address.to_bytes(4, "little"))
+
+    for text in ("b 0x80010000", "bal 0x80010000", "bnez $v0, 0x80010000", "bgezall $a0, 0x80010000"):
+        assert codec.assemble(text, 0x100) != codec.assemble(text, 0x104)
+    assert codec.assemble("jr $ra", 0x100) == codec.assemble("jr $ra", 0x104)
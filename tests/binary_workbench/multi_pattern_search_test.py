@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from src.core.binary_workbench.block_reader import CachedBinaryReader
+from src.core.binary_workbench.multi_pattern_search import BytePatternAutomaton, PatternMatch
+from src.core.binary_workbench.searching import find_reader_patterns, scanner
+from src.core.binary_workbench.text_search import find_patterns_in_rows, search_list_needles
+from src.modules.dtos import BinaryWorkbenchRowDTO
+
+
+def test_automaton_reports_overlapping_matches_with_pattern_ids():
+    automaton = BytePatternAutomaton([b"he", b"she", b"his", b"hers"])
+
+    assert automaton.find(b"ushers", 0x100) == [
+        PatternMatch(0x101, 1),
+        PatternMatch(0x102, 0),
+        PatternMatch(0x102, 3),
+    ]
+    assert automaton.find(b"ushers", 0x100, 0x102) == [PatternMatch(0x102, 0), PatternMatch(0x102, 3)]
+    assert automaton.find(b"ushers", 0x100, None, 0x103) == [PatternMatch(0x101, 1), PatternMatch(0x102, 0)]
+    assert automaton.find(b"ushers", 0x100, None, None, 1) == [PatternMatch(0x101, 1)]
+
+
+def test_search_list_needles_skips_invalid_and_duplicate_entries():
+    assert search_list_needles("de ad; beef, abc, , DEAD\n0c") == [b"\xDE\xAD", b"\xBE\xEF", b"\x0C"]
+
+
+def test_find_patterns_in_rows_spans_contiguous_rows():
+    rows = [
+        BinaryWorkbenchRowDTO({"File": "0x00000000"}, "", "00 11 22 33"),
+        BinaryWorkbenchRowDTO({"File": "0x00000004"}, "", "44 55 66 77"),
+    ]
+    automaton = BytePatternAutomaton([b"\x33\x44", b"\x66"])
+
+    assert find_patterns_in_rows(rows, automaton) == [PatternMatch(3, 0), PatternMatch(6, 1)]
+
+
+def test_find_reader_patterns_matches_across_chunk_boundaries(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(scanner, "BINARY_WORKBENCH_SEARCH_CHUNK_SIZE", 8)
+    data = bytearray(64)
+    data[6:10] = b"\xDE\xAD\xBE\xEF"
+    data[40:42] = b"\xCA\xFE"
+    source = tmp_path / "source.bin"
+    source.write_bytes(bytes(data))
+    reader = CachedBinaryReader(source, block_size=16, cache_max_blocks=4)
+    automaton = BytePatternAutomaton([b"\xDE\xAD\xBE\xEF", b"\xCA\xFE", b"\xBE\xEF"])
+
+    assert find_reader_patterns(reader, {}, automaton, None, None, None) == [
+        PatternMatch(6, 0),
+        PatternMatch(8, 2),
+        PatternMatch(40, 1),
+    ]
+    assert find_reader_patterns(reader, {20: b"\xCA\xFE"}, automaton, 10, None, None) == [
+        PatternMatch(20, 1),
+        PatternMatch(40, 1),
+    ]
+    assert find_reader_patterns(reader, {}, automaton, None, None, 2) == [PatternMatch(6, 0), PatternMatch(8, 2)]
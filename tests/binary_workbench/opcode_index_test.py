@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from src.core.binary_workbench.block_reader import CachedBinaryReader
+from src.core.binary_workbench.mips_r3000a import PsxMipsR3000ACodec
+from src.core.binary_workbench.opcode_index import OpcodeIndexStore, build_opcode_index
+from src.core.binary_workbench.searching import find_reader_instruction
+
+WORDS = (0x8C840010, 0x0C004000, 0x8FA40018, 0x24420001, 0x03E00008, 0x00000000)
+
+
+def _source(tmp_path: Path) -> Path:
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"".join(word.to_bytes(4, "little") for word in WORDS * 8))
+    return source
+
+
+def test_opcode_index_narrows_free_text_queries_to_matching_words(tmp_path: Path):
+    codec = PsxMipsR3000ACodec()
+    source = _source(tmp_path)
+    index = build_opcode_index(source, codec)
+    reader = CachedBinaryReader(source, block_size=16, cache_max_blocks=4)
+
+    for query in ("lw $a0", "a0, 0x1", "($sp)", "jal 0x1", "x0"):
+        expected = find_reader_instruction(reader, codec, {}, query, None, None, None)
+        assert find_reader_instruction(reader, codec, {}, query, None, None, None, None, None, lambda: index) == expected
+    assert index.candidate_offsets("lw $a0", 0, 47) == [0, 8, 24, 32]
+
+
+def test_opcode_index_rechecks_patched_words(tmp_path: Path):
+    codec = PsxMipsR3000ACodec()
+    source = _source(tmp_path)
+    index = build_opcode_index(source, codec)
+    reader = CachedBinaryReader(source, block_size=16, cache_max_blocks=4)
+    overlays = {4: (0x8C840010).to_bytes(4, "little"), 8: b"\x00\x00\x00\x00"}
+
+    results = find_reader_instruction(reader, codec, overlays, "lw $a0", None, 47, None, None, None, lambda: index)
+
+    assert results == [0, 4, 24, 32]
+
+
+def test_opcode_index_store_builds_in_background_and_persists(tmp_path: Path):
+    codec = PsxMipsR3000ACodec()
+    source = _source(tmp_path)
+    store = OpcodeIndexStore(tmp_path / "opcode_index")
+
+    assert store.index_for(source, codec) is None
+    built = store.build(source, codec).result(timeout=30)
+
+    assert store.index_for(source, codec) is built
+    assert len(list(store.directory.glob("*.opidx"))) == 1
+    reloaded = OpcodeIndexStore(store.directory).index_for(source, codec)
+    assert reloaded is not None
+    assert reloaded.candidate_offsets("jr $ra", 0, 47) == built.candidate_offsets("jr $ra", 0, 47) == [16, 40]
@@ -0,0 +1,52 @@
+import struct
+from pathlib import Path
+
+from src.core.binary_workbench.block_reader import CachedBinaryReader
+from src.core.binary_workbench.searching import drain_search
+from src.core.binary_workbench.searching import pointer_scan
+from src.core.binary_workbench.searching.pointer_scan import (
+    PointerHit,
+    find_pointers_in_data,
+    find_pointers_in_rows,
+    iter_reader_pointers,
+    pointer_range,
+    pointer_target,
+)
+from src.modules.binary_workbench_dtos import BinaryWorkbenchRowDTO
+
+
+def test_pointer_scan_keeps_aligned_words_inside_range():
+    data = struct.pack("<6I", 0x80010000, 0x80080001, 0x1234, 0x8007FFFC, 0x80000000, 0x80020000)
+
+    assert find_pointers_in_data(data, 0, 0x80010000, 0x80080000) == [
+        PointerHit(0, 0x80010000),
+        PointerHit(12, 0x8007FFFC),
+        PointerHit(20, 0x80020000),
+    ]
+    assert find_pointers_in_data(data[2:], 2, 0x80010000, 0x80080000, 1) == [PointerHit(12, 0x8007FFFC)]
+
+
+def test_reader_pointer_scan_spans_chunks_applies_overlays_and_maps_targets(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(pointer_scan, "BINARY_WORKBENCH_SEARCH_CHUNK_SIZE", 8)
+    source = tmp_path / "main.exe"
+    source.write_bytes(bytes(6) + struct.pack("<I", 0x80010400) + bytes(22))
+    reader = CachedBinaryReader(source, block_size=16, cache_max_blocks=2)
+    overlays = {24: struct.pack("<I", 0x80010010)}
+    bases = {"RAM": "0x80010000"}
+    batches = list(iter_reader_pointers(reader, overlays, 0x80010000, 0x8001FFFF, bases, None, None, None))
+
+    assert drain_search(batches) == [24]
+    assert [target for batch in batches for target in batch.targets] == [0x10]
+    assert pointer_target(0x80010400, {"RAM": "0x80010000", "VRAM": "0x1F800000"}) == 0x400
+
+
+def test_pointer_range_and_rows_search():
+    rows = [
+        BinaryWorkbenchRowDTO({"File": "0x00000000"}, "", "00 00 01 80"),
+        BinaryWorkbenchRowDTO({"File": "0x00000004"}, "", "FF FF FF FF"),
+    ]
+
+    assert pointer_range("80010000-80080000") == (0x80010000, 0x80080000)
+    assert pointer_range("80010000") == (0x80010000, 0x80010000)
+    assert pointer_range("80080000 80010000") is None
+    assert find_pointers_in_rows(rows, *pointer_range("80000000-80FFFFFF")) == [PointerHit(0, 0x80010000)]
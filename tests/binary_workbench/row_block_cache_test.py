@@ -0,0 +1,48 @@
+import random
+
+from src.core.binary_workbench.byte_overlay_index import ByteOverlayIndex
+from src.core.binary_workbench.mips_r3000a import build_rows_from_bytes
+from src.core.binary_workbench.row_block_cache import RowBlockCache
+
+
+def _reader(data: bytes, reads: list[int]):
+    def read(overlays):
+        def block(start: int, length: int) -> bytes:
+            reads.append(start)
+            return overlays.apply(start, data[start:start + length])
+
+        return block
+
+    return read
+
+
+def test_row_block_cache_matches_direct_rows_across_block_boundaries():
+    data = random.Random(3).randbytes(250)
+    reads: list[int] = []
+    cache = RowBlockCache(block_bytes=64)
+    overlays = ByteOverlayIndex()
+    read = _reader(data, reads)(overlays)
+
+    for offset, size in ((0, 100), (62, 80), (200, 100), (6, 20)):
+        expected = build_rows_from_bytes(data[offset:min(len(data), offset + size)], ["File"], offset, {})
+        assert cache.rows(read, offset, size, len(data), overlays, ["File"], {}) == expected
+
+
+def test_row_block_cache_reuses_blocks_and_invalidates_only_edited_ones():
+    data = bytes(256)
+    reads: list[int] = []
+    cache = RowBlockCache(block_bytes=64)
+    reader = _reader(data, reads)
+    overlays = ByteOverlayIndex()
+
+    cache.rows(reader(overlays), 0, 256, len(data), overlays, ["File"], {})
+    cache.rows(reader(overlays), 32, 128, len(data), overlays, ["File"], {})
+    assert reads == [0, 64, 128, 192]
+
+    edited = ByteOverlayIndex({0x84: b"\x08\x00\xE0\x03"})
+    rows = cache.rows(reader(edited), 0, 256, len(data), edited, ["File"], {})
+    assert reads[4:] == [128]
+    assert rows[0x84 // 4].instruction.startswith("jr")
+
+    cache.rows(reader(edited), 0, 256, len(data), edited, ["File", "RAM"], {"RAM": "0x80010000"})
+    assert reads[5:] == [0, 64, 128, 192]
@@ -0,0 +1,159 @@
+from pathlib import Path
+
+from src.core.binary_workbench.block_reader import CachedBinaryReader
+from src.core.binary_workbench.masked_search import MaskedBytePattern
+from src.core.binary_workbench.mips_r3000a import PsxMipsR3000ACodec
+from src.core.binary_workbench.searching import (
+    CancellationToken,
+    find_reader_bytes,
+    find_reader_hex,
+    find_reader_instruction,
+    find_reader_masked,
+    iter_reader_bytes,
+    drain_search,
+    matchers,
+    parallel,
+    reader_search_batches,
+    scanner,
+)
+from src.modules.binary_workbench_constants import (
+    BINARY_WORKBENCH_LIMITED_DISASSEMBLY_SEARCH_SLICE_BYTES,
+    BINARY_WORKBENCH_SEARCH_MODE_DECODED_TEXT,
+    BINARY_WORKBENCH_SEARCH_MODE_HEX_BYTES,
+    BINARY_WORKBENCH_SEARCH_MODE_SEARCH_LIST,
+)
+
+
+def _reader(tmp_path: Path, data: bytes) -> CachedBinaryReader:
+    source = tmp_path / "source.bin"
+    source.write_bytes(data)
+    return CachedBinaryReader(source, block_size=16, cache_max_blocks=4)
+
+
+def test_streaming_search_finds_matches_across_chunk_boundaries(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(scanner, "BINARY_WORKBENCH_SEARCH_CHUNK_SIZE", 8)
+    data = bytearray(64)
+    data[6:10] = b"\xDE\xAD\xBE\xEF"
+    data[30:34] = b"\xDE\xAD\xBE\xEF"
+    reader = _reader(tmp_path, bytes(data))
+    chunks: list[list[int]] = []
+
+    results = find_reader_bytes(reader, {}, b"\xDE\xAD\xBE\xEF", None, None, None, chunks.append)
+
+    assert results == [6, 30]
+    assert len(chunks) == 8
+    assert [offset for chunk in chunks for offset in chunk] == [6, 30]
+    assert find_reader_hex(reader, {}, "adbeef", None, None, None) == [7, 31]
+    assert find_reader_hex(reader, {}, "eadb", None, None, None) == [6, 30]
+
+
+def test_streaming_search_applies_overlays_and_limits(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(scanner, "BINARY_WORKBENCH_SEARCH_CHUNK_SIZE", 8)
+    reader = _reader(tmp_path, bytes(64))
+    overlays = {12: b"\x10\x00\x00\x0C", 44: b"\x20\x00\x00\x0C"}
+    pattern = MaskedBytePattern(b"\x00\x00\x00\x0C", b"\x00\x00\x00\xFC", 4)
+
+    assert find_reader_masked(reader, overlays, pattern, None, None, None) == [12, 44]
+    assert find_reader_masked(reader, overlays, pattern, None, None, 1) == [12]
+    assert find_reader_masked(reader, overlays, pattern, 13, None, None) == [44]
+
+
+def test_streaming_search_stops_when_cancelled(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(scanner, "BINARY_WORKBENCH_SEARCH_CHUNK_SIZE", 8)
+    reader = _reader(tmp_path, b"\xAA" * 64)
+    chunks: list[list[int]] = []
+
+    results = find_reader_bytes(reader, {}, b"\xAA", None, None, None, chunks.append, lambda: len(chunks) >= 2)
+
+    assert results == list(range(16))
+    assert len(chunks) == 2
+
+
+def test_search_batches_report_progress_and_trim_to_limit(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(scanner, "BINARY_WORKBENCH_SEARCH_CHUNK_SIZE", 8)
+    reader = _reader(tmp_path, b"\xAA" * 32)
+
+    batches = list(iter_reader_bytes(reader, {}, b"\xAA", None, None, None))
+    limited = list(iter_reader_bytes(reader, {}, b"\xAA", 4, None, 6))
+
+    assert [(batch.scanned, batch.total) for batch in batches] == [(8, 32), (16, 32), (24, 32), (32, 32)]
+    assert [offset for batch in batches for offset in batch.offsets] == list(range(32))
+    assert [batch.offsets for batch in limited] == [tuple(range(4, 10))]
+
+
+def test_cancellation_token_stops_search_batches(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(scanner, "BINARY_WORKBENCH_SEARCH_CHUNK_SIZE", 8)
+    reader = _reader(tmp_path, b"\xAA" * 64)
+    token = CancellationToken()
+    seen = []
+
+    for batch in iter_reader_bytes(reader, {}, b"\xAA", None, None, None, token):
+        seen.append(batch)
+        token.cancel()
+
+    assert token.cancelled
+    assert len(seen) == 1
+    assert seen[0].offsets == tuple(range(8))
+
+
+def test_parallel_search_matches_serial_results_in_order(tmp_path: Path, monkeypatch):
+    data = bytearray(4096)
+    for offset in (10, 1022, 2047, 4090):
+        data[offset : offset + 3] = b"\xCA\xFE\x01"
+    reader = _reader(tmp_path, bytes(data))
+    overlays = {3000: b"\xCA\xFE\x01"}
+    serial = find_reader_bytes(reader, overlays, b"\xCA\xFE\x01", None, None, None)
+    monkeypatch.setattr(parallel, "BINARY_WORKBENCH_SEARCH_CHUNK_SIZE", 512)
+    monkeypatch.setattr(parallel, "BINARY_WORKBENCH_PARALLEL_SEARCH_MIN_BYTES", 1)
+    monkeypatch.setattr(parallel, "SEARCH_WORKERS", 2)
+    chunks: list[list[int]] = []
+
+    results = find_reader_bytes(reader, overlays, b"\xCA\xFE\x01", None, None, None, chunks.append)
+
+    assert results == serial == [10, 1022, 2047, 3000, 4090]
+    assert len(chunks) == 8
+    assert find_reader_bytes(reader, overlays, b"\xCA\xFE\x01", None, None, 2) == [10, 1022]
+
+
+def test_parallel_disassembly_search_rebuilds_codec_in_workers(tmp_path: Path, monkeypatch):
+    codec = PsxMipsR3000ACodec()
+    data = bytearray(2048)
+    data[1024:1028] = codec.assemble("addiu v0, v0, 1", 0)
+    reader = _reader(tmp_path, bytes(data))
+    monkeypatch.setattr(parallel, "BINARY_WORKBENCH_SEARCH_CHUNK_SIZE", 256)
+    monkeypatch.setattr(parallel, "BINARY_WORKBENCH_PARALLEL_DISASSEMBLY_MIN_BYTES", 1)
+    monkeypatch.setattr(parallel, "SEARCH_WORKERS", 2)
+
+    assert find_reader_instruction(reader, codec, {}, "$v0, $v0, 0x1", None, None, None) == [1024]
+
+
+def test_reader_search_batches_dispatches_find_modes(tmp_path: Path):
+    reader = _reader(tmp_path, b"\x00ABC\x00ABD\x00")
+
+    def search(mode: str, query: str) -> list[int]:
+        return drain_search(reader_search_batches(reader, None, {}, mode, query))
+
+    assert search(BINARY_WORKBENCH_SEARCH_MODE_HEX_BYTES, "41 42") == [1, 5]
+    assert search(BINARY_WORKBENCH_SEARCH_MODE_DECODED_TEXT, " ABD ") == [5]
+    assert search(BINARY_WORKBENCH_SEARCH_MODE_SEARCH_LIST, "414243\n4142") == [1, 5]
+    assert search("unknown", "ABC") == []
+
+
+def test_limited_disassembly_search_stops_after_the_first_slice():
+    class CountingCodec:
+        word_size = 4
+
+        def __init__(self) -> None:
+            self.disassembled = 0
+
+        def disassemble_many(self, data: bytes, base: int) -> list[str]:
+            self.disassembled += len(data)
+            return ["nop"] * (len(data) // 4)
+
+    codec = CountingCodec()
+    find = matchers.chunk_finder(matchers.DISASSEMBLY_MATCH, "NOP", codec)
+    data = bytes(2 * 1024 * 1024)
+
+    assert find(data, 0x100, 1) == [0x100]
+    assert codec.disassembled <= BINARY_WORKBENCH_LIMITED_DISASSEMBLY_SEARCH_SLICE_BYTES
+    assert len(find(data, 0, None)) == len(data) // 4
@@ -0,0 +1,56 @@
+import random
+
+from src.core.binary_workbench.psx_sector_codes import edc, edc_columns
+from src.core.binary_workbench.psx_sector_io import rebuild_psx_sector, rebuild_psx_sectors
+from src.core.binary_workbench.psx_sector_layout import RAW_SECTOR_SIZE, SYNC_HEADER
+from src.modules.binary_workbench_constants import BINARY_WORKBENCH_SECTOR_COLUMN_MIN_SECTORS
+
+
+def test_edc_matches_bytewise_crc_for_every_tail_length():
+    data = random.Random(1).randbytes(2336)
+
+    for size in (0, 1, 7, 8, 9, 2056, 2064, 2332):
+        assert edc(data[:size]) == _bytewise_edc(data[:size])
+
+
+def test_edc_columns_match_per_sector_edc():
+    sectors = bytearray(random.Random(2).randbytes(RAW_SECTOR_SIZE * 5))
+
+    assert edc_columns(sectors, 16, 2056) == [
+        edc(sectors[index * RAW_SECTOR_SIZE + 16:index * RAW_SECTOR_SIZE + 2072]) for index in range(5)
+    ]
+
+
+def test_batch_rebuild_matches_per_sector_rebuild_for_mixed_modes():
+    generator = random.Random(3)
+    kinds = ["form1"] * BINARY_WORKBENCH_SECTOR_COLUMN_MIN_SECTORS + ["mode1", "form2", "raw", "form1", "form2"]
+    data = b"".join(_sector(generator, kind) for kind in kinds) + b"tail"
+
+    rebuilt = rebuild_psx_sectors(data, 150)
+
+    assert rebuilt == b"".join(
+        rebuild_psx_sector(data[offset:offset + RAW_SECTOR_SIZE], 150 + offset // RAW_SECTOR_SIZE)
+        for offset in range(0, len(data) - 4, RAW_SECTOR_SIZE)
+    ) + b"tail"
+    raw = (len(kinds) - 3) * RAW_SECTOR_SIZE
+    assert rebuilt[raw:raw + RAW_SECTOR_SIZE] == data[raw:raw + RAW_SECTOR_SIZE]
+    assert rebuild_psx_sectors(rebuilt, 150) == rebuilt
+
+
+def _sector(generator: random.Random, kind: str) -> bytes:
+    sector = bytearray(generator.randbytes(RAW_SECTOR_SIZE))
+    if kind == "raw":
+        return bytes(sector)
+    sector[:12] = SYNC_HEADER
+    sector[15] = 1 if kind == "mode1" else 2
+    sector[18] = sector[22] = 0x20 if kind == "form2" else 0
+    return bytes(sector)
+
+
+def _bytewise_edc(data: bytes) -> int:
+    value = 0
+    for byte in data:
+        value ^= byte
+        for _ in range(8):
+            value = (value >> 1) ^ (0xD8018001 if value & 1 else 0)
+    return value
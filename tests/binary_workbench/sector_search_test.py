@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from src.core.binary_workbench.internal_file_reader import InternalFileView
+from src.core.binary_workbench.internal_file_region import define_internal_file_region
+from src.core.binary_workbench.psx_sector_io import rebuild_psx_sector
+from src.core.binary_workbench.psx_sector_layout import RAW_SECTOR_SIZE, SYNC_HEADER
+from src.core.binary_workbench.searching import (
+    find_reader_bytes,
+    find_reader_hex,
+    scanner,
+    search_internal_files,
+)
+from src.modules.binary_workbench_dtos import BinaryWorkbenchInternalFileDTO
+
+
+def test_internal_search_skips_sector_framing_and_finds_straddling_matches(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(scanner, "BINARY_WORKBENCH_SEARCH_CHUNK_SIZE", 1000)
+    payloads = [bytearray(2048) for _ in range(3)]
+    payloads[0][2046:2048] = b"\xCA\xFE"
+    payloads[1][0:2] = b"\xBA\xBE"
+    payloads[2][100:104] = b"\xCA\xFE\xBA\xBE"
+    source = tmp_path / "disc.bin"
+    source.write_bytes(b"".join(_mode2_form1_sector(bytes(data), index) for index, data in enumerate(payloads)))
+    target = BinaryWorkbenchInternalFileDTO("FILE", 0)
+    view = InternalFileView(define_internal_file_region(source, target, [target], RAW_SECTOR_SIZE), 2048, 4)
+
+    assert find_reader_bytes(view, {}, b"\xCA\xFE\xBA\xBE", None, None, None) == [2046, 4196]
+    assert find_reader_bytes(view, {10: b"\xCA\xFE\xBA\xBE"}, b"\xCA\xFE\xBA\xBE", 5, 4100, None) == [10, 2046]
+    assert find_reader_hex(view, {}, "ffffffffff", None, None, None) == []
+
+
+def test_search_internal_files_maps_hits_per_file_in_one_pass(tmp_path: Path):
+    payloads = [bytes([index]) * 2048 for index in range(4)]
+    source = tmp_path / "disc.bin"
+    source.write_bytes(b"".join(_mode2_form1_sector(data, index) for index, data in enumerate(payloads)))
+    files = [BinaryWorkbenchInternalFileDTO("A", 0), BinaryWorkbenchInternalFileDTO("B", 2)]
+    regions = [define_internal_file_region(source, item, files, RAW_SECTOR_SIZE) for item in files]
+
+    found = search_internal_files(
+        source,
+        list(reversed(regions)),
+        lambda reader: find_reader_bytes(reader, {}, b"\x01\x01", None, None, 2) + find_reader_bytes(reader, {}, b"\x02\x02", None, None, 1),
+    )
+
+    assert found == {regions[0]: [2048, 2049], regions[1]: [0]}
+
+
+def _mode2_form1_sector(data: bytes, sector_index: int) -> bytes:
+    sector = bytearray(RAW_SECTOR_SIZE)
+    sector[:12] = SYNC_HEADER
+    sector[15] = 2
+    sector[24:2072] = data
+    return rebuild_psx_sector(bytes(sector), sector_index)
@@ -0,0 +1,63 @@
+import random
+from pathlib import Path
+
+from src.core.binary_workbench.psx_sector_io import rebuild_psx_sectors
+from src.core.binary_workbench.psx_sector_layout import RAW_SECTOR_SIZE, SYNC_HEADER
+from src.core.binary_workbench import sector_verify
+from src.core.binary_workbench.searching import CancellationToken
+from src.core.binary_workbench.sector_verify import SectorFault, verify_sector_image
+from src.modules.binary_workbench_dtos import BinaryWorkbenchInternalFileDTO
+
+
+def test_verify_reports_bad_sectors_with_internal_file_names(tmp_path: Path):
+    generator = random.Random(4)
+    modes = [(2, 0)] * 6 + [(2, 0x20)] * 3 + [(1, 0)] * 3
+    image = bytearray(rebuild_psx_sectors(b"".join(_sector(generator, *mode) for mode in modes), 0))
+    image[2 * RAW_SECTOR_SIZE + 500] ^= 0xFF
+    image[7 * RAW_SECTOR_SIZE + 2348:8 * RAW_SECTOR_SIZE] = bytes(4)
+    image[8 * RAW_SECTOR_SIZE + 100] ^= 0x01
+    image[10 * RAW_SECTOR_SIZE + 2300] ^= 0x10
+    source = tmp_path / "disc.bin"
+    source.write_bytes(bytes(image))
+    files = [BinaryWorkbenchInternalFileDTO("MAIN", 1, 4096), BinaryWorkbenchInternalFileDTO("XA", 6)]
+
+    batches = list(verify_sector_image(source, files))
+
+    assert [fault for batch in batches for fault in batch.faults] == [
+        SectorFault(2, 2, 1, False, False, "MAIN"),
+        SectorFault(8, 2, 2, False, True, "XA"),
+        SectorFault(10, 1, 1, True, False, "XA"),
+    ]
+    assert (batches[-1].scanned, batches[-1].total) == (len(modes), len(modes))
+
+
+def test_verify_accepts_freshly_rebuilt_image(tmp_path: Path):
+    generator = random.Random(5)
+    source = tmp_path / "disc.bin"
+    source.write_bytes(rebuild_psx_sectors(b"".join(_sector(generator, 2, 0) for _ in range(70)), 0))
+
+    assert [fault for batch in verify_sector_image(source) for fault in batch.faults] == []
+
+
+def test_verify_stops_after_cancel(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(sector_verify, "BINARY_WORKBENCH_SECTOR_BATCH_SECTORS", 8)
+    monkeypatch.setattr(sector_verify, "sector_pool", lambda: None)
+    generator = random.Random(6)
+    source = tmp_path / "disc.bin"
+    source.write_bytes(rebuild_psx_sectors(b"".join(_sector(generator, 2, 0) for _ in range(32)), 0))
+    token = CancellationToken()
+    scanned = []
+
+    for batch in verify_sector_image(source, cancelled=token):
+        scanned.append(batch.scanned)
+        token.cancel()
+
+    assert scanned == [8]
+
+
+def _sector(generator: random.Random, mode: int, submode: int) -> bytes:
+    sector = bytearray(generator.randbytes(RAW_SECTOR_SIZE))
+    sector[:12] = SYNC_HEADER
+    sector[15] = mode
+    sector[18] = sector[22] = submode
+    return bytes(sector)
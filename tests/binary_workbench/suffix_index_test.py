@@ -0,0 +1,60 @@
+from pathlib import Path
+
+from src.core.binary_workbench.block_reader import CachedBinaryReader
+from src.core.binary_workbench.masked_search import MaskedBytePattern
+from src.core.binary_workbench.searching import find_reader_bytes, find_reader_hex, suffix_index
+from src.core.binary_workbench.searching.suffix_index import SuffixIndexStore, build_suffix_index
+
+
+def _source(tmp_path: Path) -> Path:
+    data = bytearray(bytes(range(256)) * 4)
+    data[100:104] = b"\xDE\xAD\xBE\xEF"
+    data[700:704] = b"\xDE\xAD\xBE\xEF"
+    source = tmp_path / "source.bin"
+    source.write_bytes(bytes(data))
+    return source
+
+
+def test_suffix_index_answers_byte_and_hex_queries_like_the_scan(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(suffix_index, "SEARCH_WORKERS", 1)
+    source = _source(tmp_path)
+    index = build_suffix_index(source, tmp_path / "source.sufidx", run_size=300, key_bytes=3)
+    reader = CachedBinaryReader(source, block_size=64, cache_max_blocks=4)
+
+    assert index is not None
+    assert index.size_bytes > 1024 * 4
+    assert index.find(MaskedBytePattern(b"\xDE\xAD\xBE\xEF", b"\xFF" * 4), 0, 1023) == [100, 700]
+    for query in ("deadbeef", "eadbe", "0102", "f", "10111"):
+        expected = find_reader_hex(reader, {}, query, None, None, None)
+        assert find_reader_hex(reader, {}, query, None, None, None, None, None, lambda: index) == expected
+    assert find_reader_bytes(reader, {}, b"\xDE\xAD", 200, None, None, None, None, lambda: index) == [700]
+
+
+def test_suffix_index_rechecks_overlay_regions(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(suffix_index, "SEARCH_WORKERS", 1)
+    source = _source(tmp_path)
+    index = build_suffix_index(source, tmp_path / "source.sufidx", run_size=300, key_bytes=3)
+    reader = CachedBinaryReader(source, block_size=64, cache_max_blocks=4)
+    overlays = {102: b"\x00", 400: b"\xDE\xAD\xBE\xEF"}
+
+    results = find_reader_bytes(reader, overlays, b"\xDE\xAD\xBE\xEF", None, None, None, None, None, lambda: index)
+
+    assert results == [400, 700]
+
+
+def test_suffix_index_store_reports_progress_and_reloads(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(suffix_index, "SEARCH_WORKERS", 1)
+    source = _source(tmp_path)
+    store = SuffixIndexStore(tmp_path / "suffix_index")
+
+    assert store.index_for(source) is None
+    assert store.progress(source) is None
+    built = store.build(source).result(timeout=30)
+
+    assert built is not None
+    assert store.progress(source) is None
+    reloaded = SuffixIndexStore(store.directory).index_for(source)
+    assert reloaded is not None
+    assert reloaded.find(MaskedBytePattern(b"\xBE\xEF", b"\xFF\xFF"), 0, 1023) == [102, 702]
+    source.write_bytes(b"\x00" * 16)
+    assert SuffixIndexStore(store.directory).index_for(source) is None
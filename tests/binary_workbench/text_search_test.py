@@ -1,6 +1,13 @@
+import tracemalloc
 from pathlib import Path
 
-from src.core.binary_workbench.masked_search import find_masked_bytes_in_data
+from src.core.binary_workbench.masked_search import (
+    MaskedBytePattern,
+    compile_masked_pattern,
+    find_masked_bytes_in_data,
+    find_masked_bytes_in_data_heap,
+    find_masked_bytes_in_data_regex,
+)
 from src.core.binary_workbench.mips_r3000a.instruction_patterns import (
     mips_instruction_byte_pattern,
 )
@@ -9,7 +16,7 @@ from src.core.binary_workbench.search_cache import (
     SearchCacheRepository,
     SearchCacheService,
 )
-from src.core.binary_workbench.text_search import ansi_text_bytes, find_bytes_in_rows
+from src.core.binary_workbench.text_search import ansi_text_bytes, find_bytes_in_rows, find_hex_nibbles_in_data
 from src.modules.dtos import BinaryWorkbenchRowDTO
 
 
@@ -107,3 +114,41 @@ def test_search_cache_keeps_at_most_one_hundred_searches_without_duplicate_offse
 
     assert len(entries) == 100
     assert all(entry.offsets == sorted(set(entry.offsets)) for entry in entries)
+
+
+def test_masked_search_regex_engine_matches_heap_engine():
+    pattern = mips_instruction_byte_pattern("ADDIU")
+    nibble = MaskedBytePattern(b"\x20\x00", b"\xF0\xFF")
+    data = bytes.fromhex("27 00 00 24 F0 FF BD 27 00 24 00 24 2A 00 21 00")
+
+    assert pattern is not None
+    assert find_masked_bytes_in_data_regex(data, 0x100, pattern) == [0x100, 0x104, 0x108]
+    assert find_masked_bytes_in_data_regex(data, 0x100, pattern) == find_masked_bytes_in_data_heap(data, 0x100, pattern)
+    assert find_masked_bytes_in_data_regex(data, 1, pattern) == find_masked_bytes_in_data_heap(data, 1, pattern) == []
+    assert find_masked_bytes_in_data_regex(data, 0, nibble, 1, 14) == [7, 9, 12]
+    assert compile_masked_pattern(pattern) is compile_masked_pattern(pattern)
+
+
+def test_masked_search_memory_stays_flat_on_zero_filled_data():
+    pattern = MaskedBytePattern(b"\x00\x00\x00\x0C", b"\x00\x00\x00\xFC", 4)
+    data = bytes(2 * 1024 * 1024)
+
+    tracemalloc.start()
+    try:
+        assert find_masked_bytes_in_data(data, 0, pattern) == []
+        assert find_masked_bytes_in_data_regex(data, 0, pattern) == []
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 1024 * 1024
+
+
+def test_find_hex_nibbles_in_data_matches_both_nibble_phases():
+    data = bytes.fromhex("12 34 51 23 45 00 12 34")
+
+    assert find_hex_nibbles_in_data(data, 0x10, "1234") == [0x10, 0x12, 0x16]
+    assert find_hex_nibbles_in_data(data, 0x10, "2345") == [0x10, 0x13]
+    assert find_hex_nibbles_in_data(data, 0x10, "345") == [0x11, 0x13]
+    assert find_hex_nibbles_in_data(data, 0x10, "1 2", 0x11, None, 2) == [0x12, 0x16]
+    assert find_hex_nibbles_in_data(data, 0x10, "5", 0x10, 0x14) == [0x12, 0x14]
@@ -0,0 +1,81 @@
+from pathlib import Path
+from threading import Event
+
+from src.core.binary_workbench.block_reader import CachedBinaryReader
+from src.core.binary_workbench.searching import CancellationToken, find_reader_bytes
+from src.core.binary_workbench.searching.workspace_search import WorkspaceSearchTarget, search_workspace
+
+
+def test_workspace_search_groups_results_per_target_in_order(tmp_path: Path):
+    paths = []
+    for name, data in (("MAIN.EXE", b"\x00\xCA\xFE\x00\xCA\xFE"), ("OVL.BIN", b"\xCA\xFE"), ("EMPTY.BIN", b"\x00")):
+        path = tmp_path / name
+        path.write_bytes(data)
+        paths.append(path)
+
+    def job(path: Path):
+        reader = CachedBinaryReader(path, block_size=16, cache_max_blocks=2)
+        return lambda cancelled: find_reader_bytes(reader, {}, b"\xCA\xFE", None, None, None, None, cancelled)
+
+    targets = [WorkspaceSearchTarget(str(path), path.name, job(path)) for path in paths]
+    targets.append(WorkspaceSearchTarget("missing", "missing", lambda cancelled: (tmp_path / "nope").read_bytes()))
+
+    results = list(search_workspace(targets, max_workers=2))
+
+    assert [(result.label, result.offsets) for result in results] == [
+        ("MAIN.EXE", (1, 4)),
+        ("OVL.BIN", (0,)),
+        ("EMPTY.BIN", ()),
+        ("missing", ()),
+    ]
+
+
+def test_workspace_search_stops_yielding_after_cancel():
+    token = CancellationToken()
+    targets = [WorkspaceSearchTarget(str(index), str(index), lambda cancelled, index=index: [index]) for index in range(4)]
+    seen = []
+
+    for result in search_workspace(targets, token):
+        seen.append(result.key)
+        token.cancel()
+
+    assert seen == ["0"]
+
+
+def test_workspace_search_reports_failing_targets_and_keeps_going():
+    def broken(cancelled):
+        raise ValueError("bad query")
+
+    targets = [
+        WorkspaceSearchTarget("broken", "broken", broken),
+        WorkspaceSearchTarget("ok", "ok", lambda cancelled: [7]),
+    ]
+
+    results = list(search_workspace(targets))
+
+    assert [(result.key, result.offsets, result.error) for result in results] == [
+        ("broken", (), "bad query"),
+        ("ok", (7,), ""),
+    ]
+
+
+def test_workspace_search_polls_idle_and_cancels_while_a_job_is_running():
+    token = CancellationToken()
+    release = Event()
+    idle_calls = []
+
+    def slow(cancelled):
+        release.wait(5)
+        return [1]
+
+    def idle():
+        idle_calls.append(True)
+        token.cancel()
+
+    try:
+        results = list(search_workspace([WorkspaceSearchTarget("slow", "slow", slow)], token, idle=idle))
+    finally:
+        release.set()
+
+    assert results == []
+    assert idle_calls == [True]
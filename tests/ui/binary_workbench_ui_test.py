@@ -1829,6 +1829,25 @@ def test_binary_workbench_find_offsets_are_cached_in_context(tmp_path: Path):
     assert (tmp_path / "data" / "binary_workbench" / "search_cache.json").exists()
 
 
+def test_binary_workbench_find_all_tabs_searches_unloaded_tabs_on_disk(tmp_path: Path):
+    from src.presentation.ui.components.binary_workbench.tabs.workspace_memory import unload_workspace_heavy_context
+
+    binary_path = tmp_path / "main.bin"
+    binary_path.write_bytes(b"\x00\xCA\xFE\x00\xCA\xFE")
+    window = _window(tmp_path)
+    window._open_binary_workbench()
+    tool = window._binary_workbench_window
+
+    assert tool is not None
+    tool.open_file_path(binary_path)
+    page = tool.tabs.currentWidget()
+    page.release_heavy_resources(unload_workspace_heavy_context(tool.tabs.current_context()))
+    results = list(tool.tabs.search_all_tabs("Hex bytes", "CAFE"))
+
+    assert page.search_unloaded()
+    assert [(result.offsets, result.error) for result in results] == [((1, 4), "")]
+
+
 def test_binary_workbench_find_dialog_limits_length_and_prefills_start():
     _app()
     captured: list[tuple[int | None, int | None, int | None]] = []
@@ -2321,6 +2340,8 @@ def test_binary_workbench_advanced_configuration_uses_confirm_and_block_size_opt
         "Read Mode",
         "Block Size",
         "Cache Max Blocks",
+        "Cache Policy",
+        "Reader",
         "Selection Limit",
     ]
     assert [combos[2].itemText(index) for index in range(combos[2].count())] == [
@@ -2337,7 +2358,12 @@ def test_binary_workbench_advanced_configuration_uses_confirm_and_block_size_opt
         "8000",
         "16000",
     ]
-    assert [combos[4].itemText(index) for index in range(combos[4].count())] == [
+    assert [combos[4].itemText(index) for index in range(combos[4].count())] == ["LRU", "2Q"]
+    assert [combos[5].itemText(index) for index in range(combos[5].count())] == [
+        "Block Cache",
+        "Memory Mapped",
+    ]
+    assert [combos[6].itemText(index) for index in range(combos[6].count())] == [
         "1MB",
         "2MB",
         "4MB",
@@ -2355,6 +2381,8 @@ def test_binary_workbench_advanced_configuration_uses_confirm_and_block_size_opt
     assert dialog.selected_block_size() == 2048
     assert dialog.selected_cache_max_blocks() == 8000
     assert dialog.selected_selection_limit_bytes() == 2 * 1024 * 1024
+    assert dialog.selected_memory_mapped_reads() is False
+    assert dialog.selected_cache_policy() == "2Q"
     assert "Confirm" in buttons
     assert "OK" not in buttons
     assert {combo.width() for combo in combos} == {200}